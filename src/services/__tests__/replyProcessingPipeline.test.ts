@@ -347,4 +347,31 @@ describe('Reply Processing Pipeline', () => {
       expect(updatedProspect!.frontmatter.stage).toBe('qualified');
     });
   });
+
+  describe('Processed reply tracking', () => {
+    it('sees IDs marked by the service and IDs logged by process_campaign_replies.py', async () => {
+      await replyProcessingService.markReplyProcessed(testTenantId, 'marked-by-service');
+
+      // process_campaign_replies.py appends one JSON string per line; a torn
+      // final line must not break the lookup
+      await fs.promises.writeFile(
+        path.join(stateFolder, 'processed_replies.jsonl'),
+        '"logged-1"\n"logged-2"\n"torn',
+        'utf-8'
+      );
+
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'marked-by-service')).toBe(true);
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'logged-1')).toBe(true);
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'logged-2')).toBe(true);
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'torn')).toBe(false);
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'never-seen')).toBe(false);
+    });
+
+    it('reads the log when the service has not written its own file yet', async () => {
+      await fs.promises.writeFile(path.join(stateFolder, 'processed_replies.jsonl'), '"logged-only"\n', 'utf-8');
+
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'logged-only')).toBe(true);
+      expect(await replyProcessingService.isReplyProcessed(testTenantId, 'other')).toBe(false);
+    });
+  });
 });
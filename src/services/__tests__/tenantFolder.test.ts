@@ -1,7 +1,20 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
+import { spawnSync } from 'child_process';
 import { TenantFolderService } from '../tenantFolder.js';
+import { ApprovalQueueService, QueuedAction } from '../approvalQueueService.js';
+
+// syncActivityLog reads recent messages through prisma
+const mockPrisma = {
+  messages: {
+    findMany: jest.fn().mockResolvedValue([]),
+  },
+};
+
+jest.mock('../prisma.js', () => ({
+  getPrismaClient: () => mockPrisma,
+}));
 
 // Get project root (where tenants/ folder should be)
 const PROJECT_ROOT = path.resolve(__dirname, '..', '..', '..');
@@ -254,3 +267,167 @@ describe('TenantFolderService', () => {
     });
   });
 });
+
+// queue_action.py appends to state/pending_approvals.ndjson; readers merge it
+// with the pending_approvals.json snapshot and saves fold it back in
+describe('Pending approvals append log', () => {
+  let tempDir: string;
+  let stateDir: string;
+  const mockTenantId = 'test-tenant-123';
+
+  function makeAction(id: string, targetName: string): QueuedAction {
+    const now = new Date();
+    return {
+      id,
+      campaign_id: 'campaign-1',
+      campaign_name: 'Campaign 1',
+      target_id: `target-${id}`,
+      target_name: targetName,
+      action_type: 'send_email',
+      channel: 'email',
+      subject: 'Hello',
+      body: 'Body',
+      reasoning: 'Reason',
+      queued_at: now.toISOString(),
+      expires_at: new Date(now.getTime() + 24 * 60 * 60 * 1000).toISOString(),
+      status: 'pending',
+    };
+  }
+
+  function appendToLog(...actions: QueuedAction[]): void {
+    fs.appendFileSync(
+      path.join(stateDir, 'pending_approvals.ndjson'),
+      actions.map((a) => JSON.stringify(a) + '\n').join('')
+    );
+  }
+
+  function writeSnapshot(pending: QueuedAction[], history: Array<{ id: string }> = []): void {
+    fs.writeFileSync(
+      path.join(stateDir, 'pending_approvals.json'),
+      JSON.stringify({ version: 1, lastUpdated: new Date().toISOString(), pending, history })
+    );
+  }
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'approvals-test-'));
+    stateDir = path.join(tempDir, 'tenants', mockTenantId, 'state');
+    fs.mkdirSync(stateDir, { recursive: true });
+  });
+
+  afterEach(() => {
+    if (tempDir && fs.existsSync(tempDir)) {
+      fs.rmSync(tempDir, { recursive: true, force: true });
+    }
+  });
+
+  describe('TenantFolderService', () => {
+    it('counts appended actions when there is no snapshot yet', async () => {
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'));
+      const service = new TenantFolderService(tempDir);
+
+      const context = await service.getCampaignStatusContext(mockTenantId);
+
+      expect(context).toContain('Pending approvals: 2 (Alice, Bob)');
+    });
+
+    it('skips appended actions the snapshot already has', async () => {
+      writeSnapshot([makeAction('a1', 'Alice')], [{ id: 'a2' }]);
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'), makeAction('a3', 'Cara'));
+      const service = new TenantFolderService(tempDir);
+
+      const context = await service.getCampaignStatusContext(mockTenantId);
+
+      expect(context).toContain('Pending approvals: 2 (Alice, Cara)');
+    });
+
+    it('syncActivityLog reports appended actions without a snapshot', async () => {
+      appendToLog(makeAction('a1', 'Alice'));
+      const service = new TenantFolderService(tempDir);
+
+      await service.syncActivityLog(mockTenantId);
+
+      const log = JSON.parse(fs.readFileSync(path.join(stateDir, 'activity_log.json'), 'utf-8'));
+      expect(log.activities).toContainEqual(
+        expect.objectContaining({ type: 'approval', target: '1 action(s)', action: 'pending' })
+      );
+    });
+  });
+
+  describe('ApprovalQueueService', () => {
+    it('merges appended actions into the pending list', async () => {
+      writeSnapshot([makeAction('a1', 'Alice')]);
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'));
+      const service = new ApprovalQueueService(tempDir);
+
+      const pending = await service.listPendingActions(mockTenantId);
+
+      expect(pending.map((a) => a.id)).toEqual(['a1', 'a2']);
+    });
+
+    it('folds the log into the snapshot on save', async () => {
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'));
+      const service = new ApprovalQueueService(tempDir);
+
+      await service.approveActions(mockTenantId, ['a1']);
+
+      const snapshot = JSON.parse(fs.readFileSync(path.join(stateDir, 'pending_approvals.json'), 'utf-8'));
+      expect(snapshot.pending.map((a: QueuedAction) => a.id)).toEqual(['a1', 'a2']);
+      expect(snapshot.history.map((h: { id: string }) => h.id)).toEqual(['a1']);
+      expect(fs.readdirSync(stateDir).filter((f) => f.includes('.ndjson'))).toEqual([]);
+    });
+
+    it('keeps actions appended while a save is in progress', async () => {
+      writeSnapshot([]);
+      appendToLog(makeAction('a1', 'Alice'));
+      const service = new ApprovalQueueService(tempDir);
+
+      // Append a2 after the save has loaded the queue but before it writes
+      const realWriteFile = fs.promises.writeFile;
+      const writeSpy = jest.spyOn(fs.promises, 'writeFile').mockImplementationOnce(async (...args) => {
+        appendToLog(makeAction('a2', 'Bob'));
+        return realWriteFile(...(args as Parameters<typeof realWriteFile>));
+      });
+
+      await service.approveActions(mockTenantId, ['a1']);
+      writeSpy.mockRestore();
+
+      const log = fs.readFileSync(path.join(stateDir, 'pending_approvals.ndjson'), 'utf-8');
+      expect(log.trim().split('\n').map((line) => JSON.parse(line).id)).toEqual(['a2']);
+      expect(fs.readdirSync(stateDir).filter((f) => f.includes('.folding'))).toEqual([]);
+
+      const pending = await service.listPendingActions(mockTenantId);
+      expect(pending.map((a) => a.id)).toEqual(['a2']);
+    });
+  });
+
+  describe('list_pending_actions.py', () => {
+    const script = path.join(PROJECT_ROOT, 'src', 'tools', 'python', 'list_pending_actions.py');
+
+    function listPending(): string[] {
+      const env = { ...process.env };
+      delete env.TOOLS_DAEMON_SOCKET;
+      const result = spawnSync('python', [script], {
+        cwd: path.join(tempDir, 'tenants', mockTenantId),
+        input: '{}',
+        encoding: 'utf-8',
+        env,
+      });
+      expect(result.status).toBe(0);
+      return JSON.parse(result.stdout).pending.map((a: { id: string }) => a.id);
+    }
+
+    it('skips appended actions already in the snapshot history', () => {
+      writeSnapshot([], [{ id: 'a1' }]);
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'));
+
+      expect(listPending()).toEqual(['a2']);
+    });
+
+    it('lists snapshot and appended actions once each', () => {
+      writeSnapshot([makeAction('a1', 'Alice')]);
+      appendToLog(makeAction('a1', 'Alice'), makeAction('a2', 'Bob'));
+
+      expect(listPending()).toEqual(['a1', 'a2']);
+    });
+  });
+});
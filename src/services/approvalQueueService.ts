@@ -58,6 +58,10 @@ export interface ExecutionResult {
  * ApprovalQueueService manages the approval queue for campaign outreach actions.
  *
  * Queue data is stored at: tenants/{tenantId}/state/pending_approvals.json
+ *
+ * queue_action.py appends new actions to state/pending_approvals.ndjson
+ * instead of rewriting the JSON file. Loads merge that log in, and saves
+ * fold it into pending_approvals.json.
  */
 export class ApprovalQueueService {
   private projectRoot: string;
@@ -77,7 +81,95 @@ export class ApprovalQueueService {
   }
 
   /**
-   * Load the approvals data file.
+   * Serialize the approvals data file. Compact unless LIFE_PRETTY_JSON=1,
+   * the same rule the Python tools (_pending_approvals.py) follow.
+   */
+  private serializeApprovalsData(data: PendingApprovalsData): string {
+    return process.env.LIFE_PRETTY_JSON === '1' ? JSON.stringify(data, null, 2) : JSON.stringify(data);
+  }
+
+  /**
+   * Get the path to the append log written by queue_action.py.
+   */
+  private getAppendLogPath(tenantId: string): string {
+    return this.getApprovalsPath(tenantId).replace(/\.json$/, '.ndjson');
+  }
+
+  /**
+   * Parse append log lines, skipping blank or torn ones.
+   */
+  private parseAppendLog(content: string): QueuedAction[] {
+    const actions: QueuedAction[] = [];
+    for (const line of content.split('\n')) {
+      if (line.trim() === '') continue;
+      try {
+        actions.push(JSON.parse(line) as QueuedAction);
+      } catch {
+        // Torn line from a writer that died mid-append
+      }
+    }
+    return actions;
+  }
+
+  /**
+   * Collect the ids the snapshot already accounts for.
+   */
+  private knownActionIds(data: PendingApprovalsData): Set<string> {
+    const known = new Set<string>(data.pending.map((a) => a.id));
+    for (const h of data.history) known.add(h.id);
+    return known;
+  }
+
+  /**
+   * Merge actions appended since the last save into data.pending.
+   */
+  private async mergeAppendLog(tenantId: string, data: PendingApprovalsData): Promise<void> {
+    const logPath = this.getAppendLogPath(tenantId);
+    if (!fs.existsSync(logPath)) {
+      return;
+    }
+
+    const known = this.knownActionIds(data);
+    const content = await fs.promises.readFile(logPath, 'utf-8');
+    for (const action of this.parseAppendLog(content)) {
+      if (!known.has(action.id)) {
+        data.pending.push(action);
+        known.add(action.id);
+      }
+    }
+  }
+
+  /**
+   * Drop append log entries that the saved data now accounts for.
+   * The log is renamed aside first so concurrent appends land in a fresh log.
+   * The aside name is unique per fold so a concurrent fold (a Python tool or
+   * another save) cannot overwrite it before it is read.
+   */
+  private async foldAppendLog(tenantId: string, data: PendingApprovalsData): Promise<void> {
+    const logPath = this.getAppendLogPath(tenantId);
+    const foldingPath = `${logPath}.folding.${process.pid}.${randomUUID()}`;
+    try {
+      await fs.promises.rename(logPath, foldingPath);
+    } catch {
+      // No log to fold
+      return;
+    }
+
+    const known = this.knownActionIds(data);
+    const content = await fs.promises.readFile(foldingPath, 'utf-8');
+    const leftover = this.parseAppendLog(content).filter((a) => !known.has(a.id));
+    if (leftover.length > 0) {
+      await fs.promises.appendFile(
+        logPath,
+        leftover.map((a) => JSON.stringify(a) + '\n').join(''),
+        'utf-8'
+      );
+    }
+    await fs.promises.unlink(foldingPath);
+  }
+
+  /**
+   * Load the approvals data file, including actions from the append log.
    */
   private async loadApprovalsData(tenantId: string): Promise<PendingApprovalsData> {
     const filePath = this.getApprovalsPath(tenantId);
@@ -95,12 +187,15 @@ export class ApprovalQueueService {
       const stateDir = path.dirname(filePath);
       await fs.promises.mkdir(stateDir, { recursive: true });
 
-      await fs.promises.writeFile(filePath, JSON.stringify(data, null, 2), 'utf-8');
+      await fs.promises.writeFile(filePath, this.serializeApprovalsData(data), 'utf-8');
+      await this.mergeAppendLog(tenantId, data);
       return data;
     }
 
     const content = await fs.promises.readFile(filePath, 'utf-8');
-    return JSON.parse(content) as PendingApprovalsData;
+    const data = JSON.parse(content) as PendingApprovalsData;
+    await this.mergeAppendLog(tenantId, data);
+    return data;
   }
 
   /**
@@ -109,7 +204,8 @@ export class ApprovalQueueService {
   private async saveApprovalsData(tenantId: string, data: PendingApprovalsData): Promise<void> {
     const filePath = this.getApprovalsPath(tenantId);
     data.lastUpdated = new Date().toISOString();
-    await fs.promises.writeFile(filePath, JSON.stringify(data, null, 2), 'utf-8');
+    await fs.promises.writeFile(filePath, this.serializeApprovalsData(data), 'utf-8');
+    await this.foldAppendLog(tenantId, data);
   }
 
   /**
@@ -447,6 +543,8 @@ export class ApprovalQueueService {
   async clearPending(tenantId: string): Promise<void> {
     const data = await this.loadApprovalsData(tenantId);
     data.pending = [];
+    // Cleared actions have no history entry, so drop the log rather than fold it
+    await fs.promises.rm(this.getAppendLogPath(tenantId), { force: true });
     await this.saveApprovalsData(tenantId, data);
     logger.info({ tenantId }, 'Cleared all pending actions');
   }
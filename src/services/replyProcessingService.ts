@@ -851,13 +851,28 @@ Best regards`;
   async isReplyProcessed(tenantId: string, emailId: string): Promise<boolean> {
     const filePath = this.getProcessedRepliesPath(tenantId);
 
-    if (!fs.existsSync(filePath)) {
+    if (fs.existsSync(filePath)) {
+      const content = await fs.promises.readFile(filePath, 'utf-8');
+      const data = JSON.parse(content);
+      if (data.processed_ids?.includes(emailId)) {
+        return true;
+      }
+    }
+
+    // process_campaign_replies.py appends its IDs to a JSONL log alongside
+    const logPath = filePath.replace(/\.json$/, '.jsonl');
+    if (!fs.existsSync(logPath)) {
       return false;
     }
 
-    const content = await fs.promises.readFile(filePath, 'utf-8');
-    const data = JSON.parse(content);
-    return data.processed_ids?.includes(emailId) ?? false;
+    const log = await fs.promises.readFile(logPath, 'utf-8');
+    return log.split('\n').some((line) => {
+      try {
+        return line.trim() !== '' && JSON.parse(line) === emailId;
+      } catch {
+        return false;
+      }
+    });
   }
 
   /**
@@ -1004,6 +1004,37 @@ Hard rules that govern agent behavior. These are non-negotiable.
     }
   }
 
+  /**
+   * Read actions queue_action.py appended to state/pending_approvals.ndjson
+   * that the pending_approvals.json snapshot does not include yet.
+   */
+  private async readAppendedApprovals<T extends { id: string }>(
+    stateDir: string,
+    known: Set<string>
+  ): Promise<T[]> {
+    let content: string;
+    try {
+      content = await fs.promises.readFile(path.join(stateDir, 'pending_approvals.ndjson'), 'utf-8');
+    } catch {
+      return [];
+    }
+
+    const actions: T[] = [];
+    for (const line of content.split('\n')) {
+      if (line.trim() === '') continue;
+      try {
+        const action = JSON.parse(line) as T;
+        if (!known.has(action.id)) {
+          known.add(action.id);
+          actions.push(action);
+        }
+      } catch {
+        // Torn line from a writer that died mid-append
+      }
+    }
+    return actions;
+  }
+
   /**
    * Sync unified activity log to state/activity_log.json.
    * Combines messages, approval history, and email activity for full visibility.
@@ -1048,9 +1079,9 @@ Hard rules that govern agent behavior. These are non-negotiable.
       }> = [];
 
       try {
-        const approvalsContent = await fs.promises.readFile(pendingApprovalsPath, 'utf-8');
-        const approvalsData = JSON.parse(approvalsContent) as {
+        let approvalsData: {
           history: Array<{
+            id: string;
             target_name: string;
             status: string;
             action_type: string;
@@ -1059,11 +1090,19 @@ Hard rules that govern agent behavior. These are non-negotiable.
             rejected_at?: string;
           }>;
           pending: Array<{
+            id: string;
             target_name: string;
             subject?: string;
             queued_at: string;
           }>;
-        };
+        } = { pending: [], history: [] };
+        try {
+          const approvalsContent = await fs.promises.readFile(pendingApprovalsPath, 'utf-8');
+          approvalsData = JSON.parse(approvalsContent);
+        } catch {
+          // No snapshot yet; queue_action.py may still have appended actions
+        }
+        approvalsData.history = approvalsData.history || [];
 
         // Add executed emails (sent)
         for (const h of approvalsData.history.slice(0, 20)) {
@@ -1091,8 +1130,12 @@ Hard rules that govern agent behavior. These are non-negotiable.
           }
         }
 
-        // Note pending actions count for context
-        const pendingCount = approvalsData.pending?.length || 0;
+        // Note pending actions count for context, including queued-but-unfolded ones
+        const snapshotPending = approvalsData.pending || [];
+        const known = new Set<string>(snapshotPending.map(p => p.id));
+        for (const h of approvalsData.history) known.add(h.id);
+        const appended = await this.readAppendedApprovals<{ id: string }>(stateDir, known);
+        const pendingCount = snapshotPending.length + appended.length;
         if (pendingCount > 0) {
           approvalActivities.unshift({
             type: 'approval',
@@ -1102,7 +1145,7 @@ Hard rules that govern agent behavior. These are non-negotiable.
           });
         }
       } catch {
-        // No approvals file - that's fine
+        // Unreadable approval log - skip approval activity
       }
 
       // 3. Combine and sort by timestamp (newest first)
@@ -1142,12 +1185,26 @@ Hard rules that govern agent behavior. These are non-negotiable.
       // 1. Get pending approvals
       try {
         const approvalsPath = path.join(stateDir, 'pending_approvals.json');
-        const approvalsContent = await fs.promises.readFile(approvalsPath, 'utf-8');
-        const approvalsData = JSON.parse(approvalsContent) as {
-          pending: Array<{ target_name: string; action_type: string }>;
-        };
+        let approvalsData: {
+          pending: Array<{ id: string; target_name: string; action_type: string }>;
+          history?: Array<{ id: string }>;
+        } = { pending: [] };
+        try {
+          const approvalsContent = await fs.promises.readFile(approvalsPath, 'utf-8');
+          approvalsData = JSON.parse(approvalsContent);
+        } catch {
+          // No snapshot yet; queue_action.py may still have appended actions
+        }
 
-        const pending = approvalsData.pending || [];
+        const known = new Set<string>((approvalsData.pending || []).map(p => p.id));
+        for (const h of approvalsData.history || []) known.add(h.id);
+        const pending = [
+          ...(approvalsData.pending || []),
+          ...(await this.readAppendedApprovals<{ id: string; target_name: string; action_type: string }>(
+            stateDir,
+            known
+          )),
+        ];
         if (pending.length > 0) {
           const names = pending.slice(0, 3).map(p => p.target_name).join(', ');
           const extra = pending.length > 3 ? ` +${pending.length - 3} more` : '';
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+_daemon_client.py - Hand a tool call off to a running tools_daemon.py.
+
+Scripts call delegate_to_daemon(tool_name) before main(). When
+TOOLS_DAEMON_SOCKET points at a live daemon socket, the request (stdin,
+cwd and environment) is sent there, the daemon's output is written to
+stdout and the process exits with the daemon's exit code. When no daemon
+is available or the request cannot be sent, it returns False and the script
+runs locally as before. Once the request has been sent it is never re-run
+locally; a lost response is reported as an error instead.
+"""
+
+import io
+import os
+import sys
+import socket
+import struct
+
+from _json_fast import dumps, loads, print_json
+
+
+def send_message(sock: socket.socket, payload: dict):
+    """Write a length-prefixed JSON message."""
+    data = dumps(payload).encode("utf-8")
+    sock.sendall(struct.pack(">I", len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    """Read a length-prefixed JSON message."""
+    header = _recv_exact(sock, 4)
+    (length,) = struct.unpack(">I", header)
+    return loads(_recv_exact(sock, length))
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            raise ConnectionError("Tools daemon closed the connection")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def delegate_to_daemon(tool: str) -> bool:
+    """Run this tool call in the daemon if one is available."""
+    socket_path = os.environ.get("TOOLS_DAEMON_SOCKET")
+    if not socket_path or not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return False
+
+    stdin_bytes = sys.stdin.buffer.read()
+    # Put stdin back so main() can still read it if we fall back
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_bytes), encoding="utf-8")
+
+    try:
+        request = {
+            "tool": tool,
+            "stdin": stdin_bytes.decode("utf-8"),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }
+    except ValueError:
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            send_message(sock, request)
+        except OSError:
+            # The daemon never got a complete request; run locally
+            return False
+
+        try:
+            response = recv_message(sock)
+        except (OSError, ValueError) as e:
+            # The daemon may already have run the call, so running it again
+            # locally could repeat a side effect (a sent email, a log entry)
+            print_json({
+                "status": "error",
+                "message": f"Tools daemon failed after accepting {tool}: {e}"
+            })
+            sys.exit(1)
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.exit(response.get("exit_code", 1))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+_frontmatter.py - JSON frontmatter helpers shared by the migration scripts.
+
+Files look like:
+
+    ---json
+    {...}
+    ---
+    markdown body
+
+The header is recognised with plain string operations (startswith/find)
+rather than a regex, since the format is fixed. JSON goes through
+_json_fast, so orjson is used when installed.
+"""
+
+import os
+import mmap
+import shutil
+from pathlib import Path
+
+from _json_fast import JSONDecodeError, dump_pretty, loads
+
+
+# Write buffer for streaming frontmatter files to disk
+WRITE_BUFFER_BYTES = 1 << 16
+
+
+def has_frontmatter(content: str) -> bool:
+    """Check if content already has JSON frontmatter."""
+    return content.strip().startswith("---json")
+
+
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    """Parse JSON frontmatter from markdown content."""
+    if not content.startswith("---json"):
+        return {}, content
+
+    # Opening line is "---json" plus optional trailing whitespace
+    header_end = content.find("\n", 7)
+    if header_end == -1 or content[7:header_end].strip():
+        return {}, content
+
+    # JSON runs to the first line starting with "---"
+    end = content.find("\n---", header_end)
+    if end == -1:
+        return {}, content
+
+    try:
+        data = loads(content[header_end + 1:end])
+    except JSONDecodeError:
+        return {}, content
+
+    return data, content[end + 4:].lstrip()
+
+
+def read_frontmatter(path: Path | str) -> dict:
+    """
+    Read only the JSON frontmatter of a file, or {} if it has none.
+
+    The file is memory-mapped and only the header bytes are handed to the
+    JSON parser, so the markdown body is never read into a str or decoded.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return {}
+        with mm:
+            if mm[:7] != b"---json":
+                return {}
+
+            header_end = mm.find(b"\n", 7)
+            if header_end == -1 or mm[7:header_end].strip():
+                return {}
+
+            end = mm.find(b"\n---", header_end)
+            if end == -1:
+                return {}
+
+            try:
+                data = loads(mm[header_end + 1:end])
+            except JSONDecodeError:
+                return {}
+
+    return data
+
+
+def write_frontmatter(f, data: dict, markdown: str):
+    """Stream data and markdown to an open text file in frontmatter format."""
+    f.write("---json\n")
+    dump_pretty(data, f)
+    f.write("\n---\n")
+    f.write(markdown)
+
+
+def write_frontmatter_file(path: Path, data: dict, markdown: str):
+    """
+    Write a frontmatter file atomically.
+
+    Content goes to a sibling temp file that is renamed over path, so a
+    crash mid-write leaves the old file intact rather than a torn one.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
+            write_frontmatter(f, data, markdown)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
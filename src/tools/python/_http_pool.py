@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+_http_pool.py - Keep-alive HTTP connections shared by the API tool scripts.
+
+Connections are cached per (scheme, host) for the life of the process, so
+repeated calls from the same process reuse one TCP/TLS connection instead
+of reconnecting for every request. The cache is per thread, so worker
+threads can issue requests concurrently without sharing a connection.
+"""
+
+import threading
+import http.client
+from urllib.parse import urlsplit
+
+
+_LOCAL = threading.local()
+
+# Safe to re-send after the server may already have acted on the first try
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _connections() -> dict[tuple[str, str], http.client.HTTPConnection]:
+    """This thread's connection cache."""
+    connections = getattr(_LOCAL, "connections", None)
+    if connections is None:
+        connections = _LOCAL.connections = {}
+    return connections
+
+
+class HTTPError(Exception):
+    """Raised for responses with a 4xx/5xx status."""
+
+    def __init__(self, code: int, body: str, reason: str = ""):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+        self.body = body
+        self.reason = reason
+
+
+def _get_connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    connections = _connections()
+    key = (scheme, netloc)
+    conn = connections.get(key)
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(netloc, timeout=timeout)
+        connections[key] = conn
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str):
+    conn = _connections().pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def request(method: str, url: str, body: bytes | None = None,
+            headers: dict | None = None, timeout: float = 30) -> bytes:
+    """
+    Send a request over a pooled connection and return the response body.
+
+    Raises HTTPError for error statuses and OSError for connection failures.
+    A request on a reused connection that the server has since closed is
+    retried once on a fresh connection: always if it failed while being
+    sent, but only for idempotent methods once it was sent in full, since
+    the server may already have processed it.
+    """
+    parts = urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    for attempt in range(2):
+        reused = (parts.scheme, parts.netloc) in _connections()
+        conn = _get_connection(parts.scheme, parts.netloc, timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            sent = True
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop_connection(parts.scheme, parts.netloc)
+            if reused and attempt == 0 and (not sent or method.upper() in IDEMPOTENT_METHODS):
+                continue
+            raise
+        except Exception:
+            _drop_connection(parts.scheme, parts.netloc)
+            raise
+
+        if response.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+
+        if response.status >= 400:
+            raise HTTPError(response.status, data.decode("utf-8", errors="replace"), response.reason)
+        return data
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+_json_fast.py - JSON helpers shared by the tool scripts.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so scripts behave the same either way (orjson output is compact
+and UTF-8 rather than ASCII-escaped).
+"""
+
+import sys
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this for either backend
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, pretty-printed with 2 spaces if indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes (no str round-trip with orjson)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps_pretty_bytes(obj) -> bytes:
+    """Serialize obj to 2-space indented UTF-8 JSON bytes, non-ASCII kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_pretty(obj) -> str:
+    """Serialize obj to 2-space indented JSON, non-ASCII kept as-is."""
+    if orjson is not None:
+        return dumps_pretty_bytes(obj).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dump_pretty(obj, f):
+    """Write obj to text file f as 2-space indented JSON, non-ASCII kept as-is."""
+    if orjson is not None:
+        f.write(dumps_pretty(obj))
+    else:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def print_json(obj, indent: bool = False):
+    """Write obj as a JSON line to stdout, skipping the text layer with orjson."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj, indent=2 if indent else None))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+_log_append.py - Append-only log writes shared by log_decision and log_event.
+"""
+
+import os
+from pathlib import Path
+
+
+def append_entry(file_path: Path, header: bytes, entry: bytes):
+    """
+    Append entry to file_path with a single O_APPEND write.
+
+    The header is written in front of the entry when the file is empty, so a
+    new file and its first entry land together. A missing parent folder is
+    recreated; any other I/O error is raised to the caller.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    try:
+        fd = os.open(file_path, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        fd = os.open(file_path, flags, 0o644)
+    try:
+        if os.fstat(fd).st_size == 0:
+            entry = header + entry
+        os.write(fd, entry)
+    finally:
+        os.close(fd)
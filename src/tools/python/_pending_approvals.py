@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+_pending_approvals.py - The approval queue in state/.
+
+queue_action appends each new action as one line to
+state/pending_approvals.ndjson with a single O_APPEND write, so queueing
+never reads or rewrites the queue. state/pending_approvals.json is the
+snapshot: tools that change the queue (approve, execute, the TS approval
+service) load the snapshot plus the log, then write the snapshot back with
+the log folded in.
+
+Readers must merge both files. A log entry whose id is already in the
+snapshot (pending or history) has been folded and is skipped.
+"""
+
+import os
+import secrets
+from pathlib import Path
+from datetime import datetime
+
+from _json_fast import dumps_bytes, dumps_pretty_bytes, loads
+
+
+STATE_DIR = Path("state")
+SNAPSHOT_NAME = "pending_approvals.json"
+LOG_NAME = "pending_approvals.ndjson"
+
+# queue_action folds the log into the snapshot once it grows past this
+LOG_COMPACT_BYTES = 256 * 1024
+
+
+def empty_approvals() -> dict:
+    """The structure of a fresh pending_approvals.json."""
+    return {
+        "version": 1,
+        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "pending": [],
+        "history": []
+    }
+
+
+def append_action(action: dict, encoded: bytes | None = None) -> int:
+    """
+    Append one action to the log and return the log's new size in bytes.
+
+    encoded is dumps_bytes(action), for callers that already have it.
+    """
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    line = (encoded if encoded is not None else dumps_bytes(action)) + b"\n"
+    fd = os.open(STATE_DIR / LOG_NAME, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def _parse_log(raw: bytes) -> list[dict]:
+    actions = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            actions.append(loads(line))
+        except ValueError:
+            # Torn line from a writer that died mid-append
+            continue
+    return actions
+
+
+def read_log() -> list[dict]:
+    """Actions appended since the last fold, oldest first."""
+    try:
+        return _parse_log((STATE_DIR / LOG_NAME).read_bytes())
+    except FileNotFoundError:
+        return []
+
+
+def load_pending_approvals() -> dict:
+    """Load the snapshot with any logged actions merged into pending."""
+    try:
+        data = loads((STATE_DIR / SNAPSHOT_NAME).read_bytes())
+    except FileNotFoundError:
+        data = empty_approvals()
+
+    pending = data.setdefault("pending", [])
+    data.setdefault("history", [])
+    known = {a.get("id") for a in pending}
+    known.update(h.get("id") for h in data["history"])
+
+    for action in read_log():
+        if action.get("id") not in known:
+            pending.append(action)
+            known.add(action.get("id"))
+
+    return data
+
+
+def fold_log(data: dict):
+    """
+    Drop log entries that data now accounts for.
+
+    The log is renamed aside first, so an action appended while this runs
+    lands in a fresh log instead of being lost; entries data does not know
+    about are appended back. The aside name is unique per fold, so a
+    concurrent fold (another tool, the TS service) cannot overwrite it.
+    """
+    log_path = STATE_DIR / LOG_NAME
+    folding_path = log_path.with_name(f"{LOG_NAME}.folding.{os.getpid()}.{secrets.token_hex(4)}")
+    try:
+        os.replace(log_path, folding_path)
+    except FileNotFoundError:
+        return
+
+    known = {a.get("id") for a in data.get("pending", [])}
+    known.update(h.get("id") for h in data.get("history", []))
+    leftover = [
+        action for action in _parse_log(folding_path.read_bytes())
+        if action.get("id") not in known
+    ]
+    if leftover:
+        fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b"".join(dumps_bytes(a) + b"\n" for a in leftover))
+        finally:
+            os.close(fd)
+    folding_path.unlink()
+
+
+def save_pending_approvals(data: dict, *, now: str | None = None):
+    """
+    Write the snapshot atomically, then fold the log into it.
+
+    The snapshot is only read by tools, so it is written compact unless
+    LIFE_PRETTY_JSON=1 is set for debugging; every writer, including the TS
+    approval service, follows this rule. now is the lastUpdated timestamp,
+    for callers that already have one.
+    """
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    file_path = STATE_DIR / SNAPSHOT_NAME
+    tmp_path = file_path.with_name(SNAPSHOT_NAME + ".tmp")
+    data["lastUpdated"] = now or datetime.utcnow().isoformat() + "Z"
+    # One pre-encoded write; no intermediate str to re-encode
+    pretty = os.environ.get("LIFE_PRETTY_JSON", "0") == "1"
+    tmp_path.write_bytes(dumps_pretty_bytes(data) if pretty else dumps_bytes(data))
+    os.replace(tmp_path, file_path)
+    fold_log(data)
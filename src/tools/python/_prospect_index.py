@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+_prospect_index.py - Email -> slug index for relationships/prospects/.
+
+The index lives in relationships/prospects/.index.json as
+{"email@lowercase": "slug", ...}. prospect_write keeps it current and
+prospect_read uses it to open one file instead of scanning them all.
+
+It is only a hint: readers must check that the indexed file still has the
+email, and fall back to a full scan (then rebuild) on a miss, since other
+tools can create prospect files without touching the index.
+"""
+
+import os
+import json
+from pathlib import Path
+
+
+INDEX_FILE_NAME = ".index.json"
+
+
+def load_index(prospects_folder: Path) -> dict[str, str]:
+    """Load the index, or {} if it is missing or unreadable."""
+    try:
+        data = json.loads((prospects_folder / INDEX_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_index(prospects_folder: Path, index: dict[str, str]):
+    """Write the index atomically (temp file + rename)."""
+    index_path = prospects_folder / INDEX_FILE_NAME
+    tmp_path = index_path.with_name(INDEX_FILE_NAME + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # The index is an optimisation; never fail the caller over it
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def index_prospect(prospects_folder: Path, slug: str, email: str, old_email: str = ""):
+    """Record slug under email, dropping old_email if it pointed at slug."""
+    index = load_index(prospects_folder)
+    old_key = (old_email or "").lower()
+    if old_key and index.get(old_key) == slug:
+        del index[old_key]
+    if email:
+        index[email.lower()] = slug
+    save_index(prospects_folder, index)
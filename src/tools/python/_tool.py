@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+_tool.py - Shared entry point wrapper for the JSON tool scripts.
+
+Tool scripts read JSON on stdin and print JSON on stdout. Decorating main()
+with tool_main turns any uncaught exception into the standard
+{"status": "error", "message": ...} result and exit code 1, so scripts
+don't each repeat the try/except.
+"""
+
+import sys
+from functools import wraps
+
+from _json_fast import print_json
+
+
+def tool_main(fn):
+    """Report exceptions escaping fn as a JSON error result and exit 1."""
+    @wraps(fn)
+    def wrapper():
+        try:
+            fn()
+        except Exception as e:
+            print_json({
+                "status": "error",
+                "message": str(e)
+            })
+            sys.exit(1)
+    return wrapper
@@ -5,7 +5,7 @@ campaign_write.py - Write/update campaign data in operations/campaigns/
 Input JSON:
 {
     "campaign": "campaign-name",
-    "operation": "create|update_config|add_target|add_target_by_prospect|update_target|update_target_stage_sync|record_touch|log_event",
+    "operation": "create|update_config|add_target|add_target_by_prospect|update_target|batch_update_targets|update_target_stage_sync|record_touch|log_event",
     "data": { ... },
     "target_id": "optional target ID for target operations",
     "prospect_slug": "optional prospect slug for add_target_by_prospect"
@@ -17,6 +17,8 @@ Operations:
 - add_target: Add new target to campaign (legacy, inline data)
 - add_target_by_prospect: Add target by prospect slug (new reference format)
 - update_target: Update existing target (stage, research, etc.)
+- batch_update_targets: Update several targets in one write
+  (data: {"updates": [{"target_id": "...", "data": {...}}, ...]})
 - update_target_stage_sync: Update target stage and sync to prospect file
 - record_touch: Record an outreach touch for a target
 - log_event: Add event to campaign log
@@ -437,15 +439,13 @@ def update_target_stage_sync(campaign_name: str, target_id: str, new_stage: str)
     return target_ref
 
 
-def update_target(campaign_name: str, target_id: str, updates: dict) -> dict:
-    """Update an existing target (handles both formats)."""
-    campaign_path = get_campaign_path(campaign_name)
-
-    if not campaign_path.exists():
-        raise ValueError(f"Campaign '{campaign_name}' not found")
-
-    data, markdown = read_campaign_file(campaign_path, "targets")
+def _apply_target_update(data: dict, target_id: str, updates: dict) -> tuple[dict | None, str | None]:
+    """
+    Apply updates to one target in already-parsed targets data (handles both formats).
 
+    Returns (target, format) where format is "v2", "legacy_stage_changed",
+    "legacy" or None if the target was not found.
+    """
     # Try v2 format first
     if "target_references" in data:
         for ref in data["target_references"]:
@@ -458,11 +458,7 @@ def update_target(campaign_name: str, target_id: str, updates: dict) -> dict:
                     ref["last_touch_at"] = updates["last_touch_at"]
                 if "touch_count" in updates:
                     ref["touch_count"] = updates["touch_count"]
-
-                data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-                write_campaign_file(campaign_path, "targets", data, markdown)
-                update_metrics_count_v2(campaign_path)
-                return ref
+                return ref, "v2"
 
     # Try legacy format
     if "targets" in data:
@@ -477,16 +473,69 @@ def update_target(campaign_name: str, target_id: str, updates: dict) -> dict:
 
                 if new_stage and new_stage != old_stage:
                     target["stage_changed_at"] = datetime.utcnow().isoformat() + "Z"
+                    return target, "legacy_stage_changed"
+                return target, "legacy"
 
-                data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-                write_campaign_file(campaign_path, "targets", data, markdown)
+    return None, None
 
-                if new_stage and new_stage != old_stage:
-                    update_metrics_count(campaign_path)
 
-                return target
+def update_target(campaign_name: str, target_id: str, updates: dict) -> dict:
+    """Update an existing target (handles both formats)."""
+    campaign_path = get_campaign_path(campaign_name)
 
-    raise ValueError(f"Target '{target_id}' not found")
+    if not campaign_path.exists():
+        raise ValueError(f"Campaign '{campaign_name}' not found")
+
+    data, markdown = read_campaign_file(campaign_path, "targets")
+
+    target, fmt = _apply_target_update(data, target_id, updates)
+    if target is None:
+        raise ValueError(f"Target '{target_id}' not found")
+
+    data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
+    write_campaign_file(campaign_path, "targets", data, markdown)
+
+    if fmt == "v2":
+        update_metrics_count_v2(campaign_path)
+    elif fmt == "legacy_stage_changed":
+        update_metrics_count(campaign_path)
+
+    return target
+
+
+def batch_update_targets(campaign_name: str, updates: list[tuple[str, dict]]) -> dict[str, dict | None]:
+    """
+    Apply several (target_id, updates) pairs to one campaign.
+
+    targets.md is read and written once, and metrics are recounted once,
+    instead of once per target. Returns {target_id: updated target, or None
+    if it was not found}; updates for the same target apply in order.
+    """
+    campaign_path = get_campaign_path(campaign_name)
+
+    if not campaign_path.exists():
+        raise ValueError(f"Campaign '{campaign_name}' not found")
+
+    data, markdown = read_campaign_file(campaign_path, "targets")
+
+    results = {}
+    formats = set()
+    for target_id, target_updates in updates:
+        target, fmt = _apply_target_update(data, target_id, target_updates)
+        results[target_id] = target
+        formats.add(fmt)
+
+    formats.discard(None)
+    if formats:
+        data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
+        write_campaign_file(campaign_path, "targets", data, markdown)
+
+        if "v2" in formats:
+            update_metrics_count_v2(campaign_path)
+        if "legacy_stage_changed" in formats:
+            update_metrics_count(campaign_path)
+
+    return results
 
 
 def record_touch(campaign_name: str, target_id: str, touch_data: dict) -> dict:
@@ -629,137 +678,155 @@ def update_touch_metrics(campaign_path: Path, channel: str):
     write_campaign_file(campaign_path, "metrics", metrics_data, metrics_md)
 
 
+def run(input_data: dict) -> dict:
+    """Apply a campaign_write request and return the result dict. Raises on error."""
+    campaign_name = input_data.get("campaign")
+    operation = input_data.get("operation")
+    data = input_data.get("data", {})
+    target_id = input_data.get("target_id")
+    prospect_slug = input_data.get("prospect_slug")
+
+    if not operation:
+        raise ValueError("Missing required field: operation")
+
+    if operation == "create":
+        if not campaign_name:
+            campaign_name = data.get("name")
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+
+        config = create_campaign(campaign_name, data)
+        result = {
+            "status": "success",
+            "message": f"Campaign '{campaign_name}' created",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": config
+        }
+
+    elif operation == "update_config":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+
+        config = update_config(campaign_name, data)
+        result = {
+            "status": "success",
+            "message": f"Campaign '{campaign_name}' config updated",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": config
+        }
+
+    elif operation == "add_target_by_prospect":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+        if not prospect_slug:
+            prospect_slug = data.get("prospect_slug")
+        if not prospect_slug:
+            raise ValueError("Missing prospect_slug")
+
+        target_ref = add_target_by_prospect(campaign_name, prospect_slug)
+        result = {
+            "status": "success",
+            "message": f"Target reference added for prospect '{prospect_slug}'",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": target_ref
+        }
+
+    elif operation == "add_target":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+
+        target = add_target(campaign_name, data)
+        result = {
+            "status": "success",
+            "message": f"Target '{target['name']}' added to campaign",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": target
+        }
+
+    elif operation == "update_target_stage_sync":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+        if not target_id:
+            raise ValueError("Missing target_id")
+
+        new_stage = data.get("stage")
+        if not new_stage:
+            raise ValueError("Missing stage in data")
+
+        target_ref = update_target_stage_sync(campaign_name, target_id, new_stage)
+        result = {
+            "status": "success",
+            "message": f"Target stage updated and synced to prospect",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": target_ref
+        }
+
+    elif operation == "update_target":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+        if not target_id:
+            raise ValueError("Missing target_id")
+
+        target = update_target(campaign_name, target_id, data)
+        result = {
+            "status": "success",
+            "message": "Target updated",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": target
+        }
+
+    elif operation == "batch_update_targets":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+
+        updates = [(u.get("target_id"), u.get("data", {})) for u in data.get("updates", [])]
+        targets = batch_update_targets(campaign_name, updates)
+        missing = [tid for tid, target in targets.items() if target is None]
+        result = {
+            "status": "success",
+            "message": f"{len(targets) - len(missing)} targets updated" + (f", not found: {', '.join(map(str, missing))}" if missing else ""),
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": targets
+        }
+
+    elif operation == "record_touch":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+        if not target_id:
+            raise ValueError("Missing target_id")
+
+        touch = record_touch(campaign_name, target_id, data)
+        result = {
+            "status": "success",
+            "message": f"Touch recorded for target",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": touch
+        }
+
+    elif operation == "log_event":
+        if not campaign_name:
+            raise ValueError("Missing campaign name")
+
+        event_type = data.get("type", "INFO")
+        message = data.get("message", "")
+        event = log_event(campaign_name, event_type, message)
+        result = {
+            "status": "success",
+            "message": "Event logged",
+            "campaign_path": str(get_campaign_path(campaign_name)),
+            "data": event
+        }
+
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+    return result
+
+
 def main():
     try:
         input_data = json.loads(sys.stdin.read())
-
-        campaign_name = input_data.get("campaign")
-        operation = input_data.get("operation")
-        data = input_data.get("data", {})
-        target_id = input_data.get("target_id")
-        prospect_slug = input_data.get("prospect_slug")
-
-        if not operation:
-            raise ValueError("Missing required field: operation")
-
-        if operation == "create":
-            if not campaign_name:
-                campaign_name = data.get("name")
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-
-            config = create_campaign(campaign_name, data)
-            result = {
-                "status": "success",
-                "message": f"Campaign '{campaign_name}' created",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": config
-            }
-
-        elif operation == "update_config":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-
-            config = update_config(campaign_name, data)
-            result = {
-                "status": "success",
-                "message": f"Campaign '{campaign_name}' config updated",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": config
-            }
-
-        elif operation == "add_target_by_prospect":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-            if not prospect_slug:
-                prospect_slug = data.get("prospect_slug")
-            if not prospect_slug:
-                raise ValueError("Missing prospect_slug")
-
-            target_ref = add_target_by_prospect(campaign_name, prospect_slug)
-            result = {
-                "status": "success",
-                "message": f"Target reference added for prospect '{prospect_slug}'",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": target_ref
-            }
-
-        elif operation == "add_target":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-
-            target = add_target(campaign_name, data)
-            result = {
-                "status": "success",
-                "message": f"Target '{target['name']}' added to campaign",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": target
-            }
-
-        elif operation == "update_target_stage_sync":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-            if not target_id:
-                raise ValueError("Missing target_id")
-
-            new_stage = data.get("stage")
-            if not new_stage:
-                raise ValueError("Missing stage in data")
-
-            target_ref = update_target_stage_sync(campaign_name, target_id, new_stage)
-            result = {
-                "status": "success",
-                "message": f"Target stage updated and synced to prospect",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": target_ref
-            }
-
-        elif operation == "update_target":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-            if not target_id:
-                raise ValueError("Missing target_id")
-
-            target = update_target(campaign_name, target_id, data)
-            result = {
-                "status": "success",
-                "message": "Target updated",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": target
-            }
-
-        elif operation == "record_touch":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-            if not target_id:
-                raise ValueError("Missing target_id")
-
-            touch = record_touch(campaign_name, target_id, data)
-            result = {
-                "status": "success",
-                "message": f"Touch recorded for target",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": touch
-            }
-
-        elif operation == "log_event":
-            if not campaign_name:
-                raise ValueError("Missing campaign name")
-
-            event_type = data.get("type", "INFO")
-            message = data.get("message", "")
-            event = log_event(campaign_name, event_type, message)
-            result = {
-                "status": "success",
-                "message": "Event logged",
-                "campaign_path": str(get_campaign_path(campaign_name)),
-                "data": event
-            }
-
-        else:
-            raise ValueError(f"Unknown operation: {operation}")
-
-        print(json.dumps(result))
+        print(json.dumps(run(input_data)))
 
     except Exception as e:
         error_result = {
@@ -29,26 +29,9 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
-
-def load_pending_approvals() -> dict:
-    """Load pending approvals file."""
-    file_path = Path("state") / "pending_approvals.json"
-
-    if not file_path.exists():
-        return {
-            "version": 1,
-            "pending": [],
-            "history": []
-        }
-
-    return json.loads(file_path.read_text(encoding="utf-8"))
-
-
-def save_pending_approvals(data: dict):
-    """Save pending approvals file."""
-    file_path = Path("state") / "pending_approvals.json"
-    data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+from _json_fast import loads
+from _pending_approvals import load_pending_approvals, save_pending_approvals
+from _tool import tool_main
 
 
 def execute_email(action: dict) -> dict:
@@ -181,84 +164,85 @@ def execute_action(action: dict, dry_run: bool = False) -> dict:
         return {"status": "failed", "error": f"Unknown action type: {action_type}"}
 
 
+@tool_main
 def main():
-    try:
-        input_data = {}
-        stdin_content = sys.stdin.read().strip()
-        if stdin_content:
-            input_data = json.loads(stdin_content)
-
-        action_ids = input_data.get("action_ids", [])
-        dry_run = input_data.get("dry_run", False)
-
-        data = load_pending_approvals()
-        now = datetime.utcnow()
-
-        results = []
-        executed = 0
-        failed = 0
-
-        for action in data.get("pending", []):
-            # Only process approved actions
-            if action.get("status") != "approved":
-                continue
-
-            # Filter by action_ids if specified
-            if action_ids and action["id"] not in action_ids:
-                continue
-
-            # Execute the action
-            exec_result = execute_action(action, dry_run)
-
-            result_entry = {
-                "action_id": action["id"],
-                "target_name": action.get("target_name"),
-                "action_type": action.get("action_type"),
-                **exec_result
-            }
-            results.append(result_entry)
-
-            if exec_result.get("status") == "success":
-                executed += 1
-                if not dry_run:
-                    # Mark as executed
-                    action["status"] = "executed"
-                    action["executed_at"] = now.isoformat() + "Z"
-
-                    # Update history
-                    for h in data["history"]:
-                        if h["id"] == action["id"]:
-                            h["status"] = "executed"
-                            h["executed_at"] = action["executed_at"]
-                            break
-            else:
-                failed += 1
-                if not dry_run:
-                    # Keep as approved for retry, but log error
-                    action["last_error"] = exec_result.get("error")
-                    action["last_attempt"] = now.isoformat() + "Z"
-
-        # Remove executed from pending
-        if not dry_run:
-            data["pending"] = [a for a in data["pending"] if a.get("status") != "executed"]
-            save_pending_approvals(data)
-
-        result = {
-            "status": "success",
-            "executed": executed,
-            "failed": failed,
-            "dry_run": dry_run,
-            "results": results
-        }
-        print(json.dumps(result, indent=2))
-
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
+    stdin_content = sys.stdin.buffer.read()
+    input_data = loads(stdin_content) if stdin_content.strip() else {}
+
+    action_ids = input_data.get("action_ids", [])
+    dry_run = input_data.get("dry_run", False)
+
+    data = load_pending_approvals()
+    now_iso = datetime.utcnow().isoformat() + "Z"
+
+    # Index history by id once instead of scanning it per executed action;
+    # entries are newest-first, so keep the first occurrence of each id
+    history_index = {}
+    for h in data.get("history", []):
+        history_index.setdefault(h["id"], h)
+
+    results = []
+    executed = 0
+    failed = 0
+
+    for action in data.get("pending", []):
+        # Only process approved actions
+        if action.get("status") != "approved":
+            continue
+
+        # Filter by action_ids if specified
+        if action_ids and action["id"] not in action_ids:
+            continue
+
+        # Execute the action
+        exec_result = execute_action(action, dry_run)
+
+        result_entry = {
+            "action_id": action["id"],
+            "target_name": action.get("target_name"),
+            "action_type": action.get("action_type"),
+            **exec_result
         }
-        print(json.dumps(error_result))
-        sys.exit(1)
+        results.append(result_entry)
+
+        if exec_result.get("status") == "success":
+            executed += 1
+            if not dry_run:
+                # Mark as executed
+                action["status"] = "executed"
+                action["executed_at"] = now_iso
+
+                # Update history
+                h = history_index.get(action["id"])
+                if h is not None:
+                    h["status"] = "executed"
+                    h["executed_at"] = action["executed_at"]
+        else:
+            failed += 1
+            if not dry_run:
+                # Keep as approved for retry, but log error
+                action["last_error"] = exec_result.get("error")
+                action["last_attempt"] = now_iso
+
+    # Remove executed from pending (compact in place, no new list)
+    if not dry_run:
+        pending = data.get("pending", [])
+        write = 0
+        for item in pending:
+            if item.get("status") != "executed":
+                pending[write] = item
+                write += 1
+        del pending[write:]
+        save_pending_approvals(data, now=now_iso)
+
+    result = {
+        "status": "success",
+        "executed": executed,
+        "failed": failed,
+        "dry_run": dry_run,
+        "results": results
+    }
+    print(json.dumps(result, indent=2))
 
 
 if __name__ == "__main__":
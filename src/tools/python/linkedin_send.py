@@ -22,27 +22,14 @@ or browser automation with proper rate limiting.
 """
 
 import sys
-import json
-from pathlib import Path
 
-
-def load_env_from_cwd():
-    """Load .env file from current working directory."""
-    env_path = Path.cwd() / ".env"
-    if env_path.exists():
-        for line in env_path.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                import os
-                os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+from _daemon_client import delegate_to_daemon
+from _json_fast import loads, print_json
 
 
 def main():
     try:
-        load_env_from_cwd()
-
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         profile_url = input_data.get("profile_url")
         message = input_data.get("message")
@@ -54,24 +41,13 @@ def main():
         if action == "message" and not message:
             raise ValueError("Message required for message action")
 
-        # Check for LinkedIn credentials
-        import os
-        linkedin_email = os.environ.get("LINKEDIN_EMAIL")
-        linkedin_password = os.environ.get("LINKEDIN_PASSWORD")
-
-        if not linkedin_email or not linkedin_password:
-            result = {
-                "status": "failed",
-                "error": "LinkedIn credentials not configured. Set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in .env"
-            }
-            print(json.dumps(result))
-            sys.exit(1)
-
         # TODO: Implement actual LinkedIn automation
         # Options:
         # 1. LinkedIn API (requires LinkedIn Partner Program approval)
         # 2. Browser automation with Playwright/Selenium (rate limited)
         # 3. Third-party service integration (Phantombuster, etc.)
+        # When it lands, load .env and require LINKEDIN_EMAIL and
+        # LINKEDIN_PASSWORD before sending.
 
         # For now, return a stub response indicating the feature is not yet implemented
         result = {
@@ -83,7 +59,7 @@ def main():
                 "message_preview": message[:100] if message else None
             }
         }
-        print(json.dumps(result))
+        print_json(result)
         sys.exit(1)
 
     except Exception as e:
@@ -91,9 +67,10 @@ def main():
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("linkedin_send"):
+        main()
@@ -28,28 +28,108 @@ Output JSON:
 """
 
 import sys
-import json
-from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from _daemon_client import delegate_to_daemon
+from _json_fast import loads, print_json
+from _pending_approvals import STATE_DIR, SNAPSHOT_NAME, read_log
+from _tool import tool_main
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ciso8601 parses ISO timestamps (including a "Z" suffix) in C; stdlib
+# fromisoformat only accepts "Z" from Python 3.11
+try:
+    from ciso8601 import parse_datetime as parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        parse_iso = datetime.fromisoformat
+    else:
+        def parse_iso(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
-def load_pending_approvals() -> dict:
-    """Load pending approvals file."""
-    file_path = Path("state") / "pending_approvals.json"
+def _until_pending_end(events):
+    """Pass ijson events through until the pending array closes."""
+    for prefix, event, value in events:
+        yield prefix, event, value
+        if prefix == "pending" and event == "end_array":
+            return
 
-    if not file_path.exists():
-        return {
-            "version": 1,
-            "pending": [],
-            "history": []
-        }
 
-    return json.loads(file_path.read_text(encoding="utf-8"))
+def _read_snapshot(with_history_ids: bool) -> tuple[list[dict], set]:
+    """
+    Read the pending array of state/pending_approvals.json, and the ids in
+    its history when with_history_ids is set.
+
+    With ijson installed the file is parsed incrementally: pending stops at
+    the end of its array, and history (much larger) is only walked for ids,
+    never decoded into entries.
+    """
+    file_path = STATE_DIR / SNAPSHOT_NAME
+
+    if ijson is None:
+        try:
+            data = loads(file_path.read_bytes())
+        except FileNotFoundError:
+            return [], set()
+        history_ids = {h.get("id") for h in data.get("history", [])} if with_history_ids else set()
+        return data.get("pending", []), history_ids
+
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError:
+        return [], set()
+    with f:
+        pending = list(ijson.items(_until_pending_end(ijson.parse(f, use_float=True)), "pending.item"))
+        history_ids = set()
+        if with_history_ids:
+            f.seek(0)
+            history_ids = set(ijson.items(f, "history.item.id"))
+    return pending, history_ids
+
+
+def iter_pending_actions():
+    """
+    Yield the snapshot's pending entries, then actions queued since.
+
+    Logged actions already in the snapshot, pending or history, are skipped
+    (same rule as load_pending_approvals): the snapshot is written before
+    the log is folded, so an approved action can still be in the log.
+    """
+    log = read_log()
+    pending, seen = _read_snapshot(with_history_ids=bool(log))
+    for action in pending:
+        seen.add(action.get("id"))
+        yield action
+
+    for action in log:
+        if action.get("id") not in seen:
+            seen.add(action.get("id"))
+            yield action
+
+
+def is_expired(expires_at: str, now: datetime, now_iso: str) -> bool:
+    """
+    Check expiry against the current UTC time.
+
+    UTC timestamps ending in "Z" (what queue_action and the approval queue
+    write) sort chronologically as strings, so compare them without parsing.
+    """
+    if expires_at.endswith("Z"):
+        return expires_at <= now_iso
+    expires = parse_iso(expires_at)
+    if expires.tzinfo is not None:
+        expires = expires.astimezone(timezone.utc).replace(tzinfo=None)
+    return expires <= now
 
 
 def format_time_remaining(expires_at: str) -> str:
     """Format time remaining until expiry."""
-    expires = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+    expires = parse_iso(expires_at)
     now = datetime.now(expires.tzinfo)
 
     diff = expires - now
@@ -68,71 +148,59 @@ def format_time_remaining(expires_at: str) -> str:
         return f"{minutes} minute{'s' if minutes > 1 else ''}"
 
 
+@tool_main
 def main():
-    try:
-        input_data = {}
-        stdin_content = sys.stdin.read().strip()
-        if stdin_content:
-            input_data = json.loads(stdin_content)
-
-        campaign_id = input_data.get("campaign_id")
-        include_expired = input_data.get("include_expired", False)
-
-        data = load_pending_approvals()
-        now = datetime.utcnow()
-
-        pending = []
-        for action in data.get("pending", []):
-            # Skip non-pending status
-            if action.get("status") != "pending":
-                continue
-
-            # Check expiry
-            expires_at = action.get("expires_at", "")
-            if expires_at:
-                expires = datetime.fromisoformat(expires_at.replace("Z", ""))
-                if expires <= now and not include_expired:
-                    continue
-
-            # Filter by campaign if specified
-            if campaign_id and action.get("campaign_id") != campaign_id:
-                continue
-
-            # Format for output
-            body = action.get("body", "")
-            body_preview = body[:100] + "..." if len(body) > 100 else body
-
-            pending.append({
-                "id": action["id"],
-                "campaign_id": action.get("campaign_id"),
-                "campaign_name": action.get("campaign_name", ""),
-                "target_id": action.get("target_id"),
-                "target_name": action.get("target_name", "Unknown"),
-                "target_email": action.get("target_email"),
-                "action_type": action.get("action_type"),
-                "channel": action.get("channel"),
-                "subject": action.get("subject"),
-                "body_preview": body_preview,
-                "reasoning": action.get("reasoning"),
-                "queued_at": action.get("queued_at"),
-                "expires_in": format_time_remaining(expires_at) if expires_at else "unknown"
-            })
-
-        result = {
-            "status": "success",
-            "count": len(pending),
-            "pending": pending
-        }
-        print(json.dumps(result, indent=2))
+    stdin_content = sys.stdin.buffer.read()
+    input_data = loads(stdin_content) if stdin_content.strip() else {}
 
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
+    campaign_id = input_data.get("campaign_id")
+    include_expired = input_data.get("include_expired", False)
+
+    now = datetime.utcnow()
+    now_iso = now.isoformat(timespec="microseconds") + "Z"
+
+    # Cheap status/campaign filters first, in one pass
+    candidates = [
+        action for action in iter_pending_actions()
+        if action.get("status") == "pending"
+        and (not campaign_id or action.get("campaign_id") == campaign_id)
+    ]
+
+    pending = []
+    for action in candidates:
+        # Check expiry
+        expires_at = action.get("expires_at", "")
+        if expires_at and not include_expired and is_expired(expires_at, now, now_iso):
+            continue
+
+        # Format for output
+        body = action.get("body", "")
+        body_preview = body[:100] + "..." if len(body) > 100 else body
+
+        pending.append({
+            "id": action["id"],
+            "campaign_id": action.get("campaign_id"),
+            "campaign_name": action.get("campaign_name", ""),
+            "target_id": action.get("target_id"),
+            "target_name": action.get("target_name", "Unknown"),
+            "target_email": action.get("target_email"),
+            "action_type": action.get("action_type"),
+            "channel": action.get("channel"),
+            "subject": action.get("subject"),
+            "body_preview": body_preview,
+            "reasoning": action.get("reasoning"),
+            "queued_at": action.get("queued_at"),
+            "expires_in": format_time_remaining(expires_at) if expires_at else "unknown"
+        })
+
+    result = {
+        "status": "success",
+        "count": len(pending),
+        "pending": pending
+    }
+    print_json(result, indent=True)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("list_pending_actions"):
+        main()
@@ -35,17 +35,26 @@ Environment variables required:
 """
 
 import sys
-import json
 import os
-import urllib.request
-import urllib.error
+import time
+
+from _daemon_client import delegate_to_daemon
+from _http_pool import HTTPError, request
+from _json_fast import JSONDecodeError, loads, print_json
+
+
+# Responses cached in-process for CACHE_TTL_SECONDS, keyed by
+# (api_base_url, tenant_id, sender_phone, all_users). Only helps when hosted
+# in tools_daemon.py; manage_trigger clears it after a change.
+CACHE_TTL_SECONDS = 5.0
+TRIGGER_CACHE: dict[tuple, tuple[float, list]] = {}
 
 
 def main():
     # Read JSON input from stdin
     try:
-        input_data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError:
+        input_data = loads(sys.stdin.buffer.read())
+    except JSONDecodeError:
         input_data = {}
 
     # Get required environment variables
@@ -54,11 +63,11 @@ def main():
     api_base_url = os.environ.get("API_BASE_URL", "http://localhost:3000")
 
     if not tenant_id or not sender_phone:
-        print(json.dumps({
+        print_json({
             "success": False,
             "triggers": [],
             "error": "Missing required environment variables: TENANT_ID, SENDER_PHONE"
-        }))
+        })
         sys.exit(1)
 
     # Build query string
@@ -67,45 +76,56 @@ def main():
     if not all_users:
         query_params += f"&sender_phone={sender_phone}"
 
+    # Serve repeat lookups from the short-lived cache
+    cache_key = (api_base_url, tenant_id, sender_phone, bool(all_users))
+    cached = TRIGGER_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+        print_json({
+            "success": True,
+            "triggers": cached[1],
+            "error": None
+        })
+        return
+
     # Make API request
     try:
         url = f"{api_base_url}/api/tools/list-triggers?{query_params}"
-        req = urllib.request.Request(url, method="GET")
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        result = loads(request("GET", url, timeout=30))
+        triggers = result.get("triggers", [])
+        TRIGGER_CACHE[cache_key] = (time.monotonic(), triggers)
 
-        print(json.dumps({
+        print_json({
             "success": True,
-            "triggers": result.get("triggers", []),
+            "triggers": triggers,
             "error": None
-        }))
+        })
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(json.dumps({
+    except HTTPError as e:
+        error_body = e.body or str(e)
+        print_json({
             "success": False,
             "triggers": [],
             "error": f"API error ({e.code}): {error_body}"
-        }))
+        })
         sys.exit(1)
 
-    except urllib.error.URLError as e:
-        print(json.dumps({
+    except OSError as e:
+        print_json({
             "success": False,
             "triggers": [],
-            "error": f"Connection error: {str(e.reason)}"
-        }))
+            "error": f"Connection error: {str(e)}"
+        })
         sys.exit(1)
 
     except Exception as e:
-        print(json.dumps({
+        print_json({
             "success": False,
             "triggers": [],
             "error": f"Unexpected error: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("list_triggers"):
+        main()
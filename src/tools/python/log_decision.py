@@ -19,17 +19,27 @@ Output JSON:
 """
 
 import sys
-import json
 from datetime import datetime
 from pathlib import Path
 
+from _daemon_client import delegate_to_daemon
+from _json_fast import loads, print_json
+from _log_append import append_entry
 
-VALID_CATEGORIES = ["ACTION", "ESCALATION", "BOUNDARY", "STATE_CHANGE"]
+
+VALID_CATEGORIES = frozenset(("ACTION", "ESCALATION", "BOUNDARY", "STATE_CHANGE"))
+VALID_CATEGORIES_DISPLAY = "ACTION, ESCALATION, BOUNDARY, STATE_CHANGE"
+
+HEADER = b"""# Decision Log
+# Format: [TIMESTAMP] [CATEGORY] Decision description
+# Categories: ACTION, ESCALATION, BOUNDARY, STATE_CHANGE
+
+"""
 
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         category = input_data.get("category")
         description = input_data.get("description")
@@ -40,7 +50,7 @@ def main():
             raise ValueError("Missing required field: description")
 
         if category not in VALID_CATEGORIES:
-            raise ValueError(f"Invalid category: {category}. Must be one of: {', '.join(VALID_CATEGORIES)}")
+            raise ValueError(f"Invalid category: {category}. Must be one of: {VALID_CATEGORIES_DISPLAY}")
 
         # Ensure history directory exists
         history_dir = Path("history")
@@ -48,39 +58,30 @@ def main():
 
         file_path = history_dir / "decisions.log"
 
-        # Create file with header if it doesn't exist
-        if not file_path.exists():
-            header = """# Decision Log
-# Format: [TIMESTAMP] [CATEGORY] Decision description
-# Categories: ACTION, ESCALATION, BOUNDARY, STATE_CHANGE
-
-"""
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(header)
-
         # Format the log entry
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = f"[{timestamp}] [{category}] {description}\n"
+        entry = b"[%s] [%s] %s\n" % (
+            timestamp.encode("ascii"), category.encode("ascii"), str(description).encode("utf-8")
+        )
 
-        # Append to log
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(entry)
+        append_entry(file_path, HEADER, entry)
 
         result = {
             "status": "success",
             "file": str(file_path),
             "message": "Decision logged successfully"
         }
-        print(json.dumps(result))
+        print_json(result)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("log_decision"):
+        main()
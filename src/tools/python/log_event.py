@@ -18,25 +18,49 @@ Output JSON:
 }
 """
 
+import os
 import sys
-import json
 from datetime import datetime
 from pathlib import Path
 
+from _daemon_client import delegate_to_daemon
+from _json_fast import loads, print_json
+from _log_append import append_entry
 
-def get_importance_marker(importance: str) -> str:
-    """Get a visual marker for importance level."""
-    markers = {
-        "high": "[!]",
-        "medium": "[-]",
-        "low": "[.]"
-    }
-    return markers.get(importance, "[-]")
+
+# Visual marker for each importance level
+IMPORTANCE_MARKERS = {
+    "high": b"[!]",
+    "medium": b"[-]",
+    "low": b"[.]"
+}
+
+_MONTH_FILES: dict[tuple[str, int, int], tuple[Path, bytes]] = {}
+
+
+def get_month_file(now: datetime) -> tuple[Path, bytes]:
+    """
+    Get this month's events file (creating its folder) and encoded header.
+
+    Cached per (cwd, year, month) so repeat calls in a long-lived process
+    skip the mkdir and formatting until the month rolls over.
+    """
+    key = (os.getcwd(), now.year, now.month)
+    cached = _MONTH_FILES.get(key)
+    if cached is None:
+        events_dir = Path("life") / "events"
+        events_dir.mkdir(parents=True, exist_ok=True)
+        cached = (
+            events_dir / now.strftime("%Y-%m.md"),
+            f"# Events - {now.strftime('%B %Y')}\n".encode("utf-8"),
+        )
+        _MONTH_FILES[key] = cached
+    return cached
 
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         event = input_data.get("event")
         importance = input_data.get("importance", "medium")
@@ -44,47 +68,36 @@ def main():
         if not event:
             raise ValueError("Missing required field: event")
 
-        if importance not in ["high", "medium", "low"]:
+        if importance not in IMPORTANCE_MARKERS:
             importance = "medium"
 
         # Get current month's file
         now = datetime.now()
-        events_dir = Path("life") / "events"
-        events_dir.mkdir(parents=True, exist_ok=True)
-
-        file_name = now.strftime("%Y-%m.md")
-        file_path = events_dir / file_name
+        file_path, header = get_month_file(now)
 
         # Format the event entry
         timestamp = now.strftime("%Y-%m-%d %H:%M")
-        marker = get_importance_marker(importance)
-        entry = f"\n{marker} **{timestamp}** - {event}\n"
-
-        # Check if file exists, create header if new
-        if not file_path.exists():
-            header = f"# Events - {now.strftime('%B %Y')}\n"
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(header)
+        marker = IMPORTANCE_MARKERS[importance]
+        entry = b"\n%s **%s** - %s\n" % (marker, timestamp.encode("ascii"), str(event).encode("utf-8"))
 
-        # Append event
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(entry)
+        append_entry(file_path, header, entry)
 
         result = {
             "status": "success",
             "file": str(file_path),
             "message": "Event logged successfully"
         }
-        print(json.dumps(result))
+        print_json(result)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("log_event"):
+        main()
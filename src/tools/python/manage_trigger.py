@@ -22,22 +22,28 @@ Environment variables required:
 """
 
 import sys
-import json
 import os
-import urllib.request
-import urllib.error
+
+from _daemon_client import delegate_to_daemon
+from _http_pool import HTTPError, request
+from _json_fast import JSONDecodeError, dumps, loads, print_json
+from list_triggers import TRIGGER_CACHE
+
+
+VALID_ACTIONS = frozenset(("enable", "disable", "delete"))
+INVALID_ACTION_ERROR = "Invalid action. Must be one of: enable, disable, delete"
 
 
 def main():
     # Read JSON input from stdin
     try:
-        input_data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError as e:
-        print(json.dumps({
+        input_data = loads(sys.stdin.buffer.read())
+    except JSONDecodeError as e:
+        print_json({
             "success": False,
             "message": None,
             "error": f"Invalid JSON input: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
     # Get required environment variables
@@ -48,21 +54,20 @@ def main():
     action = input_data.get("action")
 
     if not trigger_id or not action:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "error": "Missing required fields: trigger_id, action"
-        }))
+        })
         sys.exit(1)
 
     # Validate action
-    valid_actions = ["enable", "disable", "delete"]
-    if action not in valid_actions:
-        print(json.dumps({
+    if not isinstance(action, str) or action not in VALID_ACTIONS:
+        print_json({
             "success": False,
             "message": None,
-            "error": f"Invalid action. Must be one of: {', '.join(valid_actions)}"
-        }))
+            "error": INVALID_ACTION_ERROR
+        })
         sys.exit(1)
 
     # Build request payload
@@ -74,47 +79,49 @@ def main():
     # Make API request
     try:
         url = f"{api_base_url}/api/tools/manage-trigger"
-        req = urllib.request.Request(
+        response_body = request(
+            "POST",
             url,
-            data=json.dumps(payload).encode("utf-8"),
+            body=dumps(payload).encode("utf-8"),
             headers={"Content-Type": "application/json"},
-            method="POST"
+            timeout=30
         )
+        result = loads(response_body)
+        # Cached trigger lists (daemon only) are now stale
+        TRIGGER_CACHE.clear()
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
-
-        print(json.dumps({
+        print_json({
             "success": True,
             "message": result.get("message", f"Trigger {action}d successfully"),
             "error": None
-        }))
+        })
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(json.dumps({
+    except HTTPError as e:
+        error_body = e.body or str(e)
+        print_json({
             "success": False,
             "message": None,
             "error": f"API error ({e.code}): {error_body}"
-        }))
+        })
         sys.exit(1)
 
-    except urllib.error.URLError as e:
-        print(json.dumps({
+    except OSError as e:
+        print_json({
             "success": False,
             "message": None,
-            "error": f"Connection error: {str(e.reason)}"
-        }))
+            "error": f"Connection error: {str(e)}"
+        })
         sys.exit(1)
 
     except Exception as e:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "error": f"Unexpected error: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("manage_trigger"):
+        main()
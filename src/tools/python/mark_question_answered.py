@@ -20,12 +20,24 @@ Output JSON:
 }
 """
 
+import os
 import sys
-import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from _daemon_client import delegate_to_daemon
+from _json_fast import dumps_bytes, loads, print_json
+
+# life_read/life_write live next to this script; call them in-process when
+# possible and only fall back to spawning them if the import fails
+try:
+    from life_write import run as life_write_run
+    from life_read import run as life_read_run
+except ImportError:
+    life_write_run = None
+    life_read_run = None
+
 
 def call_life_write(file_name: str, operation: str, path: str, value) -> dict:
     """Call life_write.py with the given parameters."""
@@ -38,22 +50,28 @@ def call_life_write(file_name: str, operation: str, path: str, value) -> dict:
         "value": value
     }
 
+    if life_write_run is not None:
+        try:
+            return life_write_run(input_data)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     try:
         result = subprocess.run(
             [sys.executable, str(script_path)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
+            input=dumps_bytes(input_data),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=30
         )
 
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return loads(result.stdout)
         else:
             try:
-                return json.loads(result.stdout)
+                return loads(result.stdout)
             except:
-                return {"status": "error", "message": result.stderr or "Unknown error"}
+                return {"status": "error", "message": result.stderr.decode("utf-8", errors="replace") or "Unknown error"}
 
     except subprocess.TimeoutExpired:
         return {"status": "error", "message": "life_write.py timed out"}
@@ -67,33 +85,38 @@ def call_life_read(file_name: str) -> dict:
 
     input_data = {"file": file_name}
 
+    if life_read_run is not None:
+        try:
+            return life_read_run(input_data)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     try:
         result = subprocess.run(
             [sys.executable, str(script_path)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
+            input=dumps_bytes(input_data),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=30
         )
 
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return loads(result.stdout)
         else:
-            return {"status": "error", "message": result.stderr or "Unknown error"}
+            return {"status": "error", "message": result.stderr.decode("utf-8", errors="replace") or "Unknown error"}
 
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 
 def generate_id() -> str:
-    """Generate a simple unique ID."""
-    import uuid
-    return str(uuid.uuid4())[:8]
+    """Generate a simple unique ID (8 hex chars, same as a truncated uuid4)."""
+    return os.urandom(4).hex()
 
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         question = input_data.get("question")
         answer = input_data.get("answer")
@@ -118,7 +141,7 @@ def main():
         result = call_life_write("questions", "append", "answered", answered_entry)
 
         if result.get("status") != "success":
-            print(json.dumps(result))
+            print_json(result)
             sys.exit(1)
 
         # Get current questions data to calculate progress
@@ -134,23 +157,24 @@ def main():
                 "questionsAsked": pending_count + answered_count
             })
 
-        print(json.dumps({
+        print_json({
             "status": "success",
             "message": f"Question marked as answered: {question[:50]}...",
             "progress": {
                 "pending": pending_count,
                 "answered": answered_count
             }
-        }))
+        })
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("mark_question_answered"):
+        main()
@@ -25,8 +25,8 @@ Output JSON:
 }
 """
 
+import os
 import sys
-import json
 import re
 import shutil
 from datetime import datetime
@@ -35,11 +35,28 @@ from pathlib import Path
 # Add parent directory to path for schema imports
 sys.path.insert(0, str(Path(__file__).parent))
 from schemas.life_schemas import get_default_data, SCHEMA_VERSION
+from _frontmatter import has_frontmatter, write_frontmatter_file
+from _json_fast import loads, print_json
+
+# Extraction patterns, compiled once for batch migrations
+_NAME_RE = re.compile(r'[-*]\s*Name:\s*(.+)', re.IGNORECASE)
+_TIMEZONE_RE = re.compile(r'[-*]\s*Timezone:\s*(.+)', re.IGNORECASE)
+_SECTION_RE = re.compile(r'##\s*(Never\s*Do|Always\s*Do|Escalate\s*When)\s*\n', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_BULLET_RE = re.compile(r'[-*]\s+(.+)')
+_MAX_CHARS_RE = re.compile(r'Maximum\s+(\d+)\s+characters', re.IGNORECASE)
+_LAST_ANALYZED_RE = re.compile(r'Last\s*Analyzed[:\s]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_CONTACT_RE = re.compile(r'[-*]\s*\*\*(.+?)\*\*\s*[-:]\s*(.+)')
+
+# Boundaries section heading (whitespace removed, lowercased) -> data key
+_SECTION_KEYS = {
+    "neverdo": "neverDo",
+    "alwaysdo": "alwaysDo",
+    "escalatewhen": "escalateWhen",
+}
 
-
-def has_frontmatter(content: str) -> bool:
-    """Check if content already has JSON frontmatter."""
-    return content.strip().startswith("---json")
+# Bytes read to detect an existing frontmatter header before a full read
+HEADER_SNIFF_BYTES = 64
 
 
 def extract_identity_data(content: str) -> dict:
@@ -47,14 +64,14 @@ def extract_identity_data(content: str) -> dict:
     data = get_default_data("identity")
 
     # Try to extract name
-    name_match = re.search(r'[-*]\s*Name:\s*(.+)', content, re.IGNORECASE)
+    name_match = _NAME_RE.search(content)
     if name_match:
         name = name_match.group(1).strip()
         if name and name != "[tenant name]":
             data["name"] = name
 
     # Try to extract timezone
-    tz_match = re.search(r'[-*]\s*Timezone:\s*(.+)', content, re.IGNORECASE)
+    tz_match = _TIMEZONE_RE.search(content)
     if tz_match:
         tz = tz_match.group(1).strip()
         if tz and tz != "[timezone]":
@@ -66,27 +83,21 @@ def extract_identity_data(content: str) -> dict:
 def extract_boundaries_data(content: str) -> dict:
     """Extract structured data from boundaries.md markdown."""
     data = get_default_data("boundaries")
+    found = set()
 
-    # Extract "Never Do" items
-    never_section = re.search(r'##\s*Never\s*Do\s*\n(.*?)(?=##|$)', content, re.DOTALL | re.IGNORECASE)
-    if never_section:
-        items = re.findall(r'[-*]\s+(.+)', never_section.group(1))
-        data["neverDo"] = [item.strip() for item in items if item.strip()]
-
-    # Extract "Always Do" items
-    always_section = re.search(r'##\s*Always\s*Do\s*\n(.*?)(?=##|$)', content, re.DOTALL | re.IGNORECASE)
-    if always_section:
-        items = re.findall(r'[-*]\s+(.+)', always_section.group(1))
-        data["alwaysDo"] = [item.strip() for item in items if item.strip()]
-
-    # Extract "Escalate When" items
-    escalate_section = re.search(r'##\s*Escalate\s*When\s*\n(.*?)(?=##|$)', content, re.DOTALL | re.IGNORECASE)
-    if escalate_section:
-        items = re.findall(r'[-*]\s+(.+)', escalate_section.group(1))
-        data["escalateWhen"] = [item.strip() for item in items if item.strip()]
+    # Find the section headings in one pass; each body runs to the next "##"
+    for heading in _SECTION_RE.finditer(content):
+        key = _SECTION_KEYS[_WHITESPACE_RE.sub("", heading.group(1)).lower()]
+        if key in found:
+            continue
+        found.add(key)
+        end = content.find("##", heading.end())
+        section = content[heading.end():end if end != -1 else len(content)]
+        items = _BULLET_RE.findall(section)
+        data[key] = [item.strip() for item in items if item.strip()]
 
     # Extract response limits
-    limit_match = re.search(r'Maximum\s+(\d+)\s+characters', content, re.IGNORECASE)
+    limit_match = _MAX_CHARS_RE.search(content)
     if limit_match:
         data["limits"]["maxResponseChars"] = int(limit_match.group(1))
 
@@ -98,7 +109,7 @@ def extract_patterns_data(content: str) -> dict:
     data = get_default_data("patterns")
 
     # Try to extract last analyzed date
-    date_match = re.search(r'Last\s*Analyzed[:\s]*(\d{4}-\d{2}-\d{2})', content, re.IGNORECASE)
+    date_match = _LAST_ANALYZED_RE.search(content)
     if date_match:
         data["lastAnalyzed"] = date_match.group(1) + "T00:00:00Z"
 
@@ -110,7 +121,7 @@ def extract_contacts_data(content: str) -> dict:
     data = get_default_data("contacts")
 
     # Look for patterns like "Name - Role" or "Name: Role"
-    contact_patterns = re.findall(r'[-*]\s*\*\*(.+?)\*\*\s*[-:]\s*(.+)', content)
+    contact_patterns = _CONTACT_RE.findall(content)
     for i, (name, role) in enumerate(contact_patterns):
         data["contacts"].append({
             "id": f"c{i+1}",
@@ -121,14 +132,14 @@ def extract_contacts_data(content: str) -> dict:
     return data
 
 
-def serialize_frontmatter(data: dict, markdown: str) -> str:
-    """Serialize data and markdown to frontmatter format."""
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    return f"---json\n{json_str}\n---\n{markdown}"
-
+def migrate_file(file_path: Path, dry_run: bool = False,
+                 now: str | None = None, backup_stamp: str | None = None) -> dict:
+    """
+    Migrate a single life file to frontmatter format.
 
-def migrate_file(file_path: Path, dry_run: bool = False) -> dict:
-    """Migrate a single life file to frontmatter format."""
+    now (ISO timestamp for lastUpdated) and backup_stamp (backup file suffix)
+    are shared across a batch by migrate_life_folder; computed if omitted.
+    """
     result = {
         "file": str(file_path),
         "action": "skipped",
@@ -140,6 +151,14 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> dict:
             result["reason"] = "File does not exist"
             return result
 
+        # Sniff the first bytes so already-migrated files are skipped
+        # without reading or decoding the rest
+        with open(file_path, "rb") as f:
+            head = f.read(HEADER_SNIFF_BYTES)
+        if head.lstrip().startswith(b"---json"):
+            result["reason"] = "Already has frontmatter"
+            return result
+
         content = file_path.read_text(encoding="utf-8")
 
         # Skip if already has frontmatter
@@ -166,10 +185,7 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> dict:
             data = get_default_data(file_name)
 
         # Update lastUpdated
-        data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-
-        # Create new content with frontmatter
-        new_content = serialize_frontmatter(data, content)
+        data["lastUpdated"] = now or datetime.utcnow().isoformat() + "Z"
 
         if dry_run:
             result["action"] = "would_migrate"
@@ -179,11 +195,12 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> dict:
         # Backup original file
         backup_dir = file_path.parent / ".backups"
         backup_dir.mkdir(exist_ok=True)
-        backup_path = backup_dir / f"{file_path.name}.{datetime.now().strftime('%Y%m%d_%H%M%S')}.bak"
+        backup_stamp = backup_stamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = backup_dir / f"{file_path.name}.{backup_stamp}.bak"
         shutil.copy2(file_path, backup_path)
 
-        # Write new content
-        file_path.write_text(new_content, encoding="utf-8")
+        # Write new content with frontmatter
+        write_frontmatter_file(file_path, data, content)
 
         result["action"] = "migrated"
         result["backup"] = str(backup_path)
@@ -195,6 +212,17 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> dict:
         return result
 
 
+def _iter_md(root: str):
+    """Yield paths of .md files under root, without descending into .backups."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != ".backups":
+                    yield from _iter_md(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry.path
+
+
 def migrate_life_folder(life_dir: Path, dry_run: bool = False) -> dict:
     """Migrate all life files in a folder."""
     results = {
@@ -209,15 +237,13 @@ def migrate_life_folder(life_dir: Path, dry_run: bool = False) -> dict:
         results["errors"].append(f"Life directory does not exist: {life_dir}")
         return results
 
-    # Find all markdown files
-    md_files = list(life_dir.rglob("*.md"))
-
-    for file_path in md_files:
-        # Skip backup files
-        if ".backups" in str(file_path):
-            continue
+    # One timestamp for the whole batch
+    now = datetime.utcnow().isoformat() + "Z"
+    backup_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        result = migrate_file(file_path, dry_run)
+    # Walk markdown files lazily (backup folders are pruned by _iter_md)
+    for path in _iter_md(str(life_dir)):
+        result = migrate_file(Path(path), dry_run, now=now, backup_stamp=backup_stamp)
 
         if result["action"] == "migrated" or result["action"] == "would_migrate":
             results["migrated"].append(result["file"])
@@ -232,8 +258,9 @@ def migrate_life_folder(life_dir: Path, dry_run: bool = False) -> dict:
 def main():
     try:
         # Check if running as tool (stdin has JSON) or CLI
-        if not sys.stdin.isatty():
-            input_data = json.loads(sys.stdin.read())
+        cli_mode = sys.stdin.isatty()
+        if not cli_mode:
+            input_data = loads(sys.stdin.buffer.read())
             tenant_id = input_data.get("tenant_id")
             dry_run = input_data.get("dry_run", False)
 
@@ -257,14 +284,15 @@ def main():
 
         results = migrate_life_folder(life_dir, dry_run)
 
-        print(json.dumps(results, indent=2))
+        # Pretty-print only for a human at the terminal
+        print_json(results, indent=cli_mode)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
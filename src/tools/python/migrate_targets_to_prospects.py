@@ -34,33 +34,16 @@ Output JSON:
 """
 
 import sys
-import json
 import re
 from pathlib import Path
 from datetime import datetime
 
+from _frontmatter import parse_frontmatter, write_frontmatter_file
+from _json_fast import loads, print_json
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse JSON frontmatter from markdown content."""
-    pattern = r'^---json\s*\n(.*?)\n---\s*\n?(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if match:
-        try:
-            json_str = match.group(1)
-            data = json.loads(json_str)
-            markdown = match.group(2)
-            return data, markdown
-        except json.JSONDecodeError:
-            return {}, content
-
-    return {}, content
 
-
-def serialize_frontmatter(data: dict, markdown: str) -> str:
-    """Serialize data and markdown back to frontmatter format."""
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    return f"---json\n{json_str}\n---\n{markdown}"
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9\s-]')
+_SLUG_COLLAPSE_RE = re.compile(r'[\s-]+')
 
 
 def get_campaign_path(campaign_name: str) -> Path:
@@ -76,51 +59,53 @@ def get_prospects_folder() -> Path:
 
 def generate_slug(name: str) -> str:
     """Generate a slug from a name (kebab-case)."""
-    slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)  # Remove special chars
-    slug = re.sub(r'\s+', '-', slug)  # Replace spaces with hyphens
-    slug = re.sub(r'-+', '-', slug)  # Collapse multiple hyphens
+    slug = _SLUG_STRIP_RE.sub('', name.lower())  # Remove special chars
+    slug = _SLUG_COLLAPSE_RE.sub('-', slug)  # Spaces/hyphen runs -> one hyphen
     slug = slug.strip('-')  # Trim leading/trailing hyphens
     return slug or "unknown"
 
 
-def ensure_unique_slug(prospects_folder: Path, base_slug: str) -> str:
-    """Ensure slug is unique by appending a number if necessary."""
-    if not prospects_folder.exists():
-        return base_slug
-
+def ensure_unique_slug(existing_slugs: set[str], base_slug: str) -> str:
+    """Ensure slug is unique by appending a number if necessary, and reserve it."""
     slug = base_slug
     counter = 1
 
-    while (prospects_folder / f"{slug}.md").exists():
+    while slug in existing_slugs:
         slug = f"{base_slug}-{counter}"
         counter += 1
 
+    existing_slugs.add(slug)
     return slug
 
 
-def find_prospect_by_email(prospects_folder: Path, email: str) -> str | None:
-    """Find an existing prospect by email address."""
-    if not prospects_folder.exists():
-        return None
+def scan_prospects(prospects_folder: Path) -> tuple[dict[str, str], set[str]]:
+    """
+    Scan the prospects folder once.
 
-    email_lower = email.lower()
+    Returns (email index mapping lowercased email -> slug, set of existing slugs).
+    """
+    index = {}
+    slugs = set()
+    if not prospects_folder.exists():
+        return index, slugs
 
     for file_path in prospects_folder.glob("*.md"):
+        slugs.add(file_path.stem)
         try:
             content = file_path.read_text(encoding="utf-8")
             frontmatter, _ = parse_frontmatter(content)
             prospect_email = frontmatter.get("email", "").lower()
-            if prospect_email == email_lower:
-                return file_path.stem
+            # First file wins, matching the order a directory scan finds them
+            index.setdefault(prospect_email, file_path.stem)
         except Exception:
             continue
 
-    return None
+    return index, slugs
 
 
 def create_prospect_file(
     prospects_folder: Path,
+    existing_slugs: set[str],
     name: str,
     email: str,
     company: str = None,
@@ -128,15 +113,16 @@ def create_prospect_file(
     phone: str = None,
     linkedin: str = None,
     research: dict = None,
-    stage: str = "identified"
+    stage: str = "identified",
+    now: str | None = None
 ) -> str:
     """Create a new prospect file and return the slug."""
     prospects_folder.mkdir(parents=True, exist_ok=True)
 
     base_slug = generate_slug(name)
-    slug = ensure_unique_slug(prospects_folder, base_slug)
+    slug = ensure_unique_slug(existing_slugs, base_slug)
 
-    now = datetime.utcnow().isoformat() + "Z"
+    now = now or datetime.utcnow().isoformat() + "Z"
 
     frontmatter = {
         "name": name,
@@ -155,35 +141,37 @@ def create_prospect_file(
     frontmatter = {k: v for k, v in frontmatter.items() if v is not None}
 
     # Build markdown body
-    markdown_parts = []
-    markdown_parts.append("## Business Context")
-
-    if research and research.get("summary"):
-        markdown_parts.append(research["summary"])
-    markdown_parts.append("")
+    research = research or {}
+    summary = f"{research['summary']}\n" if research.get("summary") else ""
+    news = "".join(f"- {item}\n" for item in research.get("news") or ())
+
+    markdown = (
+        "## Business Context\n"
+        f"{summary}\n"
+        "## Research Notes\n"
+        f"{news}\n"
+        "## Personalization Hooks\n"
+        "\n"
+        "## Interaction History\n"
+        f"### {now[:10]} - Migrated from campaign\n"
+        "Prospect created from existing campaign target data."
+    )
 
-    markdown_parts.append("## Research Notes")
-    if research and research.get("news"):
-        for item in research["news"]:
-            markdown_parts.append(f"- {item}")
-    markdown_parts.append("")
-
-    markdown_parts.append("## Personalization Hooks")
-    markdown_parts.append("")
-
-    markdown_parts.append("## Interaction History")
-    markdown_parts.append(f"### {now[:10]} - Migrated from campaign")
-    markdown_parts.append("Prospect created from existing campaign target data.")
-
-    markdown = "\n".join(markdown_parts)
-
-    content = serialize_frontmatter(frontmatter, markdown)
     file_path = prospects_folder / f"{slug}.md"
-    file_path.write_text(content, encoding="utf-8")
+    write_frontmatter_file(file_path, frontmatter, markdown)
 
     return slug
 
 
+def looks_migrated(content: str) -> bool:
+    """Cheap text check for frontmatter with target_references but no targets."""
+    if not content.startswith("---json"):
+        return False
+    end = content.find("\n---", 7)
+    header = content[:end] if end != -1 else ""
+    return '"target_references"' in header and '"targets"' not in header
+
+
 def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
     """Migrate a campaign's inline targets to prospect references."""
     campaign_path = get_campaign_path(campaign_name)
@@ -197,10 +185,13 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
         raise ValueError(f"Targets file not found at {targets_path}")
 
     content = targets_path.read_text(encoding="utf-8")
-    data, markdown = parse_frontmatter(content)
 
-    # Check if already migrated
-    if "target_references" in data and "targets" not in data:
+    # Check if already migrated - from the raw frontmatter text first, so
+    # re-runs on a migrated campaign skip the JSON decode entirely
+    data = None
+    if not looks_migrated(content):
+        data, markdown = parse_frontmatter(content)
+    if data is None or ("target_references" in data and "targets" not in data):
         return {
             "migrated": 0,
             "skipped": 0,
@@ -225,6 +216,12 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
     details = []
     new_references = []
 
+    # One timestamp for the whole batch
+    now = datetime.utcnow().isoformat() + "Z"
+
+    # Scan the prospects folder once instead of once per target
+    email_index, existing_slugs = scan_prospects(prospects_folder)
+
     for target in targets:
         target_name = target.get("name", "Unknown")
         target_email = target.get("email")
@@ -236,7 +233,7 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
 
         try:
             # Check if prospect already exists
-            existing_slug = find_prospect_by_email(prospects_folder, target_email)
+            existing_slug = email_index.get(target_email.lower())
 
             if existing_slug:
                 slug = existing_slug
@@ -248,6 +245,7 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
                 else:
                     slug = create_prospect_file(
                         prospects_folder,
+                        existing_slugs,
                         name=target_name,
                         email=target_email,
                         company=target.get("company"),
@@ -255,15 +253,17 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
                         phone=target.get("phone"),
                         linkedin=target.get("linkedin"),
                         research=target.get("research"),
-                        stage=target.get("stage", "identified")
+                        stage=target.get("stage", "identified"),
+                        now=now
                     )
+                    email_index[target_email.lower()] = slug
                     action = "created_prospect"
 
             # Create target reference
             new_ref = {
                 "id": target.get("id"),
                 "prospect_slug": slug,
-                "added_at": target.get("created_at", datetime.utcnow().isoformat() + "Z"),
+                "added_at": target.get("created_at", now),
                 "last_touch_at": None,
                 "touch_count": len(target.get("touches", [])),
                 "campaign_stage": target.get("stage", "identified"),
@@ -293,12 +293,11 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
     if not dry_run and new_references:
         new_data = {
             "version": 2,
-            "lastUpdated": datetime.utcnow().isoformat() + "Z",
+            "lastUpdated": now,
             "target_references": new_references
         }
 
-        new_content = serialize_frontmatter(new_data, markdown)
-        targets_path.write_text(new_content, encoding="utf-8")
+        write_frontmatter_file(targets_path, new_data, markdown)
 
     return {
         "migrated": migrated,
@@ -311,7 +310,7 @@ def migrate_campaign(campaign_name: str, dry_run: bool = False) -> dict:
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         campaign_name = input_data.get("campaign")
         dry_run = input_data.get("dry_run", False)
@@ -326,14 +325,14 @@ def main():
             **result
         }
 
-        print(json.dumps(output))
+        print_json(output)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
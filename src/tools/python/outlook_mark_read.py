@@ -23,8 +23,9 @@ Environment variables required:
 import sys
 import json
 import os
-import urllib.request
-import urllib.error
+
+from _daemon_client import delegate_to_daemon
+from _http_pool import HTTPError, request
 
 
 def main():
@@ -67,15 +68,14 @@ def main():
             "message_id": message_id
         }
 
-        req = urllib.request.Request(
+        response = request(
+            "POST",
             url,
-            data=json.dumps(payload).encode("utf-8"),
+            body=json.dumps(payload).encode("utf-8"),
             headers={"Content-Type": "application/json"},
-            method="POST"
+            timeout=30
         )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        result = json.loads(response.decode("utf-8"))
 
         if result.get("success"):
             print(json.dumps({
@@ -91,7 +91,7 @@ def main():
             }))
             sys.exit(1)
 
-    except urllib.error.HTTPError as e:
+    except HTTPError as e:
         print(json.dumps({
             "success": False,
             "message": None,
@@ -108,4 +108,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("outlook_mark_read"):
+        main()
@@ -10,6 +10,12 @@ Input (JSON via stdin):
     "limit": 10                            # optional, max results (default: 10)
 }
 
+Batch input - several searches run concurrently:
+{
+    "queries": [{"query": "...", "folder": "...", "limit": 10}, ...]
+}
+(a bare JSON array of search objects is accepted too)
+
 Output (JSON to stdout):
 {
     "success": true/false,
@@ -18,6 +24,13 @@ Output (JSON to stdout):
     "error": null | "error message"
 }
 
+Batch output - one single-search result per query, in input order:
+{
+    "success": true/false,     # true if every search succeeded
+    "results": [{"success": ..., "emails": [...], "count": ..., "error": ...}, ...],
+    "error": null | "error message"
+}
+
 Environment variables required:
 - TENANT_ID: The tenant ID
 - API_BASE_URL: The base URL of the ProxyStaff API
@@ -26,82 +39,132 @@ Environment variables required:
 import sys
 import json
 import os
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 
+from _daemon_client import delegate_to_daemon
+from _http_pool import HTTPError, request
 
-def main():
-    # Read JSON input from stdin
-    try:
-        input_data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError:
-        input_data = {}
 
-    tenant_id = os.environ.get("TENANT_ID")
-    api_base_url = os.environ.get("API_BASE_URL", "http://localhost:3000")
+# Maximum searches in flight at once in batch mode
+BATCH_CONCURRENCY = 8
+
+# Worker threads keep their pooled connections between batches when hosted
+# in tools_daemon.py; created on first batch
+_EXECUTOR: ThreadPoolExecutor | None = None
 
-    if not tenant_id:
-        print(json.dumps({
-            "success": False,
-            "emails": [],
-            "count": 0,
-            "error": "TENANT_ID environment variable not set"
-        }))
-        sys.exit(1)
 
+def search_emails(api_base_url: str, tenant_id: str, search: dict) -> dict:
+    """Run one search against the API and return its tool result."""
     try:
         # Build request
         url = f"{api_base_url}/api/internal/outlook/search"
         payload = {
             "tenant_id": tenant_id,
-            "query": input_data.get("query"),
-            "folder": input_data.get("folder", "inbox"),
-            "limit": input_data.get("limit", 10)
+            "query": search.get("query"),
+            "folder": search.get("folder", "inbox"),
+            "limit": search.get("limit", 10)
         }
 
-        req = urllib.request.Request(
+        response = request(
+            "POST",
             url,
-            data=json.dumps(payload).encode("utf-8"),
+            body=json.dumps(payload).encode("utf-8"),
             headers={"Content-Type": "application/json"},
-            method="POST"
+            timeout=30
         )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        result = json.loads(response.decode("utf-8"))
 
         if result.get("success"):
-            print(json.dumps({
+            return {
                 "success": True,
                 "emails": result.get("emails", []),
                 "count": result.get("count", 0),
                 "error": None
-            }))
-        else:
-            print(json.dumps({
-                "success": False,
-                "emails": [],
-                "count": 0,
-                "error": result.get("error", "Unknown error")
-            }))
-            sys.exit(1)
+            }
+        return {
+            "success": False,
+            "emails": [],
+            "count": 0,
+            "error": result.get("error", "Unknown error")
+        }
 
-    except urllib.error.HTTPError as e:
-        print(json.dumps({
+    except HTTPError as e:
+        return {
             "success": False,
             "emails": [],
             "count": 0,
             "error": f"HTTP error {e.code}: {e.reason}"
-        }))
-        sys.exit(1)
+        }
     except Exception as e:
-        print(json.dumps({
+        return {
             "success": False,
             "emails": [],
             "count": 0,
             "error": f"Failed to search emails: {str(e)}"
+        }
+
+
+def search_batch(api_base_url: str, tenant_id: str, searches: list) -> list[dict]:
+    """Run several searches concurrently, returning results in input order."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY)
+
+    searches = [search if isinstance(search, dict) else {} for search in searches]
+    return list(_EXECUTOR.map(
+        lambda search: search_emails(api_base_url, tenant_id, search),
+        searches
+    ))
+
+
+def main():
+    # Read JSON input from stdin
+    try:
+        input_data = json.loads(sys.stdin.read())
+    except json.JSONDecodeError:
+        input_data = {}
+
+    tenant_id = os.environ.get("TENANT_ID")
+    api_base_url = os.environ.get("API_BASE_URL", "http://localhost:3000")
+
+    if isinstance(input_data, list):
+        searches = input_data
+    elif isinstance(input_data, dict) and isinstance(input_data.get("queries"), list):
+        searches = input_data["queries"]
+    else:
+        searches = None
+
+    if not tenant_id:
+        error = "TENANT_ID environment variable not set"
+        if searches is not None:
+            print(json.dumps({"success": False, "results": [], "error": error}))
+        else:
+            print(json.dumps({
+                "success": False,
+                "emails": [],
+                "count": 0,
+                "error": error
+            }))
+        sys.exit(1)
+
+    if searches is not None:
+        results = search_batch(api_base_url, tenant_id, searches)
+        print(json.dumps({
+            "success": all(r["success"] for r in results),
+            "results": results,
+            "error": None
         }))
+        # Partial failures are reported per query; fail only if nothing worked
+        if results and not any(r["success"] for r in results):
+            sys.exit(1)
+        return
+
+    result = search_emails(api_base_url, tenant_id, input_data if isinstance(input_data, dict) else {})
+    print(json.dumps(result))
+    if not result["success"]:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("outlook_search"):
+        main()
@@ -26,8 +26,9 @@ Environment variables required:
 import sys
 import json
 import os
-import urllib.request
-import urllib.error
+
+from _daemon_client import delegate_to_daemon
+from _http_pool import HTTPError, request
 
 
 def main():
@@ -79,15 +80,14 @@ def main():
         if input_data.get("reply_to_id"):
             payload["reply_to_id"] = input_data["reply_to_id"]
 
-        req = urllib.request.Request(
+        response = request(
+            "POST",
             url,
-            data=json.dumps(payload).encode("utf-8"),
+            body=json.dumps(payload).encode("utf-8"),
             headers={"Content-Type": "application/json"},
-            method="POST"
+            timeout=30
         )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        result = json.loads(response.decode("utf-8"))
 
         if result.get("success"):
             print(json.dumps({
@@ -103,7 +103,7 @@ def main():
             }))
             sys.exit(1)
 
-    except urllib.error.HTTPError as e:
+    except HTTPError as e:
         print(json.dumps({
             "success": False,
             "message": None,
@@ -120,4 +120,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("outlook_send"):
+        main()
@@ -27,12 +27,32 @@ Output JSON:
 }
 """
 
+import os
 import sys
 import json
 import subprocess
 import re
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from _frontmatter import parse_frontmatter
+from _json_fast import JSONDecodeError, dumps_bytes, loads, print_json
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# campaign_write lives next to this script; call it in-process when possible
+# and only fall back to spawning it if the import fails
+try:
+    from campaign_write import run as campaign_write_run
+    from campaign_write import batch_update_targets
+except ImportError:
+    campaign_write_run = None
+    batch_update_targets = None
 
 
 def load_env_from_cwd():
@@ -47,6 +67,25 @@ def load_env_from_cwd():
                 os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
 
 
+# Address in a "Name <email@example.com>" header
+_ANGLE_EMAIL_RE = re.compile(r'<([^>]+)>')
+
+# Maximum gmail_read calls in flight at once
+READ_CONCURRENCY = 8
+
+# Append-only log of processed email IDs (one JSON string per line), in state/
+PROCESSED_LOG_NAME = "processed_replies.jsonl"
+# Processed IDs kept when the log is compacted
+PROCESSED_IDS_KEPT = 1000
+# Compact once the log passes this size (roughly 10x PROCESSED_IDS_KEPT
+# Gmail IDs); checked with fstat so appends never re-read the log
+PROCESSED_LOG_COMPACT_BYTES = 256 * 1024
+
+# Parsed targets.md emails keyed by path, with the mtime/size they were
+# parsed at; persisted in state/ between runs
+TARGET_CACHE_NAME = "target_emails.cache.json"
+_TARGET_CACHE: dict | None = None
+
 # Intent detection patterns
 INTENT_PATTERNS = {
     "interested": [
@@ -80,59 +119,112 @@ INTENT_PATTERNS = {
 }
 
 
+# Intent -> (sentiment, suggested_stage, suggested_action)
+_INTENT_DECISION = {
+    "unsubscribe": ("negative", "lost", "mark_unsubscribed"),
+    "interested": ("positive", "replied", "follow_up_with_details"),
+    "meeting_request": ("positive", "qualified", "schedule_meeting"),
+    "not_interested": ("negative", "lost", "close_target"),
+    "out_of_office": ("neutral", None, "wait_and_retry"),
+    "question": ("neutral", "replied", "answer_question"),
+}
+# No intent matched
+_DEFAULT_DECISION = ("neutral", "replied", "review_manually")
+
+# Lowercased pattern -> (position in INTENT_PATTERNS, intent, pattern)
+_PATTERN_INFO = {
+    pattern.lower(): (i, intent, pattern)
+    for i, (intent, pattern) in enumerate(
+        (intent, pattern) for intent, patterns in INTENT_PATTERNS.items() for pattern in patterns
+    )
+}
+
+# Patterns that settle the intent on their own: an unsubscribe request
+# overrides everything else (as in the app's reply analyzer), and an
+# autoresponder header means no human read the email
+_UNSUBSCRIBE_PATTERNS = frozenset(p.lower() for p in INTENT_PATTERNS["unsubscribe"])
+_AUTOREPLY_PATTERNS = frozenset(["auto-reply", "automatic reply"])
+
+
+def _build_pattern_matcher():
+    """
+    Build a one-pass matcher for every intent pattern.
+
+    Returns a function yielding the lowercased patterns found in lowercased
+    content as the scan reaches them (a pattern may repeat), so callers can
+    stop early. Uses an Aho-Corasick automaton when pyahocorasick is
+    installed, otherwise one regex alternation tried at every position.
+    """
+    patterns = {pattern.lower() for group in INTENT_PATTERNS.values() for pattern in group}
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+
+        def iter_automaton(text: str):
+            for _, pattern in automaton.iter(text):
+                yield pattern
+
+        return iter_automaton
+
+    # The lookahead reports the longest pattern starting at each position;
+    # shorter patterns hidden inside it are added from `contained`
+    longest_first = sorted(patterns, key=len, reverse=True)
+    regex = re.compile("(?=(" + "|".join(map(re.escape, longest_first)) + "))")
+    contained = {p: {q for q in patterns if q in p} for p in patterns}
+
+    def iter_regex(text: str):
+        for match in regex.finditer(text):
+            yield from contained[match.group(1)]
+
+    return iter_regex
+
+
+_iter_patterns = _build_pattern_matcher()
+
+
 def analyze_reply(content: str) -> dict:
     """Analyze reply content for intent and sentiment."""
-    lower_content = content.lower()
-    matched_keywords = []
-    intent_scores = {}
+    found = set()
+    for pattern in _iter_patterns(content.lower()):
+        if pattern in _UNSUBSCRIBE_PATTERNS:
+            # Definitive - no need to scan or score the rest
+            sentiment, suggested_stage, suggested_action = _INTENT_DECISION["unsubscribe"]
+            return {
+                "sentiment": sentiment,
+                "intent": "unsubscribe",
+                "confidence": 0.95,
+                "suggested_stage": suggested_stage,
+                "suggested_action": suggested_action,
+                "keywords_matched": [pattern]
+            }
+        found.add(pattern)
+
+    if found & _AUTOREPLY_PATTERNS:
+        sentiment, suggested_stage, suggested_action = _INTENT_DECISION["out_of_office"]
+        return {
+            "sentiment": sentiment,
+            "intent": "out_of_office",
+            "confidence": 0.9,
+            "suggested_stage": suggested_stage,
+            "suggested_action": suggested_action,
+            "keywords_matched": [p for p in INTENT_PATTERNS["out_of_office"] if p.lower() in found]
+        }
 
-    # Score each intent
-    for intent, patterns in INTENT_PATTERNS.items():
-        intent_scores[intent] = 0
-        for pattern in patterns:
-            if pattern.lower() in lower_content:
-                intent_scores[intent] += 1
-                matched_keywords.append(pattern)
-
-    # Find highest scoring intent
-    top_intent = "unknown"
-    top_score = 0
-    for intent, score in intent_scores.items():
-        if score > top_score:
-            top_score = score
-            top_intent = intent
+    # Score each intent from the patterns found, not by re-testing every
+    # pattern; keywords are reported in INTENT_PATTERNS order
+    matched = sorted((_PATTERN_INFO[pattern] for pattern in found), key=lambda info: info[0])
+    matched_keywords = [pattern for _, _, pattern in matched]
+    intent_scores = Counter(intent for _, intent, _ in matched)
+
+    # Find highest scoring intent; ties go to the intent counted first,
+    # i.e. the earlier one in INTENT_PATTERNS
+    top_intent, top_score = intent_scores.most_common(1)[0] if intent_scores else ("unknown", 0)
 
     # Determine sentiment and suggested action
-    sentiment = "neutral"
-    suggested_stage = None
-    suggested_action = None
-
-    if top_intent == "unsubscribe":
-        sentiment = "negative"
-        suggested_stage = "lost"
-        suggested_action = "mark_unsubscribed"
-    elif top_intent == "interested":
-        sentiment = "positive"
-        suggested_stage = "replied"
-        suggested_action = "follow_up_with_details"
-    elif top_intent == "meeting_request":
-        sentiment = "positive"
-        suggested_stage = "qualified"
-        suggested_action = "schedule_meeting"
-    elif top_intent == "not_interested":
-        sentiment = "negative"
-        suggested_stage = "lost"
-        suggested_action = "close_target"
-    elif top_intent == "out_of_office":
-        sentiment = "neutral"
-        suggested_action = "wait_and_retry"
-    elif top_intent == "question":
-        sentiment = "neutral"
-        suggested_stage = "replied"
-        suggested_action = "answer_question"
-    else:
-        suggested_stage = "replied"
-        suggested_action = "review_manually"
+    sentiment, suggested_stage, suggested_action = _INTENT_DECISION.get(top_intent, _DEFAULT_DECISION)
 
     confidence = min(0.9, 0.3 + (top_score * 0.15))
 
@@ -146,14 +238,76 @@ def analyze_reply(content: str) -> dict:
     }
 
 
+@lru_cache(maxsize=4096)
+def _extract_addr(from_header: str) -> str:
+    """Lowercased address from a "Name <email@example.com>" or bare From header."""
+    from_header = from_header.lower()
+    email_match = _ANGLE_EMAIL_RE.search(from_header)
+    return email_match.group(1) if email_match else from_header
+
+
+def load_target_cache() -> dict:
+    """Load the persisted targets.md parse cache, or {} if missing or unreadable."""
+    global _TARGET_CACHE
+    if _TARGET_CACHE is None:
+        try:
+            data = loads((Path("state") / TARGET_CACHE_NAME).read_bytes())
+            _TARGET_CACHE = data if isinstance(data, dict) else {}
+        except (OSError, JSONDecodeError):
+            _TARGET_CACHE = {}
+    return _TARGET_CACHE
+
+
+def save_target_cache(cache: dict):
+    """Persist the targets.md parse cache atomically; failures are ignored."""
+    state_dir = Path("state")
+    cache_file = state_dir / TARGET_CACHE_NAME
+    tmp_file = cache_file.with_name(TARGET_CACHE_NAME + ".tmp")
+    try:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(dumps_bytes(cache))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is an optimisation; never fail the run over it
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def read_campaign_targets(campaign: str, targets_file: Path) -> dict:
+    """Parse one targets.md into {email: {campaign, target_id, name, stage}}."""
+    target_emails = {}
+    data, _ = parse_frontmatter(targets_file.read_text(encoding="utf-8"))
+    for target in data.get("targets", []):
+        email = target.get("email")
+        if email:
+            target_emails[email.lower()] = {
+                "campaign": campaign,
+                "target_id": target.get("id"),
+                "target_name": target.get("name"),
+                "current_stage": target.get("stage")
+            }
+    return target_emails
+
+
 def get_campaign_target_emails(campaign_name: str = None) -> dict:
-    """Get all target emails from campaigns."""
+    """
+    Get all target emails from campaigns.
+
+    Each targets.md is only parsed when its mtime or size changed since the
+    last run; otherwise its emails come from state/target_emails.cache.json.
+    """
     target_emails = {}  # email -> {campaign, target_id, name}
 
     campaigns_dir = Path("operations") / "campaigns"
     if not campaigns_dir.exists():
         return target_emails
 
+    cache = load_target_cache()
+    seen = set()
+    changed = False
+
     for campaign_path in campaigns_dir.iterdir():
         if not campaign_path.is_dir():
             continue
@@ -162,55 +316,71 @@ def get_campaign_target_emails(campaign_name: str = None) -> dict:
             continue
 
         targets_file = campaign_path / "targets.md"
-        if not targets_file.exists():
+        try:
+            st = targets_file.stat()
+        except OSError:
             continue
 
-        # Parse frontmatter
-        content = targets_file.read_text(encoding="utf-8")
-        match = re.match(r'^---json\s*\n(.*?)\n---', content, re.DOTALL)
-        if not match:
-            continue
+        key = str(targets_file)
+        seen.add(key)
+        entry = cache.get(key)
+        if not (isinstance(entry, dict) and entry.get("mtime_ns") == st.st_mtime_ns
+                and entry.get("size") == st.st_size):
+            entry = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "emails": read_campaign_targets(campaign_path.name, targets_file)
+            }
+            cache[key] = entry
+            changed = True
 
-        try:
-            data = json.loads(match.group(1))
-            for target in data.get("targets", []):
-                email = target.get("email")
-                if email:
-                    target_emails[email.lower()] = {
-                        "campaign": campaign_path.name,
-                        "target_id": target.get("id"),
-                        "target_name": target.get("name"),
-                        "current_stage": target.get("stage")
-                    }
-        except json.JSONDecodeError:
-            continue
+        target_emails.update(entry["emails"])
+
+    # Forget campaigns that are gone (only known after a full scan)
+    if not campaign_name:
+        for key in [k for k in cache if k not in seen]:
+            del cache[key]
+            changed = True
+
+    if changed:
+        save_target_cache(cache)
 
     return target_emails
 
 
+def find_gmail_script(name: str) -> Path | None:
+    """Locate a gmail tool script in the shared tools or the tenant's execution folder."""
+    gmail_script = Path(__file__).parent.parent.parent / "tools" / "python" / name
+    if not gmail_script.exists():
+        # Try execution folder
+        gmail_script = Path("execution") / name
+    return gmail_script if gmail_script.exists() else None
+
+
+def call_tool(script: Path, payload: dict, timeout: int) -> dict | None:
+    """Run a tool script as a subprocess and return its JSON output, or None on failure."""
+    result = subprocess.run(
+        ["python", str(script)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+
+    if result.returncode == 0:
+        return json.loads(result.stdout)
+    return None
+
+
 def search_gmail(query: str, max_results: int = 50) -> list:
     """Search Gmail using the gmail_search tool."""
     try:
-        gmail_script = Path(__file__).parent.parent.parent / "tools" / "python" / "gmail_search.py"
-        if not gmail_script.exists():
-            # Try execution folder
-            gmail_script = Path("execution") / "gmail_search.py"
-
-        if not gmail_script.exists():
+        gmail_script = find_gmail_script("gmail_search.py")
+        if gmail_script is None:
             return []
 
-        result = subprocess.run(
-            ["python", str(gmail_script)],
-            input=json.dumps({"query": query, "max_results": max_results}),
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode == 0:
-            output = json.loads(result.stdout)
-            return output.get("emails", [])
-        return []
+        output = call_tool(gmail_script, {"query": query, "max_results": max_results}, timeout=60)
+        return output.get("emails", []) if output else []
     except Exception:
         return []
 
@@ -218,40 +388,49 @@ def search_gmail(query: str, max_results: int = 50) -> list:
 def read_gmail(email_id: str) -> dict:
     """Read a specific email using gmail_read tool."""
     try:
-        gmail_script = Path(__file__).parent.parent.parent / "tools" / "python" / "gmail_read.py"
-        if not gmail_script.exists():
-            gmail_script = Path("execution") / "gmail_read.py"
-
-        if not gmail_script.exists():
+        gmail_script = find_gmail_script("gmail_read.py")
+        if gmail_script is None:
             return {}
 
-        result = subprocess.run(
-            ["python", str(gmail_script)],
-            input=json.dumps({"email_id": email_id}),
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        return {}
+        return call_tool(gmail_script, {"email_id": email_id}, timeout=30) or {}
     except Exception:
         return {}
 
 
+def read_gmail_batch(email_ids: list[str]) -> dict[str, dict]:
+    """
+    Read several emails concurrently.
+
+    Returns {email_id: email} ({} for any that failed). gmail_read takes one
+    ID per call, so the calls are overlapped rather than run back to back.
+    """
+    if not email_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(READ_CONCURRENCY, len(email_ids))) as executor:
+        return dict(zip(email_ids, executor.map(read_gmail, email_ids)))
+
+
 def update_target_stage(campaign: str, target_id: str, stage: str) -> bool:
     """Update target stage using campaign_write tool."""
+    payload = {
+        "operation": "update_target",
+        "campaign": campaign,
+        "target_id": target_id,
+        "data": {"stage": stage}
+    }
+
+    if campaign_write_run is not None:
+        try:
+            campaign_write_run(payload)
+            return True
+        except Exception:
+            return False
+
     try:
         script = Path(__file__).parent / "campaign_write.py"
         result = subprocess.run(
             ["python", str(script)],
-            input=json.dumps({
-                "operation": "update_target",
-                "campaign": campaign,
-                "target_id": target_id,
-                "data": {"stage": stage}
-            }),
+            input=json.dumps(payload),
             capture_output=True,
             text=True,
             timeout=30
@@ -261,32 +440,97 @@ def update_target_stage(campaign: str, target_id: str, stage: str) -> bool:
         return False
 
 
+def apply_stage_updates(pending_updates: dict[str, list]):
+    """
+    Write queued stage changes, one targets.md rewrite per campaign.
+
+    pending_updates maps campaign -> [(target_id, stage, detail), ...]; each
+    detail gets stage_updated/new_stage filled in.
+    """
+    for campaign, updates in pending_updates.items():
+        if batch_update_targets is not None:
+            try:
+                targets = batch_update_targets(
+                    campaign,
+                    [(target_id, {"stage": stage}) for target_id, stage, _ in updates]
+                )
+                succeeded = {target_id for target_id, target in targets.items() if target is not None}
+            except Exception:
+                succeeded = set()
+            results = [target_id in succeeded for target_id, _, _ in updates]
+        else:
+            results = [update_target_stage(campaign, target_id, stage) for target_id, stage, _ in updates]
+
+        for (_, stage, detail), success in zip(updates, results):
+            detail["stage_updated"] = success
+            detail["new_stage"] = stage if success else None
+
+
 def load_processed_ids() -> set:
-    """Load already processed email IDs."""
+    """
+    Load already processed email IDs.
+
+    Combines the append-only log written by this tool with the JSON file the
+    app's reply processor keeps, so replies handled by either are skipped.
+    """
+    ids = set()
+
     state_file = Path("state") / "processed_replies.json"
     if state_file.exists():
         try:
-            data = json.loads(state_file.read_text())
-            return set(data.get("processed_ids", []))
+            data = loads(state_file.read_bytes())
+            ids.update(data.get("processed_ids", []))
         except Exception:
             pass
-    return set()
+
+    ids.update(read_processed_log())
+    return ids
 
 
-def save_processed_ids(ids: set):
-    """Save processed email IDs."""
+def read_processed_log() -> list[str]:
+    """Read the processed-ID log in append order, skipping unreadable lines."""
+    log_file = Path("state") / PROCESSED_LOG_NAME
+    ids = []
+    try:
+        with open(log_file, "rb") as f:
+            for line in f:
+                try:
+                    ids.append(loads(line))
+                except JSONDecodeError:
+                    continue
+    except OSError:
+        pass
+    return ids
+
+
+def save_processed_ids(new_ids: list[str]):
+    """
+    Append newly processed email IDs to the log.
+
+    Only the new IDs are written, rather than rewriting the whole state
+    file each run. Once the log grows past PROCESSED_LOG_COMPACT_BYTES it is
+    rewritten with only the newest PROCESSED_IDS_KEPT IDs.
+    """
+    if not new_ids:
+        return
+
     state_dir = Path("state")
     state_dir.mkdir(parents=True, exist_ok=True)
-    state_file = state_dir / "processed_replies.json"
+    log_file = state_dir / PROCESSED_LOG_NAME
 
-    # Keep only last 1000
-    ids_list = list(ids)[-1000:]
+    with open(log_file, "ab") as f:
+        f.write(b"".join(dumps_bytes(email_id) + b"\n" for email_id in new_ids))
+        f.flush()
+        log_size = os.fstat(f.fileno()).st_size
 
-    data = {
-        "processed_ids": ids_list,
-        "last_updated": datetime.utcnow().isoformat() + "Z"
-    }
-    state_file.write_text(json.dumps(data, indent=2))
+    if log_size > PROCESSED_LOG_COMPACT_BYTES:
+        logged = read_processed_log()
+        # Newest occurrence wins, oldest IDs drop off first
+        kept = list(dict.fromkeys(reversed(logged)))[:PROCESSED_IDS_KEPT]
+        tmp_file = log_file.with_name(PROCESSED_LOG_NAME + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(dumps_bytes(email_id) + b"\n" for email_id in reversed(kept)))
+        os.replace(tmp_file, log_file)
 
 
 def main():
@@ -296,7 +540,7 @@ def main():
         input_data = {}
         stdin_content = sys.stdin.read().strip()
         if stdin_content:
-            input_data = json.loads(stdin_content)
+            input_data = loads(stdin_content)
 
         campaign_filter = input_data.get("campaign")
         hours_back = input_data.get("hours_back", 24)
@@ -312,7 +556,7 @@ def main():
                 "replies_found": 0,
                 "processed": 0
             }
-            print(json.dumps(result))
+            print_json(result)
             return
 
         # Build Gmail query for target emails
@@ -331,38 +575,47 @@ def main():
                 "replies_found": 0,
                 "processed": 0
             }
-            print(json.dumps(result))
+            print_json(result)
             return
 
         # Load processed IDs
         processed_ids = load_processed_ids()
 
-        # Process each reply
-        details = []
-        unsubscribes = 0
-        positive = 0
-        negative = 0
-        processed = 0
-
+        # Pick out new replies from targets first, so their full content
+        # can be fetched together
+        replies = []
+        seen_ids = set()
         for email in emails:
             email_id = email.get("id")
-            if not email_id or email_id in processed_ids:
+            if not email_id or email_id in processed_ids or email_id in seen_ids:
                 continue
 
-            from_email = email.get("from", "").lower()
-            # Extract email address from "Name <email@example.com>" format
-            email_match = re.search(r'<([^>]+)>', from_email)
-            if email_match:
-                from_email = email_match.group(1).lower()
+            from_email = _extract_addr(email.get("from", ""))
 
             # Check if from a target
             if from_email not in target_emails:
                 continue
 
+            seen_ids.add(email_id)
+            replies.append((email, email_id, from_email))
+
+        # Read full email content
+        full_emails = read_gmail_batch([email_id for _, email_id, _ in replies])
+
+        # Process each reply
+        details = []
+        unsubscribes = 0
+        positive = 0
+        negative = 0
+        processed = 0
+        # campaign -> [(target_id, stage, detail), ...]
+        pending_updates = {}
+        new_ids = []
+
+        for email, email_id, from_email in replies:
             target_info = target_emails[from_email]
 
-            # Read full email content
-            full_email = read_gmail(email_id)
+            full_email = full_emails[email_id]
             body = full_email.get("body", email.get("snippet", ""))
 
             # Analyze reply
@@ -395,23 +648,21 @@ def main():
                 current_idx = stages.index(current_stage) if current_stage in stages else 0
                 suggested_idx = stages.index(suggested_stage) if suggested_stage in stages else 0
 
-                # Only advance (or mark lost)
+                # Only advance (or mark lost); written per campaign after the loop
                 if suggested_stage == "lost" or suggested_idx > current_idx:
-                    success = update_target_stage(
-                        target_info["campaign"],
-                        target_info["target_id"],
-                        suggested_stage
+                    pending_updates.setdefault(target_info["campaign"], []).append(
+                        (target_info["target_id"], suggested_stage, detail)
                     )
-                    detail["stage_updated"] = success
-                    detail["new_stage"] = suggested_stage if success else None
 
             details.append(detail)
             processed += 1
-            processed_ids.add(email_id)
+            new_ids.append(email_id)
+
+        apply_stage_updates(pending_updates)
 
         # Save processed IDs
         if not dry_run:
-            save_processed_ids(processed_ids)
+            save_processed_ids(new_ids)
 
         result = {
             "status": "success",
@@ -423,14 +674,14 @@ def main():
             "dry_run": dry_run,
             "details": details
         }
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
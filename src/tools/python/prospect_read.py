@@ -5,10 +5,12 @@ prospect_read.py - Read prospect data from relationships/prospects/
 Input JSON:
 {
     "slug": "john-smith",       # optional - specific prospect by slug
-    "email": "john@example.com" # optional - find by email
+    "email": "john@example.com", # optional - find by email
+    "with_sections": false       # optional - include body sections when listing
 }
 
-If neither slug nor email provided, lists all prospects.
+If neither slug nor email provided, lists all prospects. Listed prospects
+carry only slug and frontmatter unless with_sections is true.
 
 Output JSON:
 {
@@ -19,27 +21,23 @@ Output JSON:
 }
 """
 
+import os
 import sys
-import json
 import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+from _frontmatter import parse_frontmatter, read_frontmatter
+from _json_fast import loads, print_json
+from _prospect_index import load_index, save_index
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse JSON frontmatter from markdown content."""
-    pattern = r'^---json\s*\n(.*?)\n---\s*\n?(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
 
-    if match:
-        try:
-            json_str = match.group(1)
-            data = json.loads(json_str)
-            markdown = match.group(2)
-            return data, markdown
-        except json.JSONDecodeError:
-            return {}, content
+# Worker threads used to read prospect files in list_prospects
+LIST_WORKERS = 16
 
-    return {}, content
+_SECTION_RE = re.compile(
+    r'## (Business Context|Research Notes|Personalization Hooks|Interaction History)\s*\n([\s\S]*?)(?=\n## |$)'
+)
 
 
 def parse_body_sections(markdown: str) -> dict:
@@ -51,9 +49,7 @@ def parse_body_sections(markdown: str) -> dict:
         "interaction_history": ""
     }
 
-    section_pattern = r'## (Business Context|Research Notes|Personalization Hooks|Interaction History)\s*\n([\s\S]*?)(?=\n## |$)'
-
-    for match in re.finditer(section_pattern, markdown):
+    for match in _SECTION_RE.finditer(markdown):
         section_name = match.group(1)
         section_content = match.group(2).strip()
 
@@ -74,16 +70,23 @@ def get_prospects_folder() -> Path:
     return Path("relationships") / "prospects"
 
 
-def read_prospect(slug: str) -> dict | None:
+def read_prospect(slug: str, *, with_sections: bool = True) -> dict | None:
     """Read a single prospect by slug."""
     prospects_folder = get_prospects_folder()
     file_path = prospects_folder / f"{slug}.md"
 
-    if not file_path.exists():
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
+    return parse_prospect(slug, content, with_sections=with_sections)
+
 
-    content = file_path.read_text(encoding="utf-8")
+def parse_prospect(slug: str, content: str, *, with_sections: bool = True) -> dict:
+    """Build a prospect dict from a prospect file's content, optionally without body sections."""
     frontmatter, markdown = parse_frontmatter(content)
+    if not with_sections:
+        return {"slug": slug, "frontmatter": frontmatter}
     sections = parse_body_sections(markdown)
 
     return {
@@ -102,43 +105,91 @@ def find_prospect_by_email(email: str) -> dict | None:
 
     email_lower = email.lower()
 
+    # Try the email index first; entries are only trusted if the file agrees
+    loaded_index = load_index(prospects_folder)
+    slug = loaded_index.get(email_lower)
+    if slug:
+        prospect = read_prospect(slug)
+        if prospect and str(prospect["frontmatter"].get("email") or "").lower() == email_lower:
+            return prospect
+
+    # Missing or stale index: scan every prospect and rebuild it. Only the
+    # frontmatter is needed here, so only the matching file's body is read
+    index = {}
+    match_path = None
     for file_path in prospects_folder.glob("*.md"):
         try:
-            content = file_path.read_text(encoding="utf-8")
-            frontmatter, _ = parse_frontmatter(content)
+            frontmatter = read_frontmatter(file_path)
             prospect_email = frontmatter.get("email", "").lower()
-            if prospect_email == email_lower:
-                slug = file_path.stem
-                return read_prospect(slug)
+            if prospect_email and prospect_email not in index:
+                index[prospect_email] = file_path.stem
+                if prospect_email == email_lower:
+                    match_path = file_path
         except Exception:
             continue
+    # Unknown emails are the common miss; don't rewrite an index that is current
+    if index != loaded_index:
+        save_index(prospects_folder, index)
+
+    if match_path is None:
+        return None
+    return _load_prospect_file((match_path.stem, str(match_path)))
 
-    return None
 
+def _load_prospect_file(entry: tuple[str, str], with_sections: bool = True) -> dict | None:
+    """Read and parse one (slug, path) prospect file; None if unreadable."""
+    slug, path = entry
+    try:
+        if not with_sections:
+            # Frontmatter only - the body is never read
+            return {"slug": slug, "frontmatter": read_frontmatter(path)}
+        with open(path, encoding="utf-8") as f:
+            return parse_prospect(slug, f.read())
+    except Exception:
+        return None
 
-def list_prospects() -> list[dict]:
-    """List all prospects."""
+
+def list_prospects(*, with_sections: bool = False) -> list[dict]:
+    """List all prospects; body sections are only parsed if with_sections."""
     prospects_folder = get_prospects_folder()
 
     if not prospects_folder.exists():
         return []
 
+    # One directory pass; each file is then opened directly, without the
+    # Path/exists() round trips read_prospect does for a single slug
+    with os.scandir(prospects_folder) as entries:
+        files = [
+            (entry.name[:-3], entry.path)
+            for entry in entries
+            if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+    # Files are independent, so read and parse them on a thread pool
+    # (order is preserved by map)
     prospects = []
-    for file_path in prospects_folder.glob("*.md"):
-        try:
-            slug = file_path.stem
-            prospect = read_prospect(slug)
-            if prospect:
-                prospects.append(prospect)
-        except Exception:
-            continue
+    if files:
+        with ThreadPoolExecutor(max_workers=min(LIST_WORKERS, len(files))) as executor:
+            prospects = [
+                p for p in executor.map(lambda entry: _load_prospect_file(entry, with_sections), files) if p
+            ]
+
+    index = {}
+    for prospect in prospects:
+        prospect_email = str(prospect["frontmatter"].get("email") or "").lower()
+        if prospect_email:
+            index.setdefault(prospect_email, prospect["slug"])
+
+    # Every file was just read, so refresh the email index if it drifted
+    if index != load_index(prospects_folder):
+        save_index(prospects_folder, index)
 
     return prospects
 
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         slug = input_data.get("slug")
         email = input_data.get("email")
@@ -156,7 +207,7 @@ def main():
                     "status": "error",
                     "message": f"Prospect '{slug}' not found"
                 }
-                print(json.dumps(result))
+                print_json(result)
                 sys.exit(1)
 
         elif email:
@@ -172,26 +223,26 @@ def main():
                     "status": "error",
                     "message": f"No prospect found with email '{email}'"
                 }
-                print(json.dumps(result))
+                print_json(result)
                 sys.exit(1)
 
         else:
             # List all prospects
-            prospects = list_prospects()
+            prospects = list_prospects(with_sections=bool(input_data.get("with_sections", False)))
             result = {
                 "status": "success",
                 "prospects": prospects,
                 "count": len(prospects)
             }
 
-        print(json.dumps(result))
+        print_json(result)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
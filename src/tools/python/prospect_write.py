@@ -33,34 +33,31 @@ Output JSON:
 }
 """
 
+import os
 import sys
-import json
 import re
 from pathlib import Path
 from datetime import datetime
 
+from _frontmatter import parse_frontmatter
+from _json_fast import dumps_pretty_bytes, loads, print_json
+from _prospect_index import index_prospect
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse JSON frontmatter from markdown content."""
-    pattern = r'^---json\s*\n(.*?)\n---\s*\n?(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
 
-    if match:
-        try:
-            json_str = match.group(1)
-            data = json.loads(json_str)
-            markdown = match.group(2)
-            return data, markdown
-        except json.JSONDecodeError:
-            return {}, content
-
-    return {}, content
+_SECTION_RE = re.compile(
+    r'## (Business Context|Research Notes|Personalization Hooks|Interaction History)\s*\n([\s\S]*?)(?=\n## |$)'
+)
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHENS_RE = re.compile(r'-+')
 
-
-def serialize_frontmatter(data: dict, markdown: str) -> str:
-    """Serialize data and markdown back to frontmatter format."""
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    return f"---json\n{json_str}\n---\n{markdown}"
+# Body sections in file order, with the UTF-8 text that precedes each
+_BODY_HEADINGS = (
+    ("business_context", b"## Business Context\n"),
+    ("research_notes", b"\n\n## Research Notes\n"),
+    ("personalization_hooks", b"\n\n## Personalization Hooks\n"),
+    ("interaction_history", b"\n\n## Interaction History\n"),
+)
 
 
 def parse_body_sections(markdown: str) -> dict:
@@ -72,9 +69,7 @@ def parse_body_sections(markdown: str) -> dict:
         "interaction_history": ""
     }
 
-    section_pattern = r'## (Business Context|Research Notes|Personalization Hooks|Interaction History)\s*\n([\s\S]*?)(?=\n## |$)'
-
-    for match in re.finditer(section_pattern, markdown):
+    for match in _SECTION_RE.finditer(markdown):
         section_name = match.group(1)
         section_content = match.group(2).strip()
 
@@ -90,39 +85,60 @@ def parse_body_sections(markdown: str) -> dict:
     return sections
 
 
-def build_markdown_body(
-    business_context: str = "",
-    research_notes: str = "",
-    personalization_hooks: str = "",
-    interaction_history: str = ""
-) -> str:
-    """Build markdown body from sections."""
-    sections = []
+def write_prospect_file(file_path: Path, frontmatter: dict, sections: dict):
+    """
+    Write a prospect file straight from its parts as UTF-8 bytes.
 
-    sections.append("## Business Context")
-    sections.append(business_context)
-    sections.append("")
-
-    sections.append("## Research Notes")
-    sections.append(research_notes)
-    sections.append("")
+    Headings are pre-encoded and each section is encoded once, instead of
+    joining the body, formatting the document and encoding it again. The
+    file is written to <name>.tmp and renamed over the original.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"---json\n")
+            f.write(dumps_pretty_bytes(frontmatter))
+            f.write(b"\n---\n")
+            for key, heading in _BODY_HEADINGS:
+                f.write(heading)
+                f.write(sections.get(key, "").encode("utf-8"))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Never leave a half-written temp file behind
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
 
-    sections.append("## Personalization Hooks")
-    sections.append(personalization_hooks)
-    sections.append("")
 
-    sections.append("## Interaction History")
-    sections.append(interaction_history)
+def fsync_directory(folder: Path):
+    """
+    Flush a directory's entries (the renames done in it) to disk.
 
-    return "\n".join(sections)
+    Called once after all of an operation's writes rather than per file.
+    No-op where directories cannot be opened (e.g. Windows).
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        dir_fd = os.open(str(folder), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 def generate_slug(name: str) -> str:
     """Generate a slug from a name (kebab-case)."""
     slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)  # Remove special chars
-    slug = re.sub(r'\s+', '-', slug)  # Replace spaces with hyphens
-    slug = re.sub(r'-+', '-', slug)  # Collapse multiple hyphens
+    slug = _SLUG_STRIP_RE.sub('', slug)  # Remove special chars
+    slug = _WHITESPACE_RE.sub('-', slug)  # Replace spaces with hyphens
+    slug = _HYPHENS_RE.sub('-', slug)  # Collapse multiple hyphens
     slug = slug.strip('-')  # Trim leading/trailing hyphens
     return slug
 
@@ -187,16 +203,14 @@ def create_prospect(data: dict) -> tuple[str, dict]:
     # Remove None values
     frontmatter = {k: v for k, v in frontmatter.items() if v is not None}
 
-    markdown = build_markdown_body(
-        data.get("business_context", ""),
-        data.get("research_notes", ""),
-        data.get("personalization_hooks", ""),
-        ""
-    )
-
-    content = serialize_frontmatter(frontmatter, markdown)
     file_path = prospects_folder / f"{slug}.md"
-    file_path.write_text(content, encoding="utf-8")
+    write_prospect_file(file_path, frontmatter, {
+        "business_context": data.get("business_context", ""),
+        "research_notes": data.get("research_notes", ""),
+        "personalization_hooks": data.get("personalization_hooks", "")
+    })
+    index_prospect(prospects_folder, slug, email)
+    fsync_directory(prospects_folder)
 
     return slug, {
         "slug": slug,
@@ -220,6 +234,7 @@ def update_prospect(slug: str, updates: dict) -> dict:
     frontmatter, markdown = parse_frontmatter(content)
     sections = parse_body_sections(markdown)
 
+    old_email = frontmatter.get("email", "")
     now = datetime.utcnow().isoformat() + "Z"
     frontmatter["updated_at"] = now
 
@@ -244,15 +259,10 @@ def update_prospect(slug: str, updates: dict) -> dict:
         else:
             sections["interaction_history"] = updates["interaction_history_append"]
 
-    markdown = build_markdown_body(
-        sections["business_context"],
-        sections["research_notes"],
-        sections["personalization_hooks"],
-        sections["interaction_history"]
-    )
-
-    content = serialize_frontmatter(frontmatter, markdown)
-    file_path.write_text(content, encoding="utf-8")
+    write_prospect_file(file_path, frontmatter, sections)
+    if frontmatter.get("email", "") != old_email:
+        index_prospect(prospects_folder, slug, frontmatter.get("email", ""), old_email)
+    fsync_directory(prospects_folder)
 
     return {
         "slug": slug,
@@ -263,7 +273,7 @@ def update_prospect(slug: str, updates: dict) -> dict:
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         operation = input_data.get("operation")
         slug = input_data.get("slug")
@@ -296,14 +306,14 @@ def main():
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
-        print(json.dumps(result))
+        print_json(result)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
@@ -27,89 +27,77 @@ Output JSON:
 """
 
 import sys
-import json
 import uuid
-from pathlib import Path
 from datetime import datetime, timedelta
 
+from _json_fast import dumps_bytes, loads, print_json
+from _pending_approvals import (
+    LOG_COMPACT_BYTES,
+    append_action,
+    load_pending_approvals,
+    save_pending_approvals,
+)
+from _tool import tool_main
 
-def load_pending_approvals() -> dict:
-    """Load pending approvals file."""
-    state_dir = Path("state")
-    file_path = state_dir / "pending_approvals.json"
 
-    if not file_path.exists():
-        state_dir.mkdir(parents=True, exist_ok=True)
-        data = {
-            "version": 1,
-            "lastUpdated": datetime.utcnow().isoformat() + "Z",
-            "pending": [],
-            "history": []
-        }
-        save_pending_approvals(data)
-        return data
+# Checked in this order, so the first missing one is reported
+REQUIRED_FIELDS = ("campaign_id", "target_id", "target_name", "action_type", "body")
 
-    return json.loads(file_path.read_text(encoding="utf-8"))
-
-
-def save_pending_approvals(data: dict):
-    """Save pending approvals file."""
-    file_path = Path("state") / "pending_approvals.json"
-    data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+# Largest encoded action accepted into the queue
+MAX_ACTION_BYTES = 64 * 1024
 
 
+@tool_main
 def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
-
-        # Validate required fields
-        required = ["campaign_id", "target_id", "target_name", "action_type", "body"]
-        for field in required:
-            if not input_data.get(field):
-                raise ValueError(f"Missing required field: {field}")
-
-        data = load_pending_approvals()
-
-        now = datetime.utcnow()
-        expires = now + timedelta(days=3)  # 3 day expiry
-
-        action = {
-            "id": str(uuid.uuid4()),
-            "campaign_id": input_data["campaign_id"],
-            "campaign_name": input_data.get("campaign_name", ""),
-            "target_id": input_data["target_id"],
-            "target_name": input_data["target_name"],
-            "target_email": input_data.get("target_email"),
-            "target_linkedin": input_data.get("target_linkedin"),
-            "target_phone": input_data.get("target_phone"),
-            "action_type": input_data["action_type"],
-            "channel": input_data.get("channel", input_data["action_type"].replace("send_", "")),
-            "subject": input_data.get("subject"),
-            "body": input_data["body"],
-            "reasoning": input_data.get("reasoning", ""),
-            "queued_at": now.isoformat() + "Z",
-            "expires_at": expires.isoformat() + "Z",
-            "status": "pending"
-        }
-
-        data["pending"].append(action)
-        save_pending_approvals(data)
-
-        result = {
-            "status": "success",
-            "action_id": action["id"],
-            "message": f"Action queued for approval (expires in 3 days)"
-        }
-        print(json.dumps(result))
-
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
+    input_data = loads(sys.stdin.buffer.read())
+
+    # Validate required fields
+    for field in REQUIRED_FIELDS:
+        if not input_data.get(field):
+            raise ValueError(f"Missing required field: {field}")
+
+    # One clock read, formatted once and reused for every timestamp
+    now = datetime.utcnow()
+    now_iso = now.isoformat() + "Z"
+    expires = now + timedelta(days=3)  # 3 day expiry
+
+    action = {
+        "id": str(uuid.uuid4()),
+        "campaign_id": input_data["campaign_id"],
+        "campaign_name": input_data.get("campaign_name", ""),
+        "target_id": input_data["target_id"],
+        "target_name": input_data["target_name"],
+        "target_email": input_data.get("target_email"),
+        "target_linkedin": input_data.get("target_linkedin"),
+        "target_phone": input_data.get("target_phone"),
+        "action_type": input_data["action_type"],
+        "channel": input_data.get("channel", input_data["action_type"].replace("send_", "")),
+        "subject": input_data.get("subject"),
+        "body": input_data["body"],
+        "reasoning": input_data.get("reasoning", ""),
+        "queued_at": now_iso,
+        "expires_at": expires.isoformat() + "Z",
+        "status": "pending"
+    }
+
+    # Bound the size of one queue entry; the encoding is reused for the append
+    encoded = dumps_bytes(action)
+    if len(encoded) > MAX_ACTION_BYTES:
+        raise ValueError(f"Action too large: {len(encoded)} bytes (max {MAX_ACTION_BYTES})")
+
+    # Append-only: the queue is never read or rewritten here
+    log_size = append_action(action, encoded)
+
+    # Periodically fold the log into the pending_approvals.json snapshot
+    if log_size > LOG_COMPACT_BYTES:
+        save_pending_approvals(load_pending_approvals(), now=now_iso)
+
+    result = {
+        "status": "success",
+        "action_id": action["id"],
+        "message": f"Action queued for approval (expires in 3 days)"
+    }
+    print_json(result)
 
 
 if __name__ == "__main__":
@@ -4,21 +4,32 @@ read_state.py - Read a state file from the tenant's state/ folder.
 
 Input JSON:
 {
-    "file": "current" | "clients" | "calendar"
+    "file": "current" | "clients" | "calendar",
+    "path": "clients.0.name"  # optional - dot path to one field, as in life_read
 }
 
 Output JSON:
 {
     "status": "success",
     "file": "state/current.json",
-    "data": { ... contents of the file ... }
+    "path": "clients.0.name",  # only when given
+    "data": { ... contents of the file, or the value at path ... }
 }
 """
 
+import os
 import sys
-import json
 from pathlib import Path
 
+from _json_fast import loads, print_json
+from _tool import tool_main
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
 
 VALID_FILES = {
     "current": "current.json",
@@ -26,42 +37,162 @@ VALID_FILES = {
     "calendar": "calendar.json",
 }
 
-
+# Output is read by the agent, not people, so it is compact unless
+# LIFE_PRETTY_JSON=1 is set for debugging
+PRETTY_JSON = os.environ.get("LIFE_PRETTY_JSON", "0") == "1"
+
+# Returned by stream_path when the path can't be resolved in one pass
+_NEEDS_FULL_DECODE = object()
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+
+def parse_path(path: str) -> list[tuple[str, int | None]]:
+    """Split a dot path into (key, index) segments; index is None if not an int."""
+    segments = []
+    for key in path.split("."):
+        try:
+            index = int(key)
+        except ValueError:
+            index = None
+        segments.append((key, index))
+    return segments
+
+
+def get_path_value(data, segments: list[tuple[str, int | None]]):
+    """Follow segments through decoded data; None if the path doesn't exist."""
+    current = data
+    for key, index in segments:
+        if isinstance(current, dict):
+            if key not in current:
+                return None
+            current = current[key]
+        elif isinstance(current, list):
+            if index is None or not -len(current) <= index < len(current):
+                return None
+            current = current[index]
+        else:
+            return None
+    return current
+
+
+def _skip_value(events, event: str):
+    """Consume the rest of a value whose first event has been read."""
+    if event not in _START_EVENTS:
+        return
+    depth = 1
+    for event, _ in events:
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _build_value(events, event: str, value):
+    """Decode one value whose first event has been read."""
+    builder = ObjectBuilder()
+    builder.event(event, value)
+    if event in _START_EVENTS:
+        depth = 1
+        for event, value in events:
+            builder.event(event, value)
+            if event in _START_EVENTS:
+                depth += 1
+            elif event in _END_EVENTS:
+                depth -= 1
+                if depth == 0:
+                    break
+    return builder.value
+
+
+def stream_path(f, segments: list[tuple[str, int | None]]):
+    """
+    Decode only the value at segments from a JSON file, with ijson.
+
+    Siblings along the way are skipped without being built, and reading
+    stops once the value is complete. Negative list indexes need the list
+    length, so they return _NEEDS_FULL_DECODE.
+    """
+    if all(index is None and key != "item" for key, index in segments):
+        # Only object keys: let ijson match the prefix in C ("item" is
+        # ijson's name for array members, so it has to take the slow path)
+        prefix = ".".join(key for key, _ in segments)
+        return next(ijson.items(f, prefix, use_float=True), None)
+
+    events = ijson.basic_parse(f, use_float=True)
+    event, value = next(events)
+
+    for key, index in segments:
+        if event == "start_map":
+            while True:
+                event, value = next(events)
+                if event == "end_map":
+                    return None
+                if value == key:
+                    event, value = next(events)
+                    break
+                _skip_value(events, next(events)[0])
+        elif event == "start_array":
+            if index is None:
+                return None
+            if index < 0:
+                return _NEEDS_FULL_DECODE
+            for i in range(index + 1):
+                event, value = next(events)
+                if event == "end_array":
+                    return None
+                if i < index:
+                    _skip_value(events, event)
+        else:
+            return None
+
+    return _build_value(events, event, value)
+
+
+def read_path(file_path: Path, path: str):
+    """Read the value at path from a JSON file."""
+    segments = parse_path(path)
+    if ijson is not None:
+        with open(file_path, "rb") as f:
+            value = stream_path(f, segments)
+        if value is not _NEEDS_FULL_DECODE:
+            return value
+    return get_path_value(loads(file_path.read_bytes()), segments)
+
+
+@tool_main
 def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
-
-        file_key = input_data.get("file")
+    input_data = loads(sys.stdin.buffer.read())
 
-        if not file_key:
-            raise ValueError("Missing required field: file")
+    file_key = input_data.get("file")
 
-        if file_key not in VALID_FILES:
-            raise ValueError(f"Invalid file: {file_key}. Must be one of: {', '.join(VALID_FILES.keys())}")
+    if not file_key:
+        raise ValueError("Missing required field: file")
 
-        file_name = VALID_FILES[file_key]
-        file_path = Path("state") / file_name
+    if file_key not in VALID_FILES:
+        raise ValueError(f"Invalid file: {file_key}. Must be one of: {', '.join(VALID_FILES.keys())}")
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"State file not found: {file_path}")
+    file_name = VALID_FILES[file_key]
+    file_path = Path("state") / file_name
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    if not file_path.exists():
+        raise FileNotFoundError(f"State file not found: {file_path}")
 
-        result = {
-            "status": "success",
-            "file": str(file_path),
-            "data": data
-        }
-        print(json.dumps(result, indent=2))
+    path = input_data.get("path")
 
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
+    result = {
+        "status": "success",
+        "file": str(file_path)
+    }
+    if path:
+        result["path"] = path
+        result["data"] = read_path(file_path, path)
+    else:
+        result["data"] = loads(file_path.read_bytes())
+    print_json(result, indent=PRETTY_JSON)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ Input JSON:
 {
     "query": "search term",
     "category": "all|knowledge|events|relationships|identity|patterns|boundaries",
+    "match": "phrase|any|all",  // Text search: whole query (default), or lines
+                                // with any/all of its whitespace-separated terms
 
     // NEW: Structured data options
     "file": "contacts|business|patterns|...",  // Specific file to read
@@ -28,11 +30,40 @@ Output JSON:
 }
 """
 
+import os
+import re
 import sys
-import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _daemon_client import delegate_to_daemon
+from _json_fast import dumps, loads, print_json
+from _tool import tool_main
+
+# life_read lives next to this script; call it in-process when possible and
+# only fall back to spawning it if the import fails
+try:
+    from life_read import run as life_read_run
+except ImportError:
+    life_read_run = None
+
+# Relative to the tenant folder (the cwd), so safe to build once
+LIFE_DIR = Path("life")
+
+CATEGORY_DIRS = {
+    "knowledge": LIFE_DIR / "knowledge",
+    "events": LIFE_DIR / "events",
+    "relationships": LIFE_DIR / "relationships",
+}
+
+ROOT_FILES = {
+    "patterns": LIFE_DIR / "patterns.md",
+    "questions": LIFE_DIR / "questions.md",
+    "identity": LIFE_DIR / "identity.md",
+    "boundaries": LIFE_DIR / "boundaries.md",
+}
+
 
 def call_life_read(file_name: str, query: str | None = None, path: str | None = None) -> dict:
     """Call life_read.py with the given parameters."""
@@ -44,20 +75,26 @@ def call_life_read(file_name: str, query: str | None = None, path: str | None =
     if path:
         input_data["path"] = path
 
+    if life_read_run is not None:
+        try:
+            return life_read_run(input_data)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     try:
         result = subprocess.run(
             [sys.executable, str(script_path)],
-            input=json.dumps(input_data),
+            input=dumps(input_data),
             capture_output=True,
             text=True,
             timeout=30
         )
 
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return loads(result.stdout)
         else:
             try:
-                return json.loads(result.stdout)
+                return loads(result.stdout)
             except:
                 return {"status": "error", "message": result.stderr or "Unknown error"}
 
@@ -67,10 +104,15 @@ def call_life_read(file_name: str, query: str | None = None, path: str | None =
         return {"status": "error", "message": str(e)}
 
 
-def search_file(file_path: Path, query: str) -> list[str]:
-    """Search a file for lines containing the query (fallback)."""
+def read_text(file_path: str) -> str:
+    """Read a whole file as text (universal newlines, like Path.read_text)."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _search_lines(file_path: str, query_lower: str) -> list[str]:
+    """Line-by-line scan, for files whose offsets change when lowercased."""
     matches = []
-    query_lower = query.lower()
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
@@ -83,6 +125,78 @@ def search_file(file_path: Path, query: str) -> list[str]:
     return matches
 
 
+def search_file(file_path: str, query: str) -> list[str]:
+    """Search a file for lines containing the query (fallback)."""
+    query_lower = query.lower()
+
+    try:
+        text = read_text(file_path)
+    except Exception:
+        return []
+
+    # Lowercase the whole file once and let str.find jump between hits in C,
+    # instead of lowering and testing every line in Python
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some character lowercased to a different length (e.g. "İ"), so
+        # offsets in lowered no longer line up with text
+        return _search_lines(file_path, query_lower)
+
+    matches = []
+    start = lowered.find(query_lower)
+    while start != -1:
+        line_start = lowered.rfind("\n", 0, start) + 1
+        line_end = lowered.find("\n", start)
+        if line_end == -1:
+            line_end = len(lowered)
+
+        if start + len(query_lower) <= line_end + 1:
+            matches.append(text[line_start:line_end].strip())
+            # One entry per line, like the line scan
+            start = lowered.find(query_lower, line_end + 1)
+        else:
+            # Hit spans a line break; a line scan would not see it
+            start = lowered.find(query_lower, start + 1)
+
+    return matches
+
+
+def compile_terms(terms: list[str]) -> re.Pattern:
+    """Compile terms into one case-insensitive alternation."""
+    # Longest first, so a term that prefixes another does not shadow it
+    ordered = sorted(set(terms), key=len, reverse=True)
+    return re.compile("|".join(re.escape(t) for t in ordered), re.IGNORECASE)
+
+
+def search_file_terms(file_path: str, pattern: re.Pattern, require_all: list[str] | None = None) -> list[str]:
+    """
+    Search a file for lines with a hit for pattern.
+
+    With require_all (lowercased terms), a line must also contain every term.
+    """
+    try:
+        text = read_text(file_path)
+    except Exception:
+        return []
+
+    matches = []
+    line_end = -1
+    for m in pattern.finditer(text):
+        if m.start() <= line_end:
+            # Line already handled
+            continue
+        line_start = text.rfind("\n", 0, m.start()) + 1
+        line_end = text.find("\n", m.start())
+        if line_end == -1:
+            line_end = len(text)
+
+        line = text[line_start:line_end]
+        if require_all is None or all(t in line.lower() for t in require_all):
+            matches.append(line.strip())
+
+    return matches
+
+
 def get_all_life_files() -> list[str]:
     """Get list of all life file names."""
     return [
@@ -91,111 +205,138 @@ def get_all_life_files() -> list[str]:
     ]
 
 
-def get_search_paths(category: str) -> list[Path]:
-    """Get paths to search based on category."""
-    life_dir = Path("life")
+def walk_md(root: str):
+    """
+    Yield paths of *.md entries under root, in Path.rglob("*.md") order.
 
-    if not life_dir.exists():
+    Each directory's entries come before its subdirectories' (in scandir
+    order), and symlinked directories are not descended into. Plain
+    os.scandir strings skip building a Path for every entry.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        if entry.name.endswith(".md"):
+            yield entry.path
+        try:
+            if entry.is_dir() and not entry.is_symlink():
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+
+    for subdir in subdirs:
+        yield from walk_md(subdir)
+
+
+def get_search_paths(category: str) -> list[str]:
+    """Get paths to search based on category."""
+    if not LIFE_DIR.exists():
         return []
 
     if category == "all":
-        return list(life_dir.rglob("*.md"))
-
-    category_map = {
-        "knowledge": life_dir / "knowledge",
-        "events": life_dir / "events",
-        "relationships": life_dir / "relationships",
-    }
+        return list(walk_md(str(LIFE_DIR)))
 
-    if category in category_map:
-        search_dir = category_map[category]
+    if category in CATEGORY_DIRS:
+        search_dir = CATEGORY_DIRS[category]
         if search_dir.exists():
-            return list(search_dir.rglob("*.md"))
+            return list(walk_md(str(search_dir)))
 
-    root_files = {
-        "patterns": life_dir / "patterns.md",
-        "questions": life_dir / "questions.md",
-        "identity": life_dir / "identity.md",
-        "boundaries": life_dir / "boundaries.md",
-    }
-
-    if category in root_files and root_files[category].exists():
-        return [root_files[category]]
+    if category in ROOT_FILES and ROOT_FILES[category].exists():
+        return [str(ROOT_FILES[category])]
 
     return []
 
 
+@tool_main
 def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
-
-        query = input_data.get("query")
-        category = input_data.get("category", "all")
-        file_name = input_data.get("file")
-        path = input_data.get("path")
-        structured = input_data.get("structured", False)
-
-        # Mode 1: Direct file read with optional path
-        if file_name:
-            result = call_life_read(file_name, query, path)
-            print(json.dumps(result))
-            return
-
-        # Mode 2: Structured search across files
-        if structured and query:
-            all_results = []
-            for file in get_all_life_files():
-                result = call_life_read(file, query)
-                if result.get("status") == "success":
-                    search_info = result.get("search", {})
-                    if search_info.get("total", 0) > 0:
-                        all_results.append({
-                            "file": result.get("file_path"),
-                            "data": result.get("data"),
-                            "matches": search_info.get("matches", [])
-                        })
-
-            total_matches = sum(len(r.get("matches", [])) for r in all_results)
-            print(json.dumps({
-                "status": "success",
-                "results": all_results,
-                "total_matches": total_matches,
-                "structured": True
-            }))
-            return
-
-        # Mode 3: Text search (backwards compatible)
-        if not query:
-            raise ValueError("Missing required field: query (or file)")
-
-        search_paths = get_search_paths(category)
-        results = []
-        total_matches = 0
-
-        for file_path in search_paths:
-            matches = search_file(file_path, query)
-            if matches:
-                results.append({
-                    "file": str(file_path),
-                    "matches": matches[:10]
-                })
-                total_matches += len(matches)
-
-        result = {
+    input_data = loads(sys.stdin.buffer.read())
+
+    query = input_data.get("query")
+    category = input_data.get("category", "all")
+    file_name = input_data.get("file")
+    path = input_data.get("path")
+    structured = input_data.get("structured", False)
+
+    # Mode 1: Direct file read with optional path
+    if file_name:
+        result = call_life_read(file_name, query, path)
+        print_json(result)
+        return
+
+    # Mode 2: Structured search across files
+    if structured and query:
+        # Files are independent, so read them on a thread pool
+        # (order is preserved by map)
+        files = get_all_life_files()
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            file_results = list(executor.map(lambda f: call_life_read(f, query), files))
+
+        all_results = []
+        for result in file_results:
+            if result.get("status") == "success":
+                search_info = result.get("search", {})
+                if search_info.get("total", 0) > 0:
+                    all_results.append({
+                        "file": result.get("file_path"),
+                        "data": result.get("data"),
+                        "matches": search_info.get("matches", [])
+                    })
+
+        total_matches = sum(len(r.get("matches", [])) for r in all_results)
+        print_json({
             "status": "success",
-            "results": results,
-            "total_matches": total_matches
-        }
-        print(json.dumps(result))
-
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
+            "results": all_results,
+            "total_matches": total_matches,
+            "structured": True
+        })
+        return
+
+    # Mode 3: Text search (backwards compatible)
+    if not query:
+        raise ValueError("Missing required field: query (or file)")
+
+    match_mode = input_data.get("match", "phrase")
+    if match_mode not in ("phrase", "any", "all"):
+        raise ValueError(f"Invalid match: {match_mode} (expected phrase, any or all)")
+
+    terms = query.split()
+    if match_mode == "phrase" or len(terms) < 2:
+        def search(file_path: str) -> list[str]:
+            return search_file(file_path, query)
+    else:
+        # Compile once for all files
+        pattern = compile_terms(terms)
+        require_all = [t.lower() for t in terms] if match_mode == "all" else None
+
+        def search(file_path: str) -> list[str]:
+            return search_file_terms(file_path, pattern, require_all)
+
+    search_paths = get_search_paths(category)
+    results = []
+    total_matches = 0
+
+    for file_path in search_paths:
+        matches = search(file_path)
+        if matches:
+            results.append({
+                "file": str(file_path),
+                "matches": matches[:10]
+            })
+            total_matches += len(matches)
+
+    result = {
+        "status": "success",
+        "results": results,
+        "total_matches": total_matches
+    }
+    print_json(result)
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("recall"):
+        main()
@@ -27,11 +27,21 @@ Output JSON:
 """
 
 import sys
-import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from _daemon_client import delegate_to_daemon
+from _json_fast import dumps, loads, print_json
+from _tool import tool_main
+
+# life_write lives next to this script; call it in-process when possible and
+# only fall back to spawning it if the import fails
+try:
+    from life_write import run as life_write_run
+except ImportError:
+    life_write_run = None
+
 
 def get_life_file_name(category: str, file: str | None) -> str:
     """Map category to life file name."""
@@ -70,21 +80,27 @@ def call_life_write(file_name: str, operation: str, path: str | None, value, mar
     if markdown:
         input_data["markdown"] = markdown
 
+    if life_write_run is not None:
+        try:
+            return life_write_run(input_data)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     try:
         result = subprocess.run(
             [sys.executable, str(script_path)],
-            input=json.dumps(input_data),
+            input=dumps(input_data),
             capture_output=True,
             text=True,
             timeout=30
         )
 
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return loads(result.stdout)
         else:
             # Parse error from stderr or stdout
             try:
-                return json.loads(result.stdout)
+                return loads(result.stdout)
             except:
                 return {"status": "error", "message": result.stderr or "Unknown error"}
 
@@ -104,99 +120,92 @@ def get_array_path(category: str) -> str | None:
     return array_paths.get(category)
 
 
+@tool_main
 def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
-
-        category = input_data.get("category")
-        file = input_data.get("file")
-        content = input_data.get("content")
-        structured = input_data.get("structured")
-
-        if not category:
-            raise ValueError("Missing required field: category")
-
-        # Determine the life file to update
-        file_name = get_life_file_name(category, file)
+    input_data = loads(sys.stdin.buffer.read())
 
-        # Handle structured data (new approach)
-        if structured:
-            field = structured.get("field")
-            data = structured.get("data", {})
+    category = input_data.get("category")
+    file = input_data.get("file")
+    content = input_data.get("content")
+    structured = input_data.get("structured")
 
-            if not field:
-                raise ValueError("structured.field is required when using structured data")
+    if not category:
+        raise ValueError("Missing required field: category")
 
-            # Add timestamp if not present
-            if isinstance(data, dict) and "learnedAt" not in data and "observedAt" not in data:
-                data["learnedAt"] = datetime.utcnow().isoformat() + "Z"
+    # Determine the life file to update
+    file_name = get_life_file_name(category, file)
 
-            # Append to the specified array field
-            result = call_life_write(file_name, "append", field, data)
+    # Handle structured data (new approach)
+    if structured:
+        field = structured.get("field")
+        data = structured.get("data", {})
 
-            if result.get("status") == "success":
-                print(json.dumps({
-                    "status": "success",
-                    "file": result.get("file_path", f"life/{file_name}.md"),
-                    "message": f"Structured data saved to {field}",
-                    "structured": True
-                }))
-            else:
-                print(json.dumps(result))
-                sys.exit(1)
-            return
+        if not field:
+            raise ValueError("structured.field is required when using structured data")
 
-        # Handle unstructured content (backwards compatible)
-        if not content:
-            raise ValueError("Missing required field: content (or structured)")
+        # Add timestamp if not present
+        if isinstance(data, dict) and "learnedAt" not in data and "observedAt" not in data:
+            data["learnedAt"] = datetime.utcnow().isoformat() + "Z"
 
-        # For unstructured content, append to markdown with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        markdown_content = f"## {timestamp}\n{content}"
-
-        # Use life_write to append markdown
-        result = call_life_write(file_name, "merge", None, {}, markdown_content)
+        # Append to the specified array field
+        result = call_life_write(file_name, "append", field, data)
 
         if result.get("status") == "success":
-            print(json.dumps({
+            print_json({
                 "status": "success",
                 "file": result.get("file_path", f"life/{file_name}.md"),
-                "message": "Content saved successfully"
-            }))
+                "message": f"Structured data saved to {field}",
+                "structured": True
+            })
         else:
-            # Fallback to direct file write if life_write fails
-            life_dir = Path("life")
-            file_map = {
-                "patterns": life_dir / "patterns.md",
-                "identity": life_dir / "identity.md",
-                "boundaries": life_dir / "boundaries.md",
-                "business": life_dir / "knowledge" / "business.md",
-                "contacts": life_dir / "knowledge" / "contacts.md",
-                "procedures": life_dir / "knowledge" / "procedures.md",
-                "people": life_dir / "relationships" / "people.md",
-            }
-
-            file_path = file_map.get(file_name, life_dir / f"{file_name}.md")
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            formatted_content = f"\n\n## {timestamp}\n{content}"
-            with open(file_path, "a", encoding="utf-8") as f:
-                f.write(formatted_content)
-
-            print(json.dumps({
-                "status": "success",
-                "file": str(file_path),
-                "message": "Content saved successfully (fallback)"
-            }))
-
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "message": str(e)
+            print_json(result)
+            sys.exit(1)
+        return
+
+    # Handle unstructured content (backwards compatible)
+    if not content:
+        raise ValueError("Missing required field: content (or structured)")
+
+    # For unstructured content, append to markdown with timestamp
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    markdown_content = f"## {timestamp}\n{content}"
+
+    # Use life_write to append markdown
+    result = call_life_write(file_name, "merge", None, {}, markdown_content)
+
+    if result.get("status") == "success":
+        print_json({
+            "status": "success",
+            "file": result.get("file_path", f"life/{file_name}.md"),
+            "message": "Content saved successfully"
+        })
+    else:
+        # Fallback to direct file write if life_write fails
+        life_dir = Path("life")
+        file_map = {
+            "patterns": life_dir / "patterns.md",
+            "identity": life_dir / "identity.md",
+            "boundaries": life_dir / "boundaries.md",
+            "business": life_dir / "knowledge" / "business.md",
+            "contacts": life_dir / "knowledge" / "contacts.md",
+            "procedures": life_dir / "knowledge" / "procedures.md",
+            "people": life_dir / "relationships" / "people.md",
         }
-        print(json.dumps(error_result))
-        sys.exit(1)
+
+        file_path = file_map.get(file_name, life_dir / f"{file_name}.md")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        formatted_content = f"\n\n## {timestamp}\n{content}"
+        with open(file_path, "a", encoding="utf-8") as f:
+            f.write(formatted_content)
+
+        print_json({
+            "status": "success",
+            "file": str(file_path),
+            "message": "Content saved successfully (fallback)"
+        })
 
 
 if __name__ == "__main__":
-    main()
+    if not delegate_to_daemon("remember"):
+        main()
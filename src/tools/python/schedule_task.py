@@ -31,18 +31,55 @@ import os
 import urllib.request
 import urllib.error
 
+# Keep-alive connections and daemon hand-off come from helpers that sit next
+# to this script; standalone copies fall back to a plain urllib request
+try:
+    from _http_pool import HTTPError as PoolHTTPError, request as pooled_request
+except ImportError:
+    PoolHTTPError = urllib.error.HTTPError
+    pooled_request = None
+
+try:
+    from _daemon_client import delegate_to_daemon
+except ImportError:
+    delegate_to_daemon = None
+
+
+def post_json(url: str, payload: dict) -> dict:
+    """POST payload as JSON and decode the JSON response."""
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+
+    if pooled_request is not None:
+        return json.loads(pooled_request("POST", url, body=body, headers=headers, timeout=30))
+
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    with urllib.request.urlopen(req, timeout=30) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+# Every result has the same four keys; failures only fill in error
+RESULT_TEMPLATE = {
+    "success": False,
+    "message": None,
+    "task_id": None,
+    "error": None
+}
+
+
+def emit(**fields):
+    """Print one result: RESULT_TEMPLATE with fields filled in."""
+    result = RESULT_TEMPLATE.copy()
+    result.update(fields)
+    print(json.dumps(result))
+
 
 def main():
     # Read JSON input from stdin
     try:
         input_data = json.loads(sys.stdin.read())
     except json.JSONDecodeError as e:
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": f"Invalid JSON input: {str(e)}"
-        }))
+        emit(error=f"Invalid JSON input: {str(e)}")
         sys.exit(1)
 
     # Get required environment variables
@@ -51,12 +88,7 @@ def main():
     api_base_url = os.environ.get("API_BASE_URL", "http://localhost:3000")
 
     if not tenant_id or not sender_phone:
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": "Missing required environment variables: TENANT_ID, SENDER_PHONE"
-        }))
+        emit(error="Missing required environment variables: TENANT_ID, SENDER_PHONE")
         sys.exit(1)
 
     # Validate input
@@ -64,12 +96,7 @@ def main():
     schedule = input_data.get("schedule")
 
     if not task or not schedule:
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": "Missing required fields: task, schedule"
-        }))
+        emit(error="Missing required fields: task, schedule")
         sys.exit(1)
 
     # Build request payload
@@ -84,52 +111,36 @@ def main():
 
     # Make API request
     try:
-        url = f"{api_base_url}/api/tools/schedule-task"
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        result = post_json(f"{api_base_url}/api/tools/schedule-task", payload)
 
-        print(json.dumps({
-            "success": True,
-            "message": result.get("message", "Task scheduled successfully!"),
-            "task_id": result.get("taskId"),
-            "error": None
-        }))
+        emit(
+            success=True,
+            message=result.get("message", "Task scheduled successfully!"),
+            task_id=result.get("taskId")
+        )
 
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": f"API error ({e.code}): {error_body}"
-        }))
+        emit(error=f"API error ({e.code}): {error_body}")
+        sys.exit(1)
+
+    except PoolHTTPError as e:
+        emit(error=f"API error ({e.code}): {e.body or str(e)}")
         sys.exit(1)
 
     except urllib.error.URLError as e:
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": f"Connection error: {str(e.reason)}"
-        }))
+        emit(error=f"Connection error: {str(e.reason)}")
+        sys.exit(1)
+
+    except OSError as e:
+        emit(error=f"Connection error: {str(e)}")
         sys.exit(1)
 
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "message": None,
-            "task_id": None,
-            "error": f"Unexpected error: {str(e)}"
-        }))
+        emit(error=f"Unexpected error: {str(e)}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if delegate_to_daemon is None or not delegate_to_daemon("schedule_task"):
+        main()
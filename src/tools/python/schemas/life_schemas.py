@@ -9,6 +9,19 @@ Each life file uses JSON frontmatter format:
 # Markdown content below...
 """
 
+from functools import lru_cache
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    import json
+    orjson = None
+
 # Schema version - increment when making breaking changes
 SCHEMA_VERSION = 1
 
@@ -492,17 +505,62 @@ DEFAULT_DATA = {
 }
 
 
+def _base_name(file_name: str) -> str:
+    """Strip path and .md extension from a life file name."""
+    return file_name.split("/")[-1].replace(".md", "")
+
+
+@lru_cache(maxsize=32)
 def get_schema(file_name: str) -> dict | None:
-    """Get schema for a life file by name."""
-    # Strip path and extension
-    base_name = file_name.split("/")[-1].replace(".md", "")
-    return SCHEMA_MAP.get(base_name) or SCHEMA_MAP.get(file_name)
+    """Get schema for a life file by name. Result is shared - do not mutate."""
+    return SCHEMA_MAP.get(_base_name(file_name)) or SCHEMA_MAP.get(file_name)
+
+
+@lru_cache(maxsize=32)
+def _default_template(file_name: str) -> dict:
+    """Resolve the shared default template for a life file (read-only)."""
+    return DEFAULT_DATA.get(_base_name(file_name), {"version": SCHEMA_VERSION})
 
 
 def get_default_data(file_name: str) -> dict:
-    """Get default empty data structure for a life file."""
-    base_name = file_name.split("/")[-1].replace(".md", "")
-    return DEFAULT_DATA.get(base_name, {"version": SCHEMA_VERSION}).copy()
+    """
+    Get default empty data structure for a life file.
+
+    Returns a shallow copy of the cached template; callers that mutate
+    nested containers must copy them first.
+    """
+    return _default_template(file_name).copy()
+
+
+# Compiled validators keyed by the schema's canonical JSON, so equal schemas
+# (aliased file names, ad-hoc copies) share one compiled function
+_VALIDATORS_BY_SCHEMA = {}
+
+
+def _schema_key(schema: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(schema, sort_keys=True).encode("utf-8")
+
+
+def get_validator(schema: dict):
+    """Compiled validator for schema, or None without fastjsonschema."""
+    if fastjsonschema is None:
+        return None
+    key = _schema_key(schema)
+    validator = _VALIDATORS_BY_SCHEMA.get(key)
+    if validator is None:
+        # use_default=False: validating must not fill schema defaults into data
+        validator = fastjsonschema.compile(schema, use_default=False)
+        _VALIDATORS_BY_SCHEMA[key] = validator
+    return validator
+
+
+@lru_cache(maxsize=32)
+def _compiled_validator(file_name: str):
+    """Validator for a life file, resolved once per file name."""
+    schema = get_schema(file_name)
+    return get_validator(schema) if schema is not None else None
 
 
 def validate_data(file_name: str, data: dict) -> tuple[bool, list[str]]:
@@ -510,15 +568,25 @@ def validate_data(file_name: str, data: dict) -> tuple[bool, list[str]]:
     Validate data against schema.
     Returns (is_valid, list of error messages).
 
-    Note: This is a simple validation without jsonschema dependency.
-    For production, consider using jsonschema library.
+    With fastjsonschema installed this runs the full schema through a
+    validator compiled once per distinct schema, reporting the first error.
+    Without it, only required fields and the version type are checked.
     """
-    errors = []
     schema = get_schema(file_name)
 
     if not schema:
         return True, []  # No schema = accept anything
 
+    validator = _compiled_validator(file_name)
+    if validator is not None:
+        try:
+            validator(data)
+        except fastjsonschema.JsonSchemaException as e:
+            return False, [str(e)]
+        return True, []
+
+    errors = []
+
     # Check required fields
     required = schema.get("required", [])
     for field in required:
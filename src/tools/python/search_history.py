@@ -33,18 +33,29 @@ import urllib.request
 import urllib.error
 import urllib.parse
 
+# orjson-backed helpers sit next to this script; standalone copies fall back
+# to the stdlib json module
+try:
+    from _json_fast import JSONDecodeError, loads, print_json
+except ImportError:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+
+    def print_json(obj):
+        print(json.dumps(obj))
+
 
 def main():
     # Read JSON input from stdin
     try:
-        input_data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError as e:
-        print(json.dumps({
+        input_data = loads(sys.stdin.buffer.read())
+    except JSONDecodeError as e:
+        print_json({
             "success": False,
             "messages": [],
             "total": 0,
             "error": f"Invalid JSON input: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
     # Get required environment variables
@@ -52,12 +63,12 @@ def main():
     api_base_url = os.environ.get("API_BASE_URL", "http://localhost:3000")
 
     if not tenant_id:
-        print(json.dumps({
+        print_json({
             "success": False,
             "messages": [],
             "total": 0,
             "error": "Missing required environment variable: TENANT_ID"
-        }))
+        })
         sys.exit(1)
 
     # Build query params
@@ -86,7 +97,7 @@ def main():
         req = urllib.request.Request(url, method="GET")
 
         with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
+            result = loads(response.read())
 
         # Format messages for easy reading
         messages = result.get("messages", [])
@@ -99,39 +110,39 @@ def main():
                 "phone": msg.get("sender_phone")
             })
 
-        print(json.dumps({
+        print_json({
             "success": True,
             "messages": formatted,
             "total": result.get("total", len(messages)),
             "error": None
-        }))
+        })
 
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else str(e)
-        print(json.dumps({
+        print_json({
             "success": False,
             "messages": [],
             "total": 0,
             "error": f"API error ({e.code}): {error_body}"
-        }))
+        })
         sys.exit(1)
 
     except urllib.error.URLError as e:
-        print(json.dumps({
+        print_json({
             "success": False,
             "messages": [],
             "total": 0,
             "error": f"Connection error: {str(e.reason)}"
-        }))
+        })
         sys.exit(1)
 
     except Exception as e:
-        print(json.dumps({
+        print_json({
             "success": False,
             "messages": [],
             "total": 0,
             "error": f"Unexpected error: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
 
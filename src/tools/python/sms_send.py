@@ -22,9 +22,10 @@ Requires:
 """
 
 import sys
-import json
 from pathlib import Path
 
+from _json_fast import loads, print_json
+
 
 def load_env_from_cwd():
     """Load .env file from current working directory."""
@@ -44,7 +45,7 @@ def main():
 
         import os
 
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         to_number = input_data.get("to")
         body = input_data.get("body")
@@ -64,7 +65,7 @@ def main():
                 "status": "failed",
                 "error": "Twilio credentials not configured. Set TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER in .env"
             }
-            print(json.dumps(result))
+            print_json(result)
             sys.exit(1)
 
         # Try to use Twilio SDK
@@ -84,7 +85,7 @@ def main():
                 "message_id": message.sid,
                 "message": f"SMS sent to {to_number}"
             }
-            print(json.dumps(result))
+            print_json(result)
 
         except ImportError:
             # Twilio SDK not installed
@@ -92,7 +93,7 @@ def main():
                 "status": "failed",
                 "error": "Twilio SDK not installed. Run: pip install twilio"
             }
-            print(json.dumps(result))
+            print_json(result)
             sys.exit(1)
 
     except Exception as e:
@@ -100,7 +101,7 @@ def main():
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
@@ -21,11 +21,15 @@ Output JSON:
 """
 
 import sys
-import json
+import os
 import re
+import heapq
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from _json_fast import dumps_bytes, loads, print_json
+
 
 def parse_date(date_str: str) -> datetime:
     """Parse YYYY-MM-DD string to datetime."""
@@ -46,9 +50,41 @@ def get_date_range(params: dict) -> tuple[datetime, datetime]:
     return start, end
 
 
-def parse_timeline_file(filepath: Path) -> list[dict]:
+# One event: header line, then every following line up to the --- separator
+# or the next event header (whole lines at a time, so the scan stays in C)
+EVENT_RE = re.compile(
+    r'^### (\d{2}:\d{2}:\d{2}) \[([A-Z]+)\] (.+)$'
+    r'((?:\n(?!---|### \d{2}:\d{2}:\d{2} \[).*)*)',
+    re.MULTILINE
+)
+
+
+# Parsed journals in state/, one file per day, reused while the journal's
+# mtime and size are unchanged
+CACHE_DIR = Path("state") / "timeline_cache"
+
+# Pruning is done once per process, the first time a new entry is written,
+# so queries served from the cache never scan it
+_cache_pruned = False
+
+
+def prune_timeline_cache(timeline_dir: Path):
+    """Remove cached days whose journal no longer exists."""
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and not (timeline_dir / f"{entry.name[:-5]}.md").exists():
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except FileNotFoundError:
+        pass
+
+
+def parse_timeline_text(text: str) -> list[list[str]]:
     """
-    Parse a timeline markdown file into event entries.
+    Parse timeline markdown into [time, type, header, content] events.
 
     Expected format:
     ### HH:MM:SS [TYPE] Description
@@ -58,79 +94,85 @@ def parse_timeline_file(filepath: Path) -> list[dict]:
     ---
     """
     events = []
+    for match in EVENT_RE.finditer(text):
+        time_str, event_type, header, body = match.groups()
+        content_lines = [line.strip() for line in body.split("\n")]
+        content = "\n".join(line for line in content_lines if line)
+        events.append([time_str, event_type, header, content])
+    return events
 
-    if not filepath.exists():
-        return events
-
-    content = filepath.read_text(encoding="utf-8")
-    date_str = filepath.stem  # YYYY-MM-DD from filename
 
-    # Pattern to match event headers: ### HH:MM:SS [TYPE] description
-    event_pattern = re.compile(
-        r'^### (\d{2}:\d{2}:\d{2}) \[([A-Z]+)\] (.+?)$',
-        re.MULTILINE
-    )
+def load_timeline_events(filepath: Path) -> list[list[str]]:
+    """Events of a timeline file, from the cache when the file is unchanged."""
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return []
 
-    # Split by separator
-    blocks = content.split("---")
+    cache_path = CACHE_DIR / f"{filepath.stem}.json"
+    try:
+        cached = loads(cache_path.read_bytes())
+        if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+            return cached["events"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
 
-    for block in blocks:
-        block = block.strip()
-        if not block:
-            continue
+    events = parse_timeline_text(filepath.read_text(encoding="utf-8"))
 
-        match = event_pattern.search(block)
-        if match:
-            time_str = match.group(1)
-            event_type = match.group(2)
-            header = match.group(3)
-
-            # Get content after the header line
-            lines = block.split("\n")
-            content_lines = []
-            header_found = False
-            for line in lines:
-                if header_found and line.strip():
-                    content_lines.append(line.strip())
-                if line.startswith("###"):
-                    header_found = True
-
-            event = {
-                "date": date_str,
-                "time": time_str,
-                "type": event_type,
-                "header": header,
-                "content": "\n".join(content_lines) if content_lines else ""
-            }
-            events.append(event)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_bytes(dumps_bytes({
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "events": events
+        }))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache is best-effort
+    else:
+        global _cache_pruned
+        if not _cache_pruned:
+            _cache_pruned = True
+            prune_timeline_cache(filepath.parent)
 
     return events
 
 
-def search_events(events: list[dict], query: str | None, event_type: str | None) -> list[dict]:
-    """Filter events by query and type."""
-    results = []
-
-    for event in events:
-        # Filter by type
-        if event_type and event["type"] != event_type:
+def iter_timeline_events(filepath: Path, query_lower: str | None = None,
+                         event_type: str | None = None):
+    """
+    Yield (time, type, header, content) for each event in a timeline file
+    that matches event_type and contains query_lower (already lowercased).
+    """
+    for time_str, match_type, header, content in load_timeline_events(filepath):
+        if event_type and match_type != event_type:
             continue
+        if query_lower and query_lower not in f"{header} {content}".lower():
+            continue
+        yield time_str, match_type, header, content
 
-        # Filter by query
-        if query:
-            query_lower = query.lower()
-            searchable = f"{event['header']} {event['content']}".lower()
-            if query_lower not in searchable:
-                continue
-
-        results.append(event)
 
-    return results
+def parse_timeline_file(filepath: Path, query_lower: str | None = None,
+                        event_type: str | None = None) -> list[dict]:
+    """Parse the matching events of a timeline file into event entries."""
+    date_str = filepath.stem  # YYYY-MM-DD from filename
+    return [
+        {
+            "date": date_str,
+            "time": time_str,
+            "type": match_type,
+            "header": header,
+            "content": content
+        }
+        for time_str, match_type, header, content
+        in iter_timeline_events(filepath, query_lower, event_type)
+    ]
 
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         query = input_data.get("query")
         event_type = input_data.get("type")
@@ -149,46 +191,51 @@ def main():
                 "total": 0,
                 "message": "No timeline folder found"
             }
-            print(json.dumps(result))
+            print_json(result)
             return
 
-        # Collect all events in date range
-        all_events = []
-        current = start_date
-        while current <= end_date:
-            filename = f"{current.strftime('%Y-%m-%d')}.md"
-            filepath = timeline_dir / filename
-            events = parse_timeline_file(filepath)
-            all_events.extend(events)
-            current += timedelta(days=1)
-
-        # Search/filter events
-        filtered = search_events(all_events, query, event_type)
-
-        # Sort by date/time (most recent first)
-        filtered.sort(key=lambda e: f"{e['date']} {e['time']}", reverse=True)
-
-        # Apply limit
-        limited = filtered[:limit] if limit else filtered
+        query_lower = query.lower() if query else None
+
+        # Newest day first, so once whole days have filled the limit the
+        # older days only add to the total and are never built into dicts
+        events = []
+        total = 0
+        current = end_date
+        while current >= start_date:
+            filepath = timeline_dir / f"{current.strftime('%Y-%m-%d')}.md"
+            if limit and len(events) >= limit:
+                total += sum(1 for _ in iter_timeline_events(filepath, query_lower, event_type))
+            else:
+                day_events = parse_timeline_file(filepath, query_lower, event_type)
+                total += len(day_events)
+                if limit:
+                    # Partial sort: only as many as the limit still has room for
+                    events.extend(heapq.nlargest(limit - len(events), day_events, key=itemgetter("time")))
+                else:
+                    day_events.sort(key=itemgetter("time"), reverse=True)
+                    events.extend(day_events)
+            current -= timedelta(days=1)
+
+        limited = events
 
         result = {
             "status": "success",
             "events": limited,
-            "total": len(filtered),
+            "total": total,
             "returned": len(limited),
             "date_range": {
                 "from": start_date.strftime("%Y-%m-%d"),
                 "to": end_date.strftime("%Y-%m-%d")
             }
         }
-        print(json.dumps(result))
+        print_json(result)
 
     except Exception as e:
         error_result = {
             "status": "error",
             "message": str(e)
         }
-        print(json.dumps(error_result))
+        print_json(error_result)
         sys.exit(1)
 
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+tools_daemon.py - Persistent host for the high-frequency tool scripts.
+
+Each tool script normally starts a fresh interpreter per call. This daemon
+imports the tools once and serves calls over a Unix socket, so a call
+only pays for the tool's own work. Scripts hand off to it automatically
+(see _daemon_client.py) when TOOLS_DAEMON_SOCKET is set and the socket
+exists; otherwise they run locally exactly as before.
+
+Usage:
+    TOOLS_DAEMON_SOCKET=/tmp/proxystaff-tools.sock python tools_daemon.py
+
+Protocol (both directions): 4-byte big-endian length + JSON body.
+Request:  {"tool": "log_decision", "stdin": "...", "cwd": "...", "env": {...}}
+Response: {"stdout": "...", "stderr": "...", "exit_code": 0}
+
+Calls are served one at a time: each runs the tool's main() with the
+caller's cwd, environment and stdin swapped in, then restores them.
+"""
+
+import io
+import os
+import sys
+import signal
+import struct
+import asyncio
+import importlib
+import traceback
+from contextlib import redirect_stderr
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _json_fast import dumps, loads
+
+
+DEFAULT_SOCKET = "/tmp/proxystaff-tools.sock"
+
+TOOLS = (
+    "linkedin_send",
+    "list_pending_actions",
+    "list_triggers",
+    "log_decision",
+    "log_event",
+    "manage_trigger",
+    "mark_question_answered",
+    "outlook_delete",
+    "outlook_mark_read",
+    "outlook_search",
+    "outlook_send",
+    "recall",
+    "remember",
+    "schedule_task",
+)
+
+# Tool modules imported once at startup
+_MODULES = {name: importlib.import_module(name) for name in TOOLS}
+
+
+def run_tool(request: dict) -> dict:
+    """Run one tool call with the caller's stdin/cwd/env and capture output."""
+    module = _MODULES.get(request.get("tool"))
+    if module is None:
+        return {"stdout": "", "stderr": f"Unknown tool: {request.get('tool')}\n", "exit_code": 2}
+
+    saved_cwd = os.getcwd()
+    saved_env = os.environ.copy()
+    saved_stdin, saved_stdout = sys.stdin, sys.stdout
+
+    stdout_bytes = io.BytesIO()
+    stderr_text = io.StringIO()
+    exit_code = 0
+
+    try:
+        os.chdir(request.get("cwd") or saved_cwd)
+        os.environ.clear()
+        os.environ.update(request.get("env") or {})
+        sys.stdin = io.TextIOWrapper(io.BytesIO(request.get("stdin", "").encode("utf-8")), encoding="utf-8")
+        stdout = sys.stdout = io.TextIOWrapper(stdout_bytes, encoding="utf-8", write_through=True)
+
+        with redirect_stderr(stderr_text):
+            try:
+                module.main()
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        stdout.flush()
+        # Detach so dropping the wrapper doesn't close the BytesIO
+        stdout.detach()
+    finally:
+        sys.stdin, sys.stdout = saved_stdin, saved_stdout
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+    return {
+        "stdout": stdout_bytes.getvalue().decode("utf-8", errors="replace"),
+        "stderr": stderr_text.getvalue(),
+        "exit_code": exit_code,
+    }
+
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        (length,) = struct.unpack(">I", await reader.readexactly(4))
+        request = loads(await reader.readexactly(length))
+        # Runs synchronously on purpose: calls chdir and swap process-wide
+        # state, so they must not overlap
+        try:
+            response = run_tool(request)
+        except Exception as e:
+            response = {"stdout": "", "stderr": f"Tools daemon error: {e}\n", "exit_code": 1}
+        data = dumps(response).encode("utf-8")
+        writer.write(struct.pack(">I", len(data)) + data)
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(socket_path: str):
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    os.chmod(socket_path, 0o600)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    socket_path = os.environ.get("TOOLS_DAEMON_SOCKET", DEFAULT_SOCKET)
+    # Exit through the finally below on SIGTERM so the socket is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(serve(socket_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,12 +25,13 @@ It will NOT modify README.md (the system prompt) - that is protected.
 """
 
 import sys
-import json
 import os
 import re
 import shutil
 from datetime import datetime
 
+from _json_fast import JSONDecodeError, loads, print_json
+
 
 def validate_name(name: str) -> tuple[bool, str]:
     """Validate directive name (alphanumeric + underscore only)."""
@@ -78,20 +79,17 @@ def cleanup_old_backups(name: str, keep_count: int = 3):
 
     # Find all backups for this directive
     pattern = re.compile(rf'^{re.escape(name)}_\d{{8}}_\d{{6}}\.md$')
-    backups = []
-
-    for filename in os.listdir(backup_dir):
-        if pattern.match(filename):
-            filepath = os.path.join(backup_dir, filename)
-            backups.append((filepath, os.path.getmtime(filepath)))
+    with os.scandir(backup_dir) as entries:
+        backups = [entry.name for entry in entries if pattern.match(entry.name)]
 
-    # Sort by modification time (newest first)
-    backups.sort(key=lambda x: x[1], reverse=True)
+    # The timestamp in the name sorts chronologically, so no stat is needed
+    # (copy2 keeps the directive's mtime, so mtime is not the backup time anyway)
+    backups.sort(reverse=True)
 
     # Delete old backups
-    for filepath, _ in backups[keep_count:]:
+    for filename in backups[keep_count:]:
         try:
-            os.remove(filepath)
+            os.remove(os.path.join(backup_dir, filename))
         except Exception:
             pass  # Ignore cleanup errors
 
@@ -99,15 +97,15 @@ def cleanup_old_backups(name: str, keep_count: int = 3):
 def main():
     # Read JSON input from stdin
     try:
-        input_data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError as e:
-        print(json.dumps({
+        input_data = loads(sys.stdin.buffer.read())
+    except JSONDecodeError as e:
+        print_json({
             "success": False,
             "message": None,
             "path": None,
             "backup_path": None,
             "error": f"Invalid JSON input: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
     # Validate required fields
@@ -116,35 +114,35 @@ def main():
     should_backup = input_data.get("backup", True)
 
     if not name:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "path": None,
             "backup_path": None,
             "error": "Missing required field: name"
-        }))
+        })
         sys.exit(1)
 
     if not content:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "path": None,
             "backup_path": None,
             "error": "Missing required field: content"
-        }))
+        })
         sys.exit(1)
 
     # Validate name format
     valid, error_msg = validate_name(name)
     if not valid:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "path": None,
             "backup_path": None,
             "error": error_msg
-        }))
+        })
         sys.exit(1)
 
     # Build file path
@@ -152,13 +150,13 @@ def main():
 
     # Check if file exists
     if not os.path.exists(directive_path):
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "path": directive_path,
             "backup_path": None,
             "error": f"Directive '{name}' does not exist. Use create_directive to create it."
-        }))
+        })
         sys.exit(1)
 
     # Create backup if requested
@@ -167,13 +165,13 @@ def main():
         try:
             backup_path = create_backup(directive_path, name)
         except Exception as e:
-            print(json.dumps({
+            print_json({
                 "success": False,
                 "message": None,
                 "path": directive_path,
                 "backup_path": None,
                 "error": f"Failed to create backup: {str(e)}"
-            }))
+            })
             sys.exit(1)
 
     # Write the updated directive
@@ -181,22 +179,22 @@ def main():
         with open(directive_path, "w", encoding="utf-8") as f:
             f.write(content)
 
-        print(json.dumps({
+        print_json({
             "success": True,
             "message": f"Directive '{name}' updated successfully",
             "path": directive_path,
             "backup_path": backup_path,
             "error": None
-        }))
+        })
 
     except Exception as e:
-        print(json.dumps({
+        print_json({
             "success": False,
             "message": None,
             "path": directive_path,
             "backup_path": backup_path,
             "error": f"Failed to write directive: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
 
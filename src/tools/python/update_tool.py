@@ -124,20 +124,17 @@ def cleanup_old_backups(name: str, keep_count: int = 3):
 
     # Find all backups for this tool
     pattern = re.compile(rf'^{re.escape(name)}_\d{{8}}_\d{{6}}\.py$')
-    backups = []
+    with os.scandir(backup_dir) as entries:
+        backups = [entry.name for entry in entries if pattern.match(entry.name)]
 
-    for filename in os.listdir(backup_dir):
-        if pattern.match(filename):
-            filepath = os.path.join(backup_dir, filename)
-            backups.append((filepath, os.path.getmtime(filepath)))
-
-    # Sort by modification time (newest first)
-    backups.sort(key=lambda x: x[1], reverse=True)
+    # The timestamp in the name sorts chronologically, so no stat is needed
+    # (copy2 keeps the tool's mtime, so mtime is not the backup time anyway)
+    backups.sort(reverse=True)
 
     # Delete old backups
-    for filepath, _ in backups[keep_count:]:
+    for filename in backups[keep_count:]:
         try:
-            os.remove(filepath)
+            os.remove(os.path.join(backup_dir, filename))
         except Exception:
             pass  # Ignore cleanup errors
 
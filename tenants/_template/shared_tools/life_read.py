@@ -6,7 +6,8 @@ Input JSON:
 {
     "file": "identity|boundaries|patterns|contacts|business|procedures|people|questions",
     "query": "optional search term",
-    "path": "optional.dot.path.to.field"
+    "path": "optional.dot.path.to.field",
+    "max_results": "optional cap on search matches (non-negative integer)"
 }
 
 Output JSON:
@@ -27,6 +28,8 @@ Frontmatter format:
 import sys
 import json
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -112,48 +115,73 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     return {}, content
 
 
+@lru_cache(maxsize=256)
+def compile_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """
+    Split a dot path once into (key, index) segments.
+
+    index is the integer form of the segment (or None), so list lookups
+    don't need int()/exception handling on every traversal.
+    """
+    segments = []
+    for key in path.split("."):
+        try:
+            index = int(key)
+        except ValueError:
+            index = None
+        segments.append((key, index))
+    return tuple(segments)
+
+
 def get_nested_value(data: dict, path: str):
     """Get a value from nested dict using dot notation path."""
     if not path:
         return data
 
-    keys = path.split(".")
     current = data
 
-    for key in keys:
-        if isinstance(current, dict) and key in current:
+    for key, index in compile_path(path):
+        if isinstance(current, dict):
+            if key not in current:
+                return None
             current = current[key]
         elif isinstance(current, list):
-            try:
-                index = int(key)
-                current = current[index]
-            except (ValueError, IndexError):
+            if index is None or not -len(current) <= index < len(current):
                 return None
+            current = current[index]
         else:
             return None
 
     return current
 
 
-def search_content(data: dict, markdown: str, query: str) -> list[dict]:
+def search_content(data: dict, markdown: str, query: str, max_results: int | None = None) -> list[dict]:
     """
-    Search for query in both structured data and markdown.
-    Returns list of matches with context.
+    Search for query (case-insensitive) in both structured data and markdown.
+    Returns list of matches with context, stopping once max_results is reached.
     """
     results = []
-    query_lower = query.lower()
-
-    # Search in structured data
-    def search_dict(obj, path=""):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}" if path else key
-                search_dict(value, new_path)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]"
-                search_dict(item, new_path)
-        elif isinstance(obj, str) and query_lower in obj.lower():
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+
+    def full() -> bool:
+        return max_results is not None and len(results) >= max_results
+
+    # Search in structured data (explicit stack, children pushed in reverse
+    # so matches come out in document order)
+    stack = [(data, "")]
+    while stack and not full():
+        obj, path = stack.pop()
+        obj_type = type(obj)
+        if obj_type is dict:
+            stack.extend(
+                (value, f"{path}.{key}" if path else key)
+                for key, value in reversed(obj.items())
+            )
+        elif obj_type is list:
+            stack.extend(
+                (obj[i], f"{path}[{i}]") for i in range(len(obj) - 1, -1, -1)
+            )
+        elif obj_type is str and pattern.search(obj):
             results.append({
                 "type": "data",
                 "path": path,
@@ -161,97 +189,109 @@ def search_content(data: dict, markdown: str, query: str) -> list[dict]:
                 "match": query
             })
 
-    search_dict(data)
-
-    # Search in markdown
-    lines = markdown.split("\n")
-    for i, line in enumerate(lines):
-        if query_lower in line.lower():
-            results.append({
-                "type": "markdown",
-                "line": i + 1,
-                "content": line.strip(),
-                "match": query
-            })
+    # Search in markdown: scan the whole text once, one result per matching line
+    line_starts = [0] + [m.end() for m in re.finditer("\n", markdown)]
+    pos = 0
+    while not full():
+        match = pattern.search(markdown, pos)
+        if not match:
+            break
+        line_index = bisect_right(line_starts, match.start()) - 1
+        line_end = markdown.find("\n", match.start())
+        if line_end == -1:
+            line_end = len(markdown)
+        results.append({
+            "type": "markdown",
+            "line": line_index + 1,
+            "content": markdown[line_starts[line_index]:line_end].strip(),
+            "match": query
+        })
+        pos = line_end + 1
 
     return results
 
 
-def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
+def run(input_data: dict) -> dict:
+    """Handle a life_read request and return the result dict. Raises on error."""
+    file_name = input_data.get("file")
+    query = input_data.get("query")
+    path = input_data.get("path")
+    max_results = input_data.get("max_results")
 
-        file_name = input_data.get("file")
-        query = input_data.get("query")
-        path = input_data.get("path")
-
-        if not file_name:
-            raise ValueError("Missing required field: file")
-
-        file_path = get_life_file_path(file_name)
-
-        # Check if file exists
-        if not file_path.exists():
-            # Return default empty data for this file type
-            default_data = get_default_data(file_name)
-            result = {
-                "status": "success",
-                "data": default_data,
-                "markdown": "",
-                "file_path": str(file_path),
-                "exists": False
-            }
-            print(json.dumps(result))
-            return
-
-        # Read and parse file
-        content = file_path.read_text(encoding="utf-8")
-        data, markdown = parse_frontmatter(content)
-
-        # If no structured data found, use defaults
-        if not data:
-            data = get_default_data(file_name)
-
-        # Handle path query (get specific field)
-        if path:
-            value = get_nested_value(data, path)
-            result = {
-                "status": "success",
-                "data": value,
-                "path": path,
-                "file_path": str(file_path),
-                "exists": True
-            }
-            print(json.dumps(result))
-            return
-
-        # Handle search query
-        if query:
-            matches = search_content(data, markdown, query)
-            result = {
-                "status": "success",
-                "data": data,
-                "markdown": markdown,
-                "file_path": str(file_path),
-                "exists": True,
-                "search": {
-                    "query": query,
-                    "matches": matches,
-                    "total": len(matches)
-                }
-            }
-            print(json.dumps(result))
-            return
+    if not file_name:
+        raise ValueError("Missing required field: file")
 
-        # Default: return full content
-        result = {
+    if max_results is not None:
+        try:
+            max_results = int(max_results)
+        except (TypeError, ValueError):
+            max_results = -1
+        if max_results < 0:
+            raise ValueError("max_results must be a non-negative integer")
+
+    file_path = get_life_file_path(file_name)
+
+    # Check if file exists
+    if not file_path.exists():
+        # Return default empty data for this file type
+        default_data = get_default_data(file_name)
+        return {
+            "status": "success",
+            "data": default_data,
+            "markdown": "",
+            "file_path": str(file_path),
+            "exists": False
+        }
+
+    # Read and parse file
+    content = file_path.read_text(encoding="utf-8")
+    data, markdown = parse_frontmatter(content)
+
+    # If no structured data found, use defaults
+    if not data:
+        data = get_default_data(file_name)
+
+    # Handle path query (get specific field)
+    if path:
+        value = get_nested_value(data, path)
+        return {
+            "status": "success",
+            "data": value,
+            "path": path,
+            "file_path": str(file_path),
+            "exists": True
+        }
+
+    # Handle search query
+    if query:
+        matches = search_content(data, markdown, query, max_results)
+        return {
             "status": "success",
             "data": data,
             "markdown": markdown,
             "file_path": str(file_path),
-            "exists": True
+            "exists": True,
+            "search": {
+                "query": query,
+                "matches": matches,
+                "total": len(matches)
+            }
         }
-        print(json.dumps(result))
+
+    # Default: return full content
+    return {
+        "status": "success",
+        "data": data,
+        "markdown": markdown,
+        "file_path": str(file_path),
+        "exists": True
+    }
+
+
+def main():
+    try:
+        input_data = json.loads(sys.stdin.read())
+        print(json.dumps(run(input_data)))
 
     except Exception as e:
         error_result = {
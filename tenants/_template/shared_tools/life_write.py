@@ -8,7 +8,8 @@ Input JSON:
     "operation": "set|merge|append|remove",
     "path": "optional.dot.path.to.field",
     "value": <value to set/merge/append>,
-    "markdown": "optional markdown to append"
+    "markdown": "optional markdown to append",
+    "validate": false  # optional: check data against the schema and report errors
 }
 
 Operations:
@@ -30,6 +31,7 @@ import sys
 import json
 import re
 import copy
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -112,6 +114,12 @@ def serialize_frontmatter(data: dict, markdown: str) -> str:
     return f"---json\n{json_str}\n---\n{markdown}"
 
 
+@lru_cache(maxsize=256)
+def compile_path(path: str) -> tuple[str, ...]:
+    """Split a dot path into its keys once; repeated paths reuse the tuple."""
+    return tuple(path.split("."))
+
+
 def set_nested_value(data: dict, path: str, value) -> dict:
     """Set a value in nested dict using dot notation path."""
     if not path:
@@ -120,7 +128,7 @@ def set_nested_value(data: dict, path: str, value) -> dict:
         raise ValueError("Cannot set non-dict value without path")
 
     result = copy.deepcopy(data)
-    keys = path.split(".")
+    keys = compile_path(path)
     current = result
 
     for key in keys[:-1]:
@@ -148,7 +156,7 @@ def deep_merge(base: dict, update: dict) -> dict:
 def append_to_array(data: dict, path: str, value) -> dict:
     """Append value to array at path."""
     result = copy.deepcopy(data)
-    keys = path.split(".")
+    keys = compile_path(path)
     current = result
 
     for key in keys[:-1]:
@@ -178,7 +186,7 @@ def append_to_array(data: dict, path: str, value) -> dict:
 def remove_from_array(data: dict, path: str, value) -> dict:
     """Remove item from array at path. Value can be index (int) or item to match."""
     result = copy.deepcopy(data)
-    keys = path.split(".")
+    keys = compile_path(path)
     current = result
 
     for key in keys[:-1]:
@@ -215,116 +223,125 @@ def generate_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
-def main():
-    try:
-        input_data = json.loads(sys.stdin.read())
-
-        file_name = input_data.get("file")
-        operation = input_data.get("operation", "merge")
-        path = input_data.get("path")
-        value = input_data.get("value")
-        markdown_append = input_data.get("markdown")
+def run(input_data: dict) -> dict:
+    """Apply a life_write request and return the result dict. Raises on error."""
+    file_name = input_data.get("file")
+    operation = input_data.get("operation", "merge")
+    path = input_data.get("path")
+    value = input_data.get("value")
+    markdown_append = input_data.get("markdown")
+    validate = input_data.get("validate", False)
 
-        if not file_name:
-            raise ValueError("Missing required field: file")
+    if not file_name:
+        raise ValueError("Missing required field: file")
 
-        if operation not in ["set", "merge", "append", "remove"]:
-            raise ValueError(f"Invalid operation: {operation}. Must be set, merge, append, or remove")
+    if operation not in ["set", "merge", "append", "remove"]:
+        raise ValueError(f"Invalid operation: {operation}. Must be set, merge, append, or remove")
 
-        file_path = get_life_file_path(file_name)
+    file_path = get_life_file_path(file_name)
 
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    # Ensure parent directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read existing content or create default
-        if file_path.exists():
-            content = file_path.read_text(encoding="utf-8")
-            data, markdown = parse_frontmatter(content)
-            if not data:
-                data = get_default_data(file_name)
-        else:
+    # Read existing content or create default
+    if file_path.exists():
+        content = file_path.read_text(encoding="utf-8")
+        data, markdown = parse_frontmatter(content)
+        if not data:
             data = get_default_data(file_name)
-            markdown = ""
+    else:
+        data = get_default_data(file_name)
+        markdown = ""
+
+    # Apply operation
+    if operation == "set":
+        if path:
+            data = set_nested_value(data, path, value)
+        elif isinstance(value, dict):
+            # Preserve version
+            value["version"] = data.get("version", SCHEMA_VERSION)
+            data = value
+        else:
+            raise ValueError("set operation requires dict value when no path specified")
 
-        # Apply operation
-        if operation == "set":
+    elif operation == "merge":
+        if value and isinstance(value, dict):
             if path:
-                data = set_nested_value(data, path, value)
-            elif isinstance(value, dict):
-                # Preserve version
-                value["version"] = data.get("version", SCHEMA_VERSION)
-                data = value
-            else:
-                raise ValueError("set operation requires dict value when no path specified")
-
-        elif operation == "merge":
-            if value and isinstance(value, dict):
-                if path:
-                    # Get existing value at path
-                    keys = path.split(".")
-                    current = data
-                    for key in keys:
-                        if isinstance(current, dict) and key in current:
-                            current = current[key]
-                        else:
-                            current = {}
-                            break
-
-                    if isinstance(current, dict):
-                        merged = deep_merge(current, value)
-                        data = set_nested_value(data, path, merged)
+                # Get existing value at path
+                keys = compile_path(path)
+                current = data
+                for key in keys:
+                    if isinstance(current, dict) and key in current:
+                        current = current[key]
                     else:
-                        data = set_nested_value(data, path, value)
+                        current = {}
+                        break
+
+                if isinstance(current, dict):
+                    merged = deep_merge(current, value)
+                    data = set_nested_value(data, path, merged)
                 else:
-                    data = deep_merge(data, value)
+                    data = set_nested_value(data, path, value)
+            else:
+                data = deep_merge(data, value)
 
-        elif operation == "append":
-            if not path:
-                raise ValueError("append operation requires path to array")
-            if value is None:
-                raise ValueError("append operation requires value")
+    elif operation == "append":
+        if not path:
+            raise ValueError("append operation requires path to array")
+        if value is None:
+            raise ValueError("append operation requires value")
 
-            # Auto-generate ID if value is dict without id
-            if isinstance(value, dict) and "id" not in value:
-                value["id"] = generate_id()
+        # Auto-generate ID if value is dict without id
+        if isinstance(value, dict) and "id" not in value:
+            value["id"] = generate_id()
 
-            data = append_to_array(data, path, value)
+        data = append_to_array(data, path, value)
 
-        elif operation == "remove":
-            if not path:
-                raise ValueError("remove operation requires path to array")
-            if value is None:
-                raise ValueError("remove operation requires value (item or index)")
+    elif operation == "remove":
+        if not path:
+            raise ValueError("remove operation requires path to array")
+        if value is None:
+            raise ValueError("remove operation requires value (item or index)")
 
-            data = remove_from_array(data, path, value)
+        data = remove_from_array(data, path, value)
 
-        # Update lastUpdated timestamp
-        data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
+    # Update lastUpdated timestamp
+    data["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
 
-        # Append markdown if provided
-        if markdown_append:
-            if markdown and not markdown.endswith("\n"):
-                markdown += "\n"
-            markdown += f"\n{markdown_append}\n"
+    # Append markdown if provided
+    if markdown_append:
+        if markdown and not markdown.endswith("\n"):
+            markdown += "\n"
+        markdown += f"\n{markdown_append}\n"
 
-        # Validate data
+    # Validation is opt-in: it never blocks the write, so only pay for it
+    # when the caller wants the errors reported back
+    validation_errors = None
+    if validate:
         is_valid, errors = validate_data(file_name, data)
         if not is_valid:
-            # Log warning but don't fail - be permissive
-            pass
-
-        # Write back to file
-        output = serialize_frontmatter(data, markdown)
-        file_path.write_text(output, encoding="utf-8")
-
-        result = {
-            "status": "success",
-            "file_path": str(file_path),
-            "message": f"Updated {file_name} successfully",
-            "operation": operation,
-            "data": data
-        }
-        print(json.dumps(result))
+            validation_errors = errors
+
+    # Write back to file
+    output = serialize_frontmatter(data, markdown)
+    file_path.write_text(output, encoding="utf-8")
+
+    result = {
+        "status": "success",
+        "file_path": str(file_path),
+        "message": f"Updated {file_name} successfully",
+        "operation": operation,
+        "data": data
+    }
+    if validation_errors:
+        result["validation_errors"] = validation_errors
+    return result
+
+
+def main():
+    try:
+        input_data = json.loads(sys.stdin.read())
+        print(json.dumps(run(input_data)))
 
     except Exception as e:
         error_result = {